@@ -7,6 +7,7 @@ from flask_bcrypt import Bcrypt
 from flask_migrate import Migrate
 from flask_cors import CORS
 from api.helpers.limiter import limiter
+from api.helpers.security_helper import admin_required
 
 # Load .env for local development (no-op in Docker/Railway)
 load_dotenv()
@@ -15,6 +16,7 @@ load_dotenv()
 print("=" * 50)
 print("ENVIRONMENT VARIABLE STATUS:")
 print(f"  DATABASE_URL: {'SET' if os.getenv('DATABASE_URL') else 'MISSING'}")
+print(f"  DATABASE_REPLICA_URL: {'SET' if os.getenv('DATABASE_REPLICA_URL') else 'not set (reads use primary)'}")
 print(f"  SECRET_KEY: {'SET' if os.getenv('SECRET_KEY') else 'MISSING'}")
 print("=" * 50)
 
@@ -35,8 +37,8 @@ CORS(app, resources={
     r"/*": {
         "origins": "*",
         "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"],
-        "expose_headers": ["Content-Type", "Authorization"],
+        "allow_headers": ["Content-Type", "Authorization", "Idempotency-Key"],
+        "expose_headers": ["Content-Type", "Authorization", "Server-Timing"],
         "supports_credentials": False
     }
 })
@@ -47,19 +49,26 @@ api = Api(
     title="Crowdfunding platform",
     description="Api for crowdfunding platform",
     authorizations=authorizations,
-    security='bearer authorizations' 
+    security='bearer authorizations'
 )
 
+from api.helpers.json_helper import register_json_encoder
+register_json_encoder(api)
+
 # Get DATABASE_URL from environment (Railway standard)
 db_uri = os.getenv('DATABASE_URL')
 secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
 
 # Fix for SQLAlchemy compatibility: postgres:// -> postgresql+psycopg2://
+def normalize_db_uri(uri):
+    if uri.startswith('postgres://'):
+        return uri.replace('postgres://', 'postgresql+psycopg2://', 1)
+    if uri.startswith('postgresql://') and 'psycopg2' not in uri:
+        return uri.replace('postgresql://', 'postgresql+psycopg2://', 1)
+    return uri
+
 if db_uri:
-    if db_uri.startswith('postgres://'):
-        db_uri = db_uri.replace('postgres://', 'postgresql+psycopg2://', 1)
-    elif db_uri.startswith('postgresql://') and 'psycopg2' not in db_uri:
-        db_uri = db_uri.replace('postgresql://', 'postgresql+psycopg2://', 1)
+    db_uri = normalize_db_uri(db_uri)
 
 if not db_uri:
     print("WARNING: DATABASE_URL not set. Using fallback for local development.")
@@ -69,26 +78,45 @@ app.config['SQLALCHEMY_DATABASE_URI'] = db_uri
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = secret_key
 
-# Connection pooling for production
-app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-    'pool_size': 5,
-    'pool_recycle': 300,
-    'pool_pre_ping': True
-}
+# Connection pooling for production; sized from DB_POOL_* / GUNICORN_THREADS (see pool_helper)
+from api.helpers.pool_helper import engine_options, check_pool_size, pool_stats
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options()
+check_pool_size()
+
+# bcrypt cost; raising it re-hashes existing passwords as users log in
+app.config['BCRYPT_LOG_ROUNDS'] = int(os.getenv('BCRYPT_LOG_ROUNDS', '12'))
 
-db = SQLAlchemy(app)
+# Optional read replica: read-only GET handlers query it, everything else the primary
+from api.helpers.replica_helper import DATABASE_REPLICA_URL, REPLICA_BIND, RoutingSession, init_replica_routing, primary_db
+
+session_options = {}
+if DATABASE_REPLICA_URL:
+    app.config['SQLALCHEMY_BINDS'] = {REPLICA_BIND: normalize_db_uri(DATABASE_REPLICA_URL)}
+    session_options['class_'] = RoutingSession
+    init_replica_routing(app)
+
+db = SQLAlchemy(app, session_options=session_options)
 bcrypt = Bcrypt(app)
 migrate = Migrate(app, db)
 
+# per-request statement counts, N+1 warnings and the Server-Timing header
+from api.helpers.sql_accounting_helper import init_sql_accounting
+init_sql_accounting(app)
+
 # Health endpoint that checks database connection
 @app.route('/health')
+@primary_db
 def health_check():
     try:
         # Test database connection
         db.session.execute(db.text('SELECT 1'))
+        from api.helpers.password_helper import hashing_stats
+        from email_service.template_engine import engine
         return jsonify({
             'status': 'healthy',
-            'database': 'connected'
+            'database': 'connected',
+            'password_hashing': hashing_stats(),
+            'email_templates': engine.render_stats()
         }), 200
     except Exception as e:
         return jsonify({
@@ -97,6 +125,12 @@ def health_check():
             'error': str(e)
         }), 500
 
+# Connection pool occupancy, checkout waits and timeouts for this worker process
+@app.route('/internal/pool-stats')
+@admin_required
+def pool_stats_check():
+    return jsonify(pool_stats(db.engines)), 200
+
 users_ns = Namespace('Users', description='Data about the users')
 campaigns_ns = Namespace('Campaigns', description="Data about the campaigns")
 donations_ns = Namespace('Donations', description='Data about the donations')
@@ -136,4 +170,23 @@ import api.routes.donationsRoutes
 import api.routes.creatorDashboardRoutes
 import api.routes.payments
 import api.routes.follows
-import api.routes.admin_reviews  
\ No newline at end of file
+import api.routes.admin_reviews  
+import api.commands
+
+from api.helpers.admin_stats_helper import start_stats_scheduler
+start_stats_scheduler()
+
+from api.helpers.raised_amount_helper import start_shard_folder
+start_shard_folder()
+
+from api.helpers.idempotency_helper import start_idempotency_purger
+start_idempotency_purger()
+
+from api.helpers.like_helper import start_like_workers
+start_like_workers()
+
+from api.helpers.outbox_helper import start_outbox_worker
+start_outbox_worker()
+
+from api.helpers.fanout_helper import start_fanout_sweeper
+start_fanout_sweeper()
@@ -0,0 +1,83 @@
+import click
+from api import app
+
+
+@app.cli.command("reconcile-stats")
+@click.option("--campaign-id", type=int, default=None, help="Only reconcile this campaign.")
+def reconcile_stats_command(campaign_id):
+    """Recompute campaign_stats counters from donations, comments and follows."""
+    from api.helpers.campaign_stats_helper import reconcile_campaign_stats
+
+    rows = reconcile_campaign_stats(campaign_id)
+    print(f"✅ Reconciled counters for {rows} campaign(s)")
+
+
+@app.cli.command("create-stats-view")
+def create_stats_view_command():
+    """Create the materialized view behind the admin and home page stats."""
+    from api.helpers.admin_stats_helper import create_stats_view, refresh_stats_view
+
+    create_stats_view()
+    refresh_stats_view()
+    print("✅ Stats view created and refreshed")
+
+
+@app.cli.command("refresh-stats")
+def refresh_stats_command():
+    """Refresh the stats materialized view now."""
+    from api.helpers.admin_stats_helper import refresh_stats_view
+
+    if refresh_stats_view():
+        print("✅ Stats view refreshed")
+    else:
+        print("Another worker is refreshing the stats view; skipped")
+
+
+@app.cli.command("shard-raised")
+@click.argument("campaign_id", type=int)
+@click.option("--off", is_flag=True, help="Fold the shards back into raised_amount and remove them.")
+def shard_raised_command(campaign_id, off):
+    """Turn sharded raised_amount counting on or off for a hot campaign."""
+    from api.helpers.raised_amount_helper import enable_sharding, disable_sharding, RAISED_AMOUNT_SHARDS
+
+    if off:
+        disable_sharding(campaign_id)
+        print(f"✅ Campaign {campaign_id} is no longer sharded")
+    else:
+        enable_sharding(campaign_id)
+        print(f"✅ Campaign {campaign_id} now counts donations across {RAISED_AMOUNT_SHARDS} shards")
+
+
+@app.cli.command("fold-raised-shards")
+def fold_raised_shards_command():
+    """Fold sharded raised_amount totals into campaigns now."""
+    from api.helpers.raised_amount_helper import fold_raised_shards
+
+    print(f"✅ Folded shards for {fold_raised_shards()} campaign(s)")
+
+
+@app.cli.command("reconcile-likes")
+def reconcile_likes_command():
+    """Flush buffered like deltas and recount comment likes from user_comment_likes."""
+    from api.helpers.like_helper import reconcile_comment_likes
+
+    print(f"✅ Corrected like counts for {reconcile_comment_likes()} comment(s)")
+
+
+@app.cli.command("drain-outbox")
+def drain_outbox_command():
+    """Send every due email in the outbox now."""
+    from api.helpers.outbox_helper import drain_all, outbox_counts
+
+    sent, failed = drain_all()
+    print(f"✅ Sent {sent} email(s), {failed} failed; outbox now {outbox_counts()}")
+
+
+@app.cli.command("fan-out-update")
+@click.argument("update_id", type=int)
+def fan_out_update_command(update_id):
+    """Queue follower emails for a campaign update now (resumes a partial fan-out)."""
+    from api.helpers.fanout_helper import fan_out_update
+
+    queued = fan_out_update(update_id)
+    print(f"✅ Queued {queued} follower email(s) for update {update_id}")
@@ -0,0 +1,151 @@
+from datetime import datetime
+from decimal import Decimal
+from api import db
+from api.models.cf_models import Users, UserRole, Campaigns, Donations
+from api.helpers.pagination_helper import apply_keyset, split_page
+from sqlalchemy import func, literal
+
+
+# sort option -> (subquery column name, cursor value converter)
+CREATOR_SORTS = {
+    "total_raised": ("total_raised", Decimal),
+    "campaigns": ("campaign_count", int),
+    "join_date": ("created_at", datetime.fromisoformat),
+}
+
+DONOR_SORTS = {
+    "total_donated": ("total_donated", Decimal),
+    "campaigns": ("campaigns_supported", int),
+    "donations": ("donation_count", int),
+    "last_donation": ("last_donation_sort", datetime.fromisoformat),
+    "join_date": ("created_at", datetime.fromisoformat),
+}
+
+# donors who never donated sort as if their last donation were at the epoch,
+# keeping the keyset comparison free of NULLs
+NEVER_DONATED = datetime(1970, 1, 1)
+
+
+def parse_order(order):
+    """Return True for descending order; accepts 'asc' / 'desc' (default desc).
+    Raises ValueError for anything else.
+    """
+    order = (order or "desc").lower()
+    if order not in ("asc", "desc"):
+        raise ValueError(f"Invalid order '{order}'")
+    return order == "desc"
+
+
+def get_creator_report(sort="total_raised", order="desc", limit=10, cursor=None):
+    """Return one page of creators with campaign count and total raised.
+    All aggregates come from a single LEFT JOIN ... GROUP BY query, keyset-paginated
+    over (sort value, user_id). Returns (rows, next_cursor).
+    """
+    if sort not in CREATOR_SORTS:
+        raise ValueError(f"Invalid sort '{sort}'. Must be one of: {list(CREATOR_SORTS)}")
+    column_name, converter = CREATOR_SORTS[sort]
+    descending = parse_order(order)
+
+    stats = (
+        db.session.query(
+            Users.user_id,
+            Users.username,
+            Users.email,
+            Users.profile_image,
+            Users.created_at,
+            func.count(Campaigns.campaign_id).label("campaign_count"),
+            func.coalesce(func.sum(Campaigns.raised_total), 0).label("total_raised"),
+        )
+        .outerjoin(Campaigns, Campaigns.creator_id == Users.user_id)
+        .filter(Users.role == UserRole.creator)
+        .group_by(Users.user_id)
+        .subquery()
+    )
+
+    query = apply_keyset(
+        db.session.query(stats),
+        stats.c[column_name],
+        stats.c.user_id,
+        cursor,
+        converter,
+        descending=descending,
+    )
+    rows = query.limit(limit + 1).all()
+    return split_page(rows, limit, lambda r: (getattr(r, column_name), r.user_id))
+
+
+def creator_report_row_to_dict(row):
+    """Serialize a creator report row in the shape the admin dashboard expects.
+    """
+    return {
+        "creator_id": row.user_id,
+        "name": row.username,
+        "email": row.email,
+        "profile_image": row.profile_image,
+        "campaigns": row.campaign_count,
+        "total_raised": float(row.total_raised or 0),
+        "join_date": row.created_at.strftime("%b %d, %Y") if row.created_at else None,
+    }
+
+
+def get_donor_report(sort="total_donated", order="desc", limit=10, cursor=None, min_total=None):
+    """Return one page of donors with total donated, campaigns supported, donation count
+    and last donation date, all from a single LEFT JOIN ... GROUP BY query.
+    min_total keeps only donors whose total donated is at least that amount.
+    Keyset-paginated over (sort value, user_id); returns (rows, next_cursor).
+    """
+    if sort not in DONOR_SORTS:
+        raise ValueError(f"Invalid sort '{sort}'. Must be one of: {list(DONOR_SORTS)}")
+    column_name, converter = DONOR_SORTS[sort]
+    descending = parse_order(order)
+
+    last_donation = func.max(Donations.created_at)
+    stats = (
+        db.session.query(
+            Users.user_id,
+            Users.username,
+            Users.email,
+            Users.profile_image,
+            Users.created_at,
+            func.coalesce(func.sum(Donations.amount), 0).label("total_donated"),
+            func.count(func.distinct(Donations.campaign_id)).label("campaigns_supported"),
+            func.count(Donations.donation_id).label("donation_count"),
+            last_donation.label("last_donation_at"),
+            func.coalesce(last_donation, literal(NEVER_DONATED)).label("last_donation_sort"),
+        )
+        .outerjoin(Donations, Donations.user_id == Users.user_id)
+        .filter(Users.role == UserRole.donor)
+        .group_by(Users.user_id)
+        .subquery()
+    )
+
+    query = db.session.query(stats)
+    if min_total is not None:
+        query = query.filter(stats.c.total_donated >= min_total)
+
+    query = apply_keyset(
+        query,
+        stats.c[column_name],
+        stats.c.user_id,
+        cursor,
+        converter,
+        descending=descending,
+    )
+    rows = query.limit(limit + 1).all()
+    return split_page(rows, limit, lambda r: (getattr(r, column_name), r.user_id))
+
+
+def donor_report_row_to_dict(row):
+    """Serialize a donor report row in the shape the admin dashboard expects.
+    """
+    return {
+        "user_id": row.user_id,
+        "name": row.username,
+        "email": row.email,
+        "profile_image": row.profile_image,
+        "total_donations": float(row.total_donated or 0),
+        "campaigns_supported": row.campaigns_supported,
+        "donation_count": row.donation_count,
+        "last_donation": row.last_donation_at.isoformat() if row.last_donation_at else None,
+        "join_date": row.created_at.strftime("%b %d, %Y") if row.created_at else None,
+    }
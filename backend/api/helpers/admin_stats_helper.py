@@ -0,0 +1,115 @@
+import os
+from datetime import datetime
+from api import db
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+
+STATS_VIEW = "platform_stats_mv"
+
+# seconds between refreshes; 0 disables the built-in scheduler
+STATS_REFRESH_INTERVAL = int(os.getenv("STATS_REFRESH_INTERVAL", "300"))
+
+# arbitrary key for pg_try_advisory_lock so only one worker refreshes at a time
+REFRESH_LOCK_ID = 872301
+
+STATS_SELECT = """
+    WITH campaign_counts AS (
+        SELECT
+            count(*) AS total_campaigns,
+            count(*) FILTER (WHERE status = 'active') AS active_campaigns,
+            count(*) FILTER (WHERE status = 'pending') AS pending_campaigns,
+            count(*) FILTER (WHERE status = 'completed') AS completed_campaigns
+        FROM campaigns
+    ),
+    user_counts AS (
+        SELECT
+            count(*) AS total_users,
+            count(*) FILTER (WHERE role = 'creator') AS total_creators,
+            count(*) FILTER (WHERE role = 'donor') AS total_donors
+        FROM users
+    ),
+    donation_totals AS (
+        SELECT
+            coalesce(sum(d.amount), 0) AS total_raised,
+            coalesce(sum(d.amount) FILTER (WHERE EXISTS (
+                SELECT 1 FROM payments p
+                WHERE p.donation_id = d.donation_id AND p.payment_status = 'successful'
+            )), 0) AS total_raised_successful
+        FROM donations d
+    ),
+    top_campaign AS (
+        SELECT c.title, coalesce(sum(d.amount), 0) AS raised
+        FROM campaigns c
+        LEFT JOIN donations d ON d.campaign_id = c.campaign_id
+        GROUP BY c.campaign_id, c.title
+        ORDER BY raised DESC
+        LIMIT 1
+    )
+    SELECT
+        1 AS id,
+        cc.*,
+        uc.*,
+        dt.*,
+        tc.title AS top_campaign_title,
+        coalesce(tc.raised, 0) AS top_campaign_raised,
+        (now() AT TIME ZONE 'utc') AS refreshed_at
+    FROM campaign_counts cc
+    CROSS JOIN user_counts uc
+    CROSS JOIN donation_totals dt
+    LEFT JOIN top_campaign tc ON true
+"""
+
+
+def create_stats_view():
+    """Create the stats materialized view and the unique index that
+    REFRESH ... CONCURRENTLY requires. Safe to run repeatedly.
+    """
+    with db.engine.begin() as conn:
+        conn.execute(text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {STATS_VIEW} AS {STATS_SELECT}"))
+        conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {STATS_VIEW}_id ON {STATS_VIEW} (id)"))
+
+
+def refresh_stats_view():
+    """Refresh the snapshot without blocking readers.
+    Returns False if another worker holds the refresh lock and this call was skipped.
+    """
+    with db.engine.connect() as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_lock(:id)"), {"id": REFRESH_LOCK_ID}).scalar():
+            return False
+        try:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATS_VIEW}"))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": REFRESH_LOCK_ID})
+            conn.commit()
+    return True
+
+
+def get_stats_snapshot():
+    """Return the latest stats row; its refreshed_at is the snapshot's as-of time.
+    Falls back to computing the same row live if the view has not been created yet.
+    """
+    try:
+        with db.session.begin_nested():
+            return db.session.execute(text(f"SELECT * FROM {STATS_VIEW}")).one()
+    except ProgrammingError:
+        print(f"{STATS_VIEW} is missing, run 'flask db upgrade'. Computing stats live.")
+        return db.session.execute(text(STATS_SELECT)).one()
+
+
+def format_as_of(snapshot):
+    """Return the snapshot's refresh time as an ISO string for the as_of field.
+    """
+    return (snapshot.refreshed_at or datetime.utcnow()).isoformat()
+
+
+def start_stats_scheduler():
+    """Refresh the stats view every STATS_REFRESH_INTERVAL seconds in the background.
+    """
+    from api.helpers.scheduler_helper import start_periodic
+
+    return start_periodic("refresh-stats", STATS_REFRESH_INTERVAL, refresh_stats_view)
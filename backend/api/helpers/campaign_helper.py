@@ -6,10 +6,27 @@ from api.models.cf_models import (
     CampaignStatus,
     CampaignUpdates,
 )
+from api.helpers.serializer_helper import CAMPAIGN_COLUMNS, serialize_campaign, serialize_rows
+from api.helpers import leaderboard_helper
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 
 
+def campaign_rows(*criteria, order_by=None):
+    """Fetch campaigns with their creator as column tuples and serialize them.
+    Same dict shape as Campaigns.to_dict() without loading each creator separately.
+    """
+    query = (
+        db.session.query(*CAMPAIGN_COLUMNS)
+        .select_from(Campaigns)
+        .join(Users, Users.user_id == Campaigns.creator_id)
+        .filter(*criteria)
+    )
+    if order_by is not None:
+        query = query.order_by(order_by)
+    return serialize_rows(serialize_campaign, query.all())
+
+
 def create_campaign(
     creator_id, title, description, goal_amount, image, category, raised_amount, start_date, end_date, status='pending'
 ):
@@ -85,8 +102,7 @@ def view_all_campaigns_by_creator(creator_id):
     """List all campaigns created by a specific user (creator_id).
     Returns a list of campaign dicts.
     """
-    campaigns = Campaigns.query.filter_by(creator_id=creator_id).all()
-    return [campaign.to_dict() for campaign in campaigns]
+    return campaign_rows(Campaigns.creator_id == creator_id)
 
 
 def update_campaign_status(campaign_id, new_status):
@@ -119,6 +135,7 @@ def update_campaign_status(campaign_id, new_status):
         db.session.rollback()
         raise RuntimeError(f"Failed to update campaign status: {str(e)}")
 
+    leaderboard_helper.sync_campaign_status(campaign_id, new_status)
     return campaign.to_dict()
 
 
@@ -190,11 +207,18 @@ def update_campaign(campaign_id, **kwargs):
 
 
 def search_campaign_by_title(title):
-    """Search campaigns by title substring and return matching dicts.
-    Case-insensitive.
+    """Search campaigns by title words and return matching dicts, best match first.
+    Uses the title-only part of the full-text index; see search_helper for full search.
     """
-    campaigns = Campaigns.query.filter(Campaigns.title.ilike(f"%{title}%")).all()
-    return [campaign.to_dict() for campaign in campaigns]
+    from api.helpers.search_helper import build_search_query
+
+    tsquery = build_search_query(title)
+    title_vector = db.func.to_tsvector("english", Campaigns.title)
+    return campaign_rows(
+        Campaigns.search_vector.op("@@")(tsquery),
+        title_vector.op("@@")(tsquery),
+        order_by=db.func.ts_rank(Campaigns.search_vector, tsquery).desc(),
+    )
 
 
 def view_campaigns_by_category(category):
@@ -207,31 +231,28 @@ def view_campaigns_by_category(category):
     except Exception as e:
         raise ValueError(f"Invalid category: {category}")
 
-    campaigns = Campaigns.query.filter_by(category=category).all()
-    return [campaign.to_dict() for campaign in campaigns]
+    return campaign_rows(Campaigns.category == category)
 
 
 def view_all_active_campaigns():
     """List all campaigns with ACTIVE status.
     Returns list of campaign dicts.
     """
-    campaigns = Campaigns.query.filter_by(status=CampaignStatus.active).all()
-    return [campaign.to_dict() for campaign in campaigns]
+    return campaign_rows(Campaigns.status == CampaignStatus.active)
 
 
 def view_all_campaigns():
     """Return all campaigns as a list of dicts.
     Useful for admin or listing pages.
     """
-    return [campaign.to_dict() for campaign in Campaigns.query.all()]
+    return campaign_rows()
 
 
 def view_all_completed_campaigns():
     """List campaigns that have reached COMPLETED status.
     Returns a list of campaign dicts.
     """
-    campaigns = Campaigns.query.filter_by(status=CampaignStatus.completed).all()
-    return [campaign.to_dict() for campaign in campaigns]
+    return campaign_rows(Campaigns.status == CampaignStatus.completed)
 
 
 def view_all_campaigns_paginated(page=1, per_page=10, category=None, status=None):
@@ -0,0 +1,106 @@
+from datetime import datetime
+from api import db
+from api.models.cf_models import CampaignStats, Campaigns, Comments, Donations, DonationStatus, Follows
+from sqlalchemy import func, select, literal_column
+from sqlalchemy.dialects.postgresql import insert
+
+
+COUNTERS = ("donor_count", "comment_count", "follower_count")
+
+
+def increment_counters(campaign_id, donors=0, comments=0, followers=0):
+    """Atomically add deltas to a campaign's counters, creating its row on first use.
+    Runs on the caller's session and does not commit, so the counter change lands in the
+    same transaction as the donation / comment / follow that caused it.
+    """
+    deltas = {"donor_count": donors, "comment_count": comments, "follower_count": followers}
+    deltas = {k: v for k, v in deltas.items() if v}
+    if not deltas:
+        return
+
+    table = CampaignStats.__table__
+    stmt = insert(table).values(
+        campaign_id=campaign_id,
+        updated_at=datetime.utcnow(),
+        **{k: max(v, 0) for k, v in deltas.items()},
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.campaign_id],
+        set_={
+            **{k: func.greatest(table.c[k] + v, 0) for k, v in deltas.items()},
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.session.execute(stmt)
+
+
+def is_new_donor(user_id, campaign_id, exclude_donation_id=None):
+    """Return True if the user has no completed donation to the campaign yet.
+    Call before the new donation is marked completed.
+    """
+    query = Donations.query.filter(
+        Donations.user_id == user_id,
+        Donations.campaign_id == campaign_id,
+        Donations.status == DonationStatus.completed,
+    )
+    if exclude_donation_id is not None:
+        query = query.filter(Donations.donation_id != exclude_donation_id)
+    return not db.session.query(query.exists()).scalar()
+
+
+def get_campaign_stats(campaign_id):
+    """Return the counters for one campaign as a dict (zeros if it has none yet).
+    """
+    stats = CampaignStats.query.get(campaign_id)
+    if not stats:
+        return {counter: 0 for counter in COUNTERS}
+    return stats.to_dict()
+
+
+def reconcile_campaign_stats(campaign_id=None):
+    """Recompute counters from the source tables and overwrite campaign_stats.
+    Repairs any drift from races or writes that bypassed the helpers. Limits the work
+    to one campaign when campaign_id is given. Commits and returns the number of rows written.
+    """
+    donors = (
+        select(func.count(func.distinct(Donations.user_id)))
+        .where(Donations.campaign_id == Campaigns.campaign_id, Donations.status == DonationStatus.completed)
+        .scalar_subquery()
+    )
+    comments = (
+        select(func.count(Comments.comment_id))
+        .where(Comments.campaign_id == Campaigns.campaign_id)
+        .scalar_subquery()
+    )
+    followers = (
+        select(func.count(Follows.follow_id))
+        .where(Follows.campaign_id == Campaigns.campaign_id)
+        .scalar_subquery()
+    )
+
+    source = select(
+        Campaigns.campaign_id,
+        donors,
+        comments,
+        followers,
+        literal_column("now() at time zone 'utc'"),
+    )
+    if campaign_id is not None:
+        source = source.where(Campaigns.campaign_id == campaign_id)
+
+    table = CampaignStats.__table__
+    stmt = insert(table).from_select(
+        ["campaign_id", "donor_count", "comment_count", "follower_count", "updated_at"], source
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.campaign_id],
+        set_={col: stmt.excluded[col] for col in (*COUNTERS, "updated_at")},
+    )
+
+    try:
+        result = db.session.execute(stmt)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(f"Could not reconcile campaign stats: {str(e)}")
+    return result.rowcount
@@ -1,6 +1,7 @@
 from sqlalchemy import func
 from api import db
-from api.models import Comments, Users, Campaigns
+from api.models.cf_models import Comments, Users, Campaigns
+from api.helpers import campaign_stats_helper
 
 
 def get_total_comments():
@@ -23,13 +24,9 @@ def get_total_comments_by_user(user_id):
 
 def get_total_comments_by_campaign(campaign_id):
     """Return the total number of comments for a campaign.
-    Returns an integer count.
+    Reads the campaign_stats counter instead of counting rows.
     """
-    return (
-        db.session.query(func.count(Comments.comment_id))
-        .filter_by(campaign_id=campaign_id)
-        .scalar()
-    )
+    return campaign_stats_helper.get_campaign_stats(campaign_id)["comment_count"]
 
 
 def get_top_commenters(limit=5):
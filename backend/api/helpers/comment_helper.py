@@ -1,9 +1,26 @@
 from api import db, bcrypt
 from api.models.cf_models import Comments, Users, Campaigns
+from api.helpers import campaign_stats_helper, like_helper
+from api.helpers.serializer_helper import COMMENT_COLUMNS, serialize_comment, serialize_rows
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 
 
+def comment_rows(*criteria):
+    """Fetch comments with their author and campaign as column tuples and serialize them.
+    Same dict shape as Comments.to_dict() without the two lazy loads per comment.
+    """
+    rows = (
+        db.session.query(*COMMENT_COLUMNS)
+        .select_from(Comments)
+        .join(Users, Users.user_id == Comments.user_id)
+        .join(Campaigns, Campaigns.campaign_id == Comments.campaign_id)
+        .filter(*criteria)
+        .all()
+    )
+    return serialize_rows(serialize_comment, rows)
+
+
 def create_comment(user_id, campaign_id, content):
     """Create a comment for a campaign and return it as a dict.
     Commits the new comment to the database.
@@ -11,6 +28,7 @@ def create_comment(user_id, campaign_id, content):
     comment = Comments(user_id=user_id, campaign_id=campaign_id, content=content)
     db.session.add(comment)
     try:
+        campaign_stats_helper.increment_counters(campaign_id, comments=1)
         db.session.commit()
         return comment.to_dict()
     except Exception as e:
@@ -28,6 +46,7 @@ def delete_comment(comment_id):
 
     try:
         db.session.delete(comment)
+        campaign_stats_helper.increment_counters(comment.campaign_id, comments=-1)
         db.session.commit()
         return {"message": f"Comment {comment_id} deleted successfully"}
     except Exception as e:
@@ -66,57 +85,30 @@ def view_all_comments_by_user(user_id):
     """List all comments created by a specific user.
     Returns a list of comment dicts.
     """
-    comments = Comments.query.filter_by(user_id=user_id).all()
-    return [comment.to_dict() for comment in comments]
+    return comment_rows(Comments.user_id == user_id)
 
 
 def view_all_comments_by_campaign(campaign_id):
     """List all comments for a campaign.
     Returns a list of comment dicts.
     """
-    comments = Comments.query.filter_by(campaign_id=campaign_id).all()
-    return [comment.to_dict() for comment in comments]
+    return comment_rows(Comments.campaign_id == campaign_id)
 
 
 def toggle_like(comment_id, user_id):
     """Toggle like/unlike for a comment by a user and return updated comment.
     Returns action message and the updated comment dict.
     """
-    user = Users.query.get(user_id)
+    liked, likes = like_helper.toggle_like(user_id, comment_id)
     comment = Comments.query.get(comment_id)
-
-    if not user:
-        raise ValueError(f"User with user id: {user_id} not found")
-
-    if not comment:
-        raise ValueError(f"Comment with comment id: {comment_id} not found")
-
-    try:
-        if comment in user.liked_comments:
-            user.liked_comments.remove(comment)
-            comment.likes = comment.likes - 1 if comment.likes > 0 else 0
-            action = "unliked"
-        else:
-            user.liked_comments.append(comment)
-            comment.likes = comment.likes + 1
-            action = "liked"
-
-        db.session.commit()
-        return {
-            "message": f"Comment {action} successfully",
-            "comment": comment.to_dict(),
-        }
-
-    except Exception as e:
-        db.session.rollback()
-        raise RuntimeError(f"Could not toggle like for comment {comment_id}: {str(e)}")
+    return {
+        "message": f"Comment {'liked' if liked else 'unliked'} successfully",
+        "comment": {**comment.to_dict(), "likes": likes},
+    }
 
 
 def get_total_likes(comment_id):
     """Return total likes for a comment by id.
     Raises ValueError if the comment doesn't exist.
     """
-    comment = Comments.query.get(comment_id)
-    if not comment:
-        raise ValueError(f"Comment with id {comment_id} not found")
-    return comment.likes
+    return like_helper.get_like_count(comment_id)
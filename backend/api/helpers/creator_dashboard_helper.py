@@ -0,0 +1,48 @@
+from api import db
+from sqlalchemy import text
+
+
+CREATOR_SUMMARY_SQL = text("""
+    WITH creator AS (
+        SELECT role FROM users WHERE user_id = :user_id
+    ),
+    creator_campaigns AS (
+        -- same total as Campaigns.raised_total: unfolded shard amounts included
+        SELECT c.campaign_id, c.status,
+               coalesce(c.raised_amount, 0) + coalesce(
+                   (SELECT sum(s.amount) FROM campaign_raised_shards s WHERE s.campaign_id = c.campaign_id), 0
+               ) AS raised_amount
+        FROM campaigns c
+        WHERE c.creator_id = :user_id
+    ),
+    active_donations AS (
+        SELECT d.user_id, d.amount, d.created_at
+        FROM donations d
+        JOIN creator_campaigns c ON c.campaign_id = d.campaign_id
+        WHERE c.status = 'active'
+    ),
+    latest AS (
+        SELECT user_id, amount, created_at
+        FROM active_donations
+        ORDER BY created_at DESC
+        LIMIT 1
+    )
+    SELECT
+        (SELECT role FROM creator) AS role,
+        (SELECT count(*) FROM creator_campaigns WHERE status = 'active') AS active_campaigns,
+        (SELECT coalesce(sum(amount), 0) FROM active_donations) AS total_raised,
+        (SELECT count(DISTINCT user_id) FROM active_donations) AS total_donors,
+        (SELECT user_id FROM latest) AS recent_donor_id,
+        (SELECT amount FROM latest) AS recent_amount,
+        (SELECT created_at FROM latest) AS recent_date,
+        (SELECT coalesce(sum(raised_amount), 0)
+           FROM creator_campaigns WHERE status = 'completed') AS available
+""")
+
+
+def get_creator_summary(user_id):
+    """Return the creator dashboard numbers for a user in a single round trip.
+    The row's role is None when the user does not exist; callers check it before
+    using the totals.
+    """
+    return db.session.execute(CREATOR_SUMMARY_SQL, {"user_id": user_id}).one()
@@ -187,7 +187,7 @@ def get_donation_statistics_by_campaign(campaign_id):
     stats = {
         "campaign_id": campaign_id,
         "goal_amount": float(campaign.goal_amount),
-        "raised_amount": float(campaign.raised_amount),
+        "raised_amount": float(campaign.raised_total),
     }
 
     for status in DonationStatus:
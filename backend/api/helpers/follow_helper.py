@@ -1,5 +1,8 @@
 from api import db
 from api.models.cf_models import Follows, Users, Campaigns
+from api.helpers import campaign_stats_helper
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 
@@ -8,17 +11,16 @@ def follow_campaign(user_id, campaign_id):
     """Create a follow relation between a user and a campaign.
     Returns the created follow as a dict.
     """
-    existing_follow = Follows.query.filter_by(user_id=user_id, campaign_id=campaign_id).first()
-    if existing_follow:
-        raise ValueError("User already follows this campaign.")
-
     follow = Follows(user_id=user_id, campaign_id=campaign_id)
 
     db.session.add(follow)
     try:
+        campaign_stats_helper.increment_counters(campaign_id, followers=1)
         db.session.commit()
-    except IntegrityError:
+    except IntegrityError as e:
         db.session.rollback()
+        if "uq_follows_user_id_campaign_id" in str(e):
+            raise ValueError("User already follows this campaign.")
         raise RuntimeError("Could not follow campaign due to database integrity error.")
     except Exception as e:
         db.session.rollback()
@@ -31,19 +33,61 @@ def unfollow_campaign(user_id, campaign_id):
     """Remove an existing follow; returns a confirmation message.
     Raises ValueError if the follow does not exist.
     """
-    follow = Follows.query.filter_by(user_id=user_id, campaign_id=campaign_id).first()
-    if not follow:
-        raise ValueError("User is not following this campaign.")
-
     try:
-        db.session.delete(follow)
+        if not _delete_follow(user_id, campaign_id):
+            db.session.rollback()
+            raise ValueError("User is not following this campaign.")
+        campaign_stats_helper.increment_counters(campaign_id, followers=-1)
         db.session.commit()
         return {"message": f"User {user_id} unfollowed campaign {campaign_id} successfully."}
+    except ValueError:
+        raise
     except Exception as e:
         db.session.rollback()
         raise RuntimeError(f"Could not unfollow campaign: {str(e)}")
 
 
+def _delete_follow(user_id, campaign_id):
+    """Delete the follow row if present; True if one was removed. Does not commit.
+    """
+    stmt = (
+        delete(Follows)
+        .where(Follows.user_id == user_id, Follows.campaign_id == campaign_id)
+        .returning(Follows.follow_id)
+        .execution_options(synchronize_session=False)
+    )
+    return db.session.execute(stmt).first() is not None
+
+
+def toggle_follow(user_id, campaign_id):
+    """Follow the campaign, or unfollow it if the user already follows it.
+    Existence is decided by the DELETE / INSERT themselves, so there is no separate lookup.
+    Returns "followed" or "unfollowed".
+    """
+    try:
+        if _delete_follow(user_id, campaign_id):
+            campaign_stats_helper.increment_counters(campaign_id, followers=-1)
+            action = "unfollowed"
+        else:
+            stmt = (
+                insert(Follows.__table__)
+                .values(user_id=user_id, campaign_id=campaign_id, created_at=datetime.utcnow())
+                .on_conflict_do_nothing(constraint="uq_follows_user_id_campaign_id")
+                .returning(Follows.__table__.c.follow_id)
+            )
+            if db.session.execute(stmt).first() is not None:
+                campaign_stats_helper.increment_counters(campaign_id, followers=1)
+            action = "followed"
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        raise ValueError(f"User {user_id} or campaign {campaign_id} not found")
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(f"Could not toggle follow: {str(e)}")
+    return action
+
+
 def view_follow_by_id(follow_id):
     """Fetch a follow record by id and return as dict.
     Raises ValueError if not found.
@@ -88,16 +132,29 @@ def is_user_following(user_id, campaign_id):
     """Check whether a user follows a campaign.
     Returns {'is_following': bool}.
     """
-    follow = Follows.query.filter_by(user_id=user_id, campaign_id=campaign_id).first()
-    return {"is_following": bool(follow)}
+    return {"is_following": campaign_id in get_followed_campaign_ids(user_id, [campaign_id])}
+
+
+def get_followed_campaign_ids(user_id, campaign_ids):
+    """Return the subset of campaign_ids that user_id follows, as a set.
+    One query on the (user_id, campaign_id) unique index of follows.
+    """
+    if not campaign_ids:
+        return set()
+    rows = db.session.execute(
+        select(Follows.campaign_id).where(
+            Follows.user_id == user_id, Follows.campaign_id.in_(campaign_ids)
+        )
+    )
+    return set(rows.scalars())
 
 
 def count_followers(campaign_id):
-    """Return the follower count for a campaign.
+    """Return the follower count for a campaign from the campaign_stats counters.
     Returns a dict with campaign_id and follower_count.
     """
-    count = db.session.query(db.func.count(Follows.follow_id)).filter_by(campaign_id=campaign_id).scalar()
-    return {"campaign_id": campaign_id, "follower_count": count or 0}
+    count = campaign_stats_helper.get_campaign_stats(campaign_id)["follower_count"]
+    return {"campaign_id": campaign_id, "follower_count": count}
 
 
 def count_followed_campaigns(user_id):
@@ -118,6 +175,7 @@ def delete_follow(follow_id):
 
     try:
         db.session.delete(follow)
+        campaign_stats_helper.increment_counters(follow.campaign_id, followers=-1)
         db.session.commit()
         return {"message": f"Follow record {follow_id} deleted successfully."}
     except Exception as e:
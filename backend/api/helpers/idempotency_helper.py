@@ -0,0 +1,204 @@
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from functools import wraps
+from flask import request
+from api import db
+from api.models.cf_models import IdempotencyKeys
+from api.helpers.json_helper import encode_default
+from sqlalchemy import select, delete, update, and_, or_
+from sqlalchemy.dialects.postgresql import insert
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# how long a stored response is replayed for, in seconds
+IDEMPOTENCY_TTL = int(os.getenv("IDEMPOTENCY_TTL", "86400"))
+
+# seconds an in-progress request holds its key; after that a retry may take it over,
+# so a worker that died mid-request doesn't leave the key answering 409 until it expires
+IDEMPOTENCY_LOCK_TTL = int(os.getenv("IDEMPOTENCY_LOCK_TTL", "60"))
+
+# "db" (shared by all workers) or "memory" (per-process, for local development)
+IDEMPOTENCY_STORE = os.getenv("IDEMPOTENCY_STORE", "db")
+
+MAX_KEY_LENGTH = 255
+
+
+class DatabaseIdempotencyStore:
+    """Keys live in the idempotency_keys table; its primary key makes reserve() atomic
+    across workers. Each call runs in its own short transaction, separate from the
+    request's session.
+    """
+
+    def reserve(self, key, request_hash, ttl):
+        """Claim key for a new request. Returns None if claimed, otherwise the existing
+        (request_hash, status_code, response); status_code is None while in progress.
+        """
+        now = datetime.utcnow()
+        table = IdempotencyKeys.__table__
+        stmt = insert(table).values(
+            key=key,
+            request_hash=request_hash,
+            created_at=now,
+            expires_at=now + timedelta(seconds=ttl),
+            locked_until=now + timedelta(seconds=IDEMPOTENCY_LOCK_TTL),
+        )
+        # an expired key, or one whose in-progress request outlived its lock, is reclaimed as if new
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.key],
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "status_code": None,
+                "response": None,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+                "locked_until": stmt.excluded.locked_until,
+            },
+            where=or_(
+                table.c.expires_at < now,
+                and_(table.c.status_code.is_(None), table.c.locked_until < now),
+            ),
+        ).returning(table.c.key)
+
+        with db.engine.begin() as conn:
+            if conn.execute(stmt).first():
+                return None
+            row = conn.execute(
+                select(table.c.request_hash, table.c.status_code, table.c.response).where(table.c.key == key)
+            ).first()
+        return tuple(row) if row else None
+
+    def complete(self, key, status_code, response):
+        table = IdempotencyKeys.__table__
+        with db.engine.begin() as conn:
+            conn.execute(
+                update(table).where(table.c.key == key)
+                .values(status_code=status_code, response=response, locked_until=None)
+            )
+
+    def release(self, key):
+        table = IdempotencyKeys.__table__
+        with db.engine.begin() as conn:
+            conn.execute(delete(table).where(table.c.key == key))
+
+    def purge_expired(self):
+        table = IdempotencyKeys.__table__
+        with db.engine.begin() as conn:
+            return conn.execute(delete(table).where(table.c.expires_at < datetime.utcnow())).rowcount
+
+
+class MemoryIdempotencyStore:
+    """In-process stand-in with the same interface as DatabaseIdempotencyStore.
+    Only safe with a single worker process; meant for local development and scripts.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key, request_hash, ttl):
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry["expires_at"] >= now and (
+                entry["status_code"] is not None or entry["locked_until"] >= now
+            ):
+                return entry["request_hash"], entry["status_code"], entry["response"]
+            self._entries[key] = {
+                "request_hash": request_hash,
+                "status_code": None,
+                "response": None,
+                "expires_at": now + timedelta(seconds=ttl),
+                "locked_until": now + timedelta(seconds=IDEMPOTENCY_LOCK_TTL),
+            }
+        return None
+
+    def complete(self, key, status_code, response):
+        with self._lock:
+            if key in self._entries:
+                self._entries[key].update(status_code=status_code, response=response, locked_until=None)
+
+    def release(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def purge_expired(self):
+        now = datetime.utcnow()
+        with self._lock:
+            expired = [k for k, v in self._entries.items() if v["expires_at"] < now]
+            for k in expired:
+                del self._entries[k]
+        return len(expired)
+
+
+_store = None
+
+
+def get_store():
+    """Return the process-wide store selected by IDEMPOTENCY_STORE.
+    """
+    global _store
+    if _store is None:
+        _store = MemoryIdempotencyStore() if IDEMPOTENCY_STORE == "memory" else DatabaseIdempotencyStore()
+    return _store
+
+
+def idempotent(f):
+    """Replay the stored response when a POST is retried with the same Idempotency-Key.
+    Requests without the header run normally. A key reused with a different body gets
+    422, and a retry that arrives while the first attempt is still running gets 409
+    (for up to IDEMPOTENCY_LOCK_TTL seconds, after which the retry runs instead).
+    Responses with status >= 500 are not stored, so the client can retry them.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return f(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return {"error": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters"}, 400
+
+        scoped_key = f"{request.method} {request.path} {key}"
+        request_hash = hashlib.sha256(request.get_data()).hexdigest()
+        store = get_store()
+
+        existing = store.reserve(scoped_key, request_hash, IDEMPOTENCY_TTL)
+        if existing is not None:
+            stored_hash, status_code, response = existing
+            if stored_hash != request_hash:
+                return {"error": f"{IDEMPOTENCY_HEADER} was already used with a different request body"}, 422
+            if status_code is None:
+                return {"error": "A request with this Idempotency-Key is still being processed"}, 409
+            return json.loads(response), status_code, {"Idempotent-Replayed": "true"}
+
+        try:
+            rv = f(*args, **kwargs)
+        except Exception:
+            store.release(scoped_key)
+            raise
+
+        body, status_code = (rv[0], rv[1]) if isinstance(rv, tuple) else (rv, 200)
+        if status_code >= 500 or not isinstance(body, (dict, list)):
+            store.release(scoped_key)
+        else:
+            store.complete(scoped_key, status_code, json.dumps(body, default=encode_default))
+        return rv
+
+    return decorated_function
+
+
+def purge_expired_keys():
+    """Delete expired keys; scheduled hourly so the table stays small.
+    """
+    return get_store().purge_expired()
+
+
+def start_idempotency_purger():
+    """Purge expired idempotency keys every hour in the background.
+    """
+    from api.helpers.scheduler_helper import start_periodic
+
+    return start_periodic("purge-idempotency-keys", 3600, purge_expired_keys)
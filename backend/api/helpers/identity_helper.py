@@ -0,0 +1,121 @@
+import os
+import time
+import threading
+from collections import OrderedDict, namedtuple
+from flask import g
+from api import db
+from api.models.cf_models import Users
+from sqlalchemy import select
+
+
+# seconds a cached user row is trusted; profile updates invalidate it immediately
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "1024"))
+
+_IDENTITY_FIELDS = ("user_id", "username", "email", "role", "profile_image")
+
+
+class UserIdentity(namedtuple("UserIdentity", _IDENTITY_FIELDS)):
+    """Read-only snapshot of a user row, safe to share between requests and threads.
+    role is the plain string value ("donor", "creator", "admin").
+    """
+    __slots__ = ()
+
+    def to_dict(self):
+        return self._asdict()
+
+
+class UserCache:
+    """Small thread-safe LRU of UserIdentity snapshots with a per-entry TTL.
+    """
+
+    def __init__(self, maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, identity = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return identity
+
+    def put(self, identity):
+        with self._lock:
+            self._entries[identity.user_id] = (time.monotonic() + self.ttl, identity)
+            self._entries.move_to_end(identity.user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+user_cache = UserCache()
+
+
+def get_claims():
+    """Return the decoded JWT payload for this request ({} outside jwt_required routes).
+    """
+    return getattr(g, "jwt_claims", {})
+
+
+def current_user_id():
+    """Return the authenticated user's id from the token.
+    """
+    return get_claims().get("user_id")
+
+
+def current_role():
+    """Return the authenticated user's role from the token, lowercased.
+    Costs no query; the claim is refreshed whenever a new token is issued.
+    """
+    return (get_claims().get("role") or "").lower()
+
+
+def get_user_identity(user_id):
+    """Return a UserIdentity for user_id from the cache, or load it with one query.
+    Returns None if the user does not exist.
+    """
+    identity = user_cache.get(user_id)
+    if identity is not None:
+        return identity
+
+    row = db.session.execute(
+        select(Users.user_id, Users.username, Users.email, Users.role, Users.profile_image)
+        .where(Users.user_id == user_id)
+    ).first()
+    if row is None:
+        return None
+
+    identity = UserIdentity(
+        row.user_id, row.username, row.email, row.role.value if row.role else None, row.profile_image
+    )
+    user_cache.put(identity)
+    return identity
+
+
+def current_user():
+    """Return the authenticated user's UserIdentity, loaded at most once per request.
+    Returns None for anonymous requests or deleted users.
+    """
+    if "current_user" not in g:
+        user_id = current_user_id()
+        g.current_user = get_user_identity(user_id) if user_id is not None else None
+    return g.current_user
+
+
+def invalidate_user(user_id):
+    """Drop a user's cached row; call after changing the user.
+    """
+    user_cache.invalidate(user_id)
+    if getattr(g, "current_user", None) is not None and g.current_user.user_id == user_id:
+        g.pop("current_user")
@@ -0,0 +1,49 @@
+from decimal import Decimal
+from flask import current_app, make_response
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to Flask-RESTX's stdlib encoder
+    orjson = None
+
+
+def encode_default(value):
+    """Encode the types orjson does not handle natively.
+    Decimals become floats, matching what the models' to_dict() return.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data):
+    """Serialize data to JSON bytes with orjson.
+    Datetimes, dates, UUIDs and enums are encoded natively, so rows do not need converting first.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if current_app.debug:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=encode_default, option=option)
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX representation for application/json backed by orjson.
+    Same contract as flask_restx.representations.output_json.
+    """
+    resp = make_response(dumps(data), code)
+    resp.headers.extend(headers or {})
+    resp.headers["Content-Type"] = "application/json"
+    return resp
+
+
+def register_json_encoder(api):
+    """Make orjson the Api's JSON encoder when it is installed.
+    Returns True if it was registered, False if the stdlib encoder is kept.
+    """
+    if orjson is None:
+        print("orjson is not installed, using the default JSON encoder")
+        return False
+    api.representation("application/json")(output_json)
+    return True
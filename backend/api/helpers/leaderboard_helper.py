@@ -0,0 +1,319 @@
+import time
+from api import db
+from api.models.cf_models import Users, Campaigns, CampaignStats, CampaignStatus, Donations, DonationStatus
+from api.helpers.redis_helper import get_redis
+from redis import RedisError
+from sqlalchemy import func
+from datetime import datetime, timedelta
+
+
+LEADERBOARD_SIZE = 50
+
+# trailing window used for the "velocity" board, split into hourly buckets
+VELOCITY_WINDOW_HOURS = 24
+
+RAISED_KEY = "leaderboard:raised"
+DONORS_KEY = "leaderboard:donors"
+DONOR_SET_KEY = "leaderboard:donors:{campaign_id}"
+VELOCITY_BUCKET_KEY = "leaderboard:velocity:{hour}"
+VELOCITY_KEY = "leaderboard:velocity"
+REBUILD_LOCK_KEY = "leaderboard:rebuild-lock"
+# set only by rebuild_leaderboard; incremental updates would otherwise recreate the
+# board keys on a cold cache and make a partial board look built
+BUILT_KEY = "leaderboard:built"
+
+BOARDS = ("raised", "donors", "velocity")
+
+# only these campaigns are ranked; sync_campaign_status adds or removes the others
+RANKED_STATUSES = (CampaignStatus.active, CampaignStatus.completed)
+
+
+def _current_hour(now=None):
+    return int((now or time.time()) // 3600)
+
+
+def _window_buckets(hour):
+    return [VELOCITY_BUCKET_KEY.format(hour=h) for h in range(hour - VELOCITY_WINDOW_HOURS + 1, hour + 1)]
+
+
+def _completed_donors(*criteria):
+    return (
+        db.session.query(Donations.campaign_id, Donations.user_id)
+        .join(Campaigns, Campaigns.campaign_id == Donations.campaign_id)
+        .filter(Donations.status == DonationStatus.completed, Campaigns.status.in_(RANKED_STATUSES), *criteria)
+        .distinct()
+        .all()
+    )
+
+
+def _recent_by_hour(now, *criteria):
+    """Completed donations in the velocity window as (campaign_id, hour, amount) rows.
+    """
+    since = datetime.utcfromtimestamp(now) - timedelta(hours=VELOCITY_WINDOW_HOURS)
+    hour_col = func.floor(func.extract("epoch", Donations.created_at) / 3600)
+    return (
+        db.session.query(Donations.campaign_id, hour_col.label("hour"), func.sum(Donations.amount).label("amount"))
+        .join(Campaigns, Campaigns.campaign_id == Donations.campaign_id)
+        .filter(
+            Donations.status == DonationStatus.completed,
+            Donations.created_at >= since,
+            Campaigns.status.in_(RANKED_STATUSES),
+            *criteria,
+        )
+        .group_by(Donations.campaign_id, hour_col)
+        .all()
+    )
+
+
+def record_completed_donation(campaign_id, user_id, amount, raised_amount):
+    """Fold one completed donation into the leaderboards.
+    Call after the donation's transaction has committed; raised_amount is the campaign's
+    new total. Skipped while the board is not built, since the rebuild reads the donation
+    from the database. Redis errors are swallowed so a leaderboard outage never fails a payment.
+    """
+    try:
+        r = get_redis()
+        if not r.exists(BUILT_KEY):
+            return
+        hour = _current_hour()
+        bucket = VELOCITY_BUCKET_KEY.format(hour=hour)
+
+        # SADD tells us whether this donor is new to the campaign
+        is_new_donor = r.sadd(DONOR_SET_KEY.format(campaign_id=campaign_id), user_id)
+
+        pipe = r.pipeline()
+        pipe.zadd(RAISED_KEY, {campaign_id: float(raised_amount)})
+        if is_new_donor:
+            pipe.zincrby(DONORS_KEY, 1, campaign_id)
+        pipe.zincrby(bucket, float(amount), campaign_id)
+        pipe.expire(bucket, (VELOCITY_WINDOW_HOURS + 1) * 3600)
+        pipe.delete(VELOCITY_KEY)
+        pipe.execute()
+    except Exception as e:
+        print(f"Leaderboard update failed for campaign {campaign_id}: {e}")
+
+
+def rebuild_leaderboard():
+    """Recompute every board from the database.
+    Used on a cold cache and safe to run at any time; the swap is atomic per key.
+    """
+    r = get_redis()
+
+    raised = (
+        db.session.query(Campaigns.campaign_id, Campaigns.raised_total.label("raised_amount"))
+        .filter(Campaigns.status.in_(RANKED_STATUSES))
+        .all()
+    )
+    donors = _completed_donors()
+    recent = _recent_by_hour(time.time())
+
+    donor_sets = {}
+    for campaign_id, user_id in donors:
+        donor_sets.setdefault(campaign_id, []).append(user_id)
+
+    buckets = {}
+    for campaign_id, hour, amount in recent:
+        buckets.setdefault(int(hour), {})[campaign_id] = float(amount)
+
+    pipe = r.pipeline()
+    pipe.delete(RAISED_KEY, DONORS_KEY, VELOCITY_KEY, BUILT_KEY)
+    for key in r.scan_iter(match="leaderboard:donors:*"):
+        pipe.delete(key)
+    for key in r.scan_iter(match="leaderboard:velocity:*"):
+        pipe.delete(key)
+
+    if raised:
+        pipe.zadd(RAISED_KEY, {c.campaign_id: float(c.raised_amount or 0) for c in raised})
+    if donor_sets:
+        pipe.zadd(DONORS_KEY, {cid: len(users) for cid, users in donor_sets.items()})
+        for cid, users in donor_sets.items():
+            pipe.sadd(DONOR_SET_KEY.format(campaign_id=cid), *users)
+    for hour, scores in buckets.items():
+        bucket = VELOCITY_BUCKET_KEY.format(hour=hour)
+        pipe.zadd(bucket, scores)
+        pipe.expireat(bucket, (hour + VELOCITY_WINDOW_HOURS + 1) * 3600)
+    pipe.set(BUILT_KEY, 1)
+    pipe.execute()
+
+
+def sync_campaign_status(campaign_id, status):
+    """Add a campaign to the boards or remove it after its status change has committed.
+    Active and completed campaigns are ranked; pending and rejected ones are not. Skipped
+    while the board is not built; Redis errors are swallowed like in record_completed_donation.
+    """
+    try:
+        r = get_redis()
+        if not r.exists(BUILT_KEY):
+            return
+        now = time.time()
+        keys = (RAISED_KEY, DONORS_KEY, VELOCITY_KEY, *_window_buckets(_current_hour(now)))
+
+        if status not in RANKED_STATUSES:
+            pipe = r.pipeline()
+            for key in keys:
+                pipe.zrem(key, campaign_id)
+            pipe.delete(DONOR_SET_KEY.format(campaign_id=campaign_id))
+            pipe.execute()
+            return
+
+        raised = (
+            db.session.query(Campaigns.raised_total)
+            .filter(Campaigns.campaign_id == campaign_id)
+            .scalar()
+        )
+        if raised is None:
+            return
+        donors = [user_id for _, user_id in _completed_donors(Donations.campaign_id == campaign_id)]
+        recent = _recent_by_hour(now, Donations.campaign_id == campaign_id)
+
+        donor_set = DONOR_SET_KEY.format(campaign_id=campaign_id)
+        pipe = r.pipeline()
+        pipe.zadd(RAISED_KEY, {campaign_id: float(raised)})
+        pipe.delete(donor_set)
+        if donors:
+            pipe.sadd(donor_set, *donors)
+            pipe.zadd(DONORS_KEY, {campaign_id: len(donors)})
+        for _, hour, amount in recent:
+            bucket = VELOCITY_BUCKET_KEY.format(hour=int(hour))
+            pipe.zadd(bucket, {campaign_id: float(amount)})
+            pipe.expireat(bucket, (int(hour) + VELOCITY_WINDOW_HOURS + 1) * 3600)
+        pipe.delete(VELOCITY_KEY)
+        pipe.execute()
+    except Exception as e:
+        print(f"Leaderboard update failed for campaign {campaign_id}: {e}")
+
+
+def _ensure_built(r):
+    if r.exists(BUILT_KEY):
+        return
+    # only one worker rebuilds; the others serve an empty board for that request
+    if r.set(REBUILD_LOCK_KEY, 1, nx=True, ex=60):
+        try:
+            rebuild_leaderboard()
+        finally:
+            r.delete(REBUILD_LOCK_KEY)
+
+
+def _velocity_key(r):
+    """Return a key holding the trailing-window velocity scores, rebuilding it if stale.
+    The union is cached until the next donation or the start of the next hour.
+    """
+    if not r.exists(VELOCITY_KEY):
+        hour = _current_hour()
+        r.zunionstore(VELOCITY_KEY, _window_buckets(hour))
+        r.expireat(VELOCITY_KEY, (hour + 1) * 3600)
+    return VELOCITY_KEY
+
+
+def get_top_campaigns(board="raised", limit=5):
+    """Return the top campaigns for a board ('raised', 'donors' or 'velocity').
+    Scores come from Redis; campaign cards are fetched in one query by primary key.
+    If Redis is unavailable the board is ranked from the database instead.
+    """
+    if board not in BOARDS:
+        raise ValueError(f"Invalid leaderboard '{board}'. Must be one of: {list(BOARDS)}")
+    limit = max(1, min(int(limit), LEADERBOARD_SIZE))
+
+    try:
+        return _top_from_redis(board, limit)
+    except RedisError as e:
+        print(f"Leaderboard unavailable, ranking '{board}' from the database: {e}")
+        db.session.rollback()
+        return _top_from_db(board, limit)
+
+
+def _top_from_redis(board, limit):
+    r = get_redis()
+    _ensure_built(r)
+
+    key = {"raised": RAISED_KEY, "donors": DONORS_KEY}.get(board) or _velocity_key(r)
+    top = r.zrevrange(key, 0, limit - 1, withscores=True)
+    if not top:
+        return []
+
+    ids = [int(campaign_id) for campaign_id, _ in top]
+    rows = (
+        db.session.query(
+            Campaigns.campaign_id,
+            Campaigns.title,
+            Campaigns.raised_total.label("raised_amount"),
+            Users.user_id,
+            Users.username,
+            Users.profile_image,
+        )
+        .join(Users, Campaigns.creator_id == Users.user_id)
+        .filter(Campaigns.campaign_id.in_(ids))
+        .all()
+    )
+    by_id = {row.campaign_id: row for row in rows}
+
+    donor_counts = r.zmscore(DONORS_KEY, ids)
+    velocity = r.zmscore(_velocity_key(r), ids)
+
+    result = []
+    for (campaign_id, _), donor_count, recent in zip(top, donor_counts, velocity):
+        row = by_id.get(int(campaign_id))
+        if not row:
+            # campaign was deleted since it was scored
+            r.zrem(key, campaign_id)
+            continue
+        result.append({
+            "campaign_id": row.campaign_id,
+            "title": row.title,
+            "raised_amount": float(row.raised_amount or 0),
+            "donor_count": int(donor_count or 0),
+            "raised_last_24h": float(recent or 0),
+            "creator": {
+                "user_id": row.user_id,
+                "username": row.username,
+                "profile_image": row.profile_image,
+            },
+        })
+    return result
+
+
+def _top_from_db(board, limit):
+    """Rank the top campaigns with one bounded query, in the same shape as the Redis boards.
+    Uses the stored raised_amount and the campaign_stats donor counter, so unfolded shard
+    amounts do not move the order; the velocity board falls back to the raised order.
+    """
+    order = CampaignStats.donor_count if board == "donors" else Campaigns.raised_amount
+    rows = (
+        db.session.query(
+            Campaigns.campaign_id,
+            Campaigns.title,
+            Campaigns.raised_total.label("raised_amount"),
+            CampaignStats.donor_count,
+            Users.user_id,
+            Users.username,
+            Users.profile_image,
+        )
+        .join(Users, Campaigns.creator_id == Users.user_id)
+        .outerjoin(CampaignStats, CampaignStats.campaign_id == Campaigns.campaign_id)
+        .filter(Campaigns.status.in_(RANKED_STATUSES))
+        .order_by(order.desc().nulls_last(), Campaigns.campaign_id)
+        .limit(limit)
+        .all()
+    )
+    if not rows:
+        return []
+
+    recent = {}
+    for campaign_id, _, amount in _recent_by_hour(time.time(), Donations.campaign_id.in_([row.campaign_id for row in rows])):
+        recent[campaign_id] = recent.get(campaign_id, 0) + float(amount)
+
+    return [
+        {
+            "campaign_id": row.campaign_id,
+            "title": row.title,
+            "raised_amount": float(row.raised_amount or 0),
+            "donor_count": int(row.donor_count or 0),
+            "raised_last_24h": recent.get(row.campaign_id, 0.0),
+            "creator": {
+                "user_id": row.user_id,
+                "username": row.username,
+                "profile_image": row.profile_image,
+            },
+        }
+        for row in rows
+    ]
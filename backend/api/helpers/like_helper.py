@@ -0,0 +1,268 @@
+import os
+import uuid
+import threading
+from api import db
+from api.models.cf_models import Comments, user_comment_likes
+from api.helpers.redis_helper import get_redis
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+
+
+# seconds between flushes of buffered like deltas into comments.likes
+LIKE_FLUSH_INTERVAL = int(os.getenv("LIKE_FLUSH_INTERVAL", "5"))
+
+# seconds between full recounts of comments.likes from user_comment_likes; 0 disables
+LIKE_RECONCILE_INTERVAL = int(os.getenv("LIKE_RECONCILE_INTERVAL", "3600"))
+
+PENDING_KEY = "likes:pending"
+FLUSHING_KEY = "likes:flushing:{token}"
+
+# arbitrary key for pg_advisory_xact_lock; flushes and recounts never overlap
+LIKE_COUNTS_LOCK_ID = 872302
+
+RECONCILE_SQL = text("""
+    WITH counts AS (
+        SELECT c.comment_id, count(l.user_id) AS total
+        FROM comments c
+        LEFT JOIN user_comment_likes l ON l.comment_id = c.comment_id
+        GROUP BY c.comment_id
+    )
+    UPDATE comments c
+    SET likes = counts.total
+    FROM counts
+    WHERE c.comment_id = counts.comment_id
+      AND c.likes IS DISTINCT FROM counts.total
+""")
+
+# used when Redis is unreachable; only visible to this process until flushed
+_memory_deltas = {}
+_memory_lock = threading.Lock()
+
+
+def _buffer_delta(comment_id, delta):
+    """Add a like delta to the Redis buffer, or to this process's buffer if Redis is down.
+    """
+    try:
+        get_redis().hincrby(PENDING_KEY, comment_id, delta)
+    except Exception as e:
+        print(f"Like buffer unavailable, keeping delta in memory: {e}")
+        with _memory_lock:
+            _memory_deltas[comment_id] = _memory_deltas.get(comment_id, 0) + delta
+
+
+def _pending_delta(comment_id):
+    try:
+        pending = int(get_redis().hget(PENDING_KEY, comment_id) or 0)
+    except Exception:
+        pending = 0
+    with _memory_lock:
+        return pending + _memory_deltas.get(comment_id, 0)
+
+
+def get_like_count(comment_id):
+    """Return a comment's like count including deltas not yet flushed.
+    Raises ValueError if the comment doesn't exist.
+    """
+    likes = db.session.execute(
+        select(Comments.likes).where(Comments.comment_id == comment_id)
+    ).scalar_one_or_none()
+    if likes is None:
+        if not db.session.get(Comments, comment_id):
+            raise ValueError(f"Comment with id {comment_id} not found")
+        likes = 0
+    return max(likes + _pending_delta(comment_id), 0)
+
+
+def get_liked_comment_ids(user_id, comment_ids):
+    """Return the subset of comment_ids that user_id has liked, as a set.
+    One query against the (user_id, comment_id) primary key of user_comment_likes.
+    """
+    if not comment_ids:
+        return set()
+    rows = db.session.execute(
+        select(user_comment_likes.c.comment_id).where(
+            user_comment_likes.c.user_id == user_id,
+            user_comment_likes.c.comment_id.in_(comment_ids),
+        )
+    )
+    return set(rows.scalars())
+
+
+def _commit_with_delta(comment_id, delta):
+    """Buffer a like delta, then commit the join-table change it belongs to.
+    Buffering before the commit, while the row lock is held, means a recount that
+    sees the row also finds its delta in the buffer. Undoes the delta if the commit fails.
+    """
+    _buffer_delta(comment_id, delta)
+    try:
+        db.session.commit()
+    except Exception:
+        _buffer_delta(comment_id, -delta)
+        raise
+
+
+def like_comment(user_id, comment_id):
+    """Record that user_id likes comment_id; liking twice is a no-op.
+    Only the user's own join-table row is written here; the comment's counter is
+    buffered and flushed in batches. Returns True if this call added the like.
+    """
+    stmt = (
+        insert(user_comment_likes)
+        .values(user_id=user_id, comment_id=comment_id)
+        .on_conflict_do_nothing()
+        .returning(user_comment_likes.c.comment_id)
+    )
+    added = db.session.execute(stmt).first() is not None
+    if added:
+        _commit_with_delta(comment_id, 1)
+    else:
+        db.session.commit()
+    return added
+
+
+def unlike_comment(user_id, comment_id):
+    """Remove user_id's like from comment_id. Returns True if a like was removed.
+    """
+    stmt = (
+        delete(user_comment_likes)
+        .where(user_comment_likes.c.user_id == user_id, user_comment_likes.c.comment_id == comment_id)
+        .returning(user_comment_likes.c.comment_id)
+    )
+    removed = db.session.execute(stmt).first() is not None
+    if removed:
+        _commit_with_delta(comment_id, -1)
+    else:
+        db.session.commit()
+    return removed
+
+
+def toggle_like(user_id, comment_id):
+    """Unlike if the user already likes the comment, otherwise like it.
+    Returns (liked, likes) where likes includes unflushed deltas.
+    Raises ValueError if the user or comment does not exist.
+    """
+    try:
+        liked = not unlike_comment(user_id, comment_id)
+        if liked:
+            like_comment(user_id, comment_id)
+    except Exception as e:
+        db.session.rollback()
+        if "foreign key" in str(e).lower():
+            raise ValueError(f"User {user_id} or comment {comment_id} not found")
+        raise RuntimeError(f"Could not toggle like for comment {comment_id}: {str(e)}")
+    return liked, get_like_count(comment_id)
+
+
+def _take_redis_deltas():
+    """Atomically move the pending hash aside and return (key, deltas).
+    """
+    r = get_redis()
+    flushing_key = FLUSHING_KEY.format(token=uuid.uuid4().hex)
+    try:
+        r.rename(PENDING_KEY, flushing_key)
+    except Exception as e:
+        if "no such key" in str(e).lower():
+            return None, {}
+        raise
+    return flushing_key, {int(k): int(v) for k, v in r.hgetall(flushing_key).items()}
+
+
+def _take_deltas():
+    """Take every buffered delta, from Redis and from this process's memory.
+    Returns (flushing_key, deltas); delete flushing_key once the deltas are applied.
+    """
+    flushing_key, deltas = None, {}
+    try:
+        flushing_key, deltas = _take_redis_deltas()
+    except Exception as e:
+        print(f"Like buffer unavailable, taking in-memory deltas only: {e}")
+
+    with _memory_lock:
+        local = dict(_memory_deltas)
+        _memory_deltas.clear()
+    for comment_id, delta in local.items():
+        deltas[comment_id] = deltas.get(comment_id, 0) + delta
+    return flushing_key, {k: v for k, v in deltas.items() if v}
+
+
+def _drop_flushing_key(flushing_key):
+    if flushing_key:
+        try:
+            get_redis().delete(flushing_key)
+        except Exception:
+            pass
+
+
+def _lock_like_counts():
+    db.session.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": LIKE_COUNTS_LOCK_ID})
+
+
+def flush_like_deltas():
+    """Apply buffered deltas to comments.likes in a single UPDATE and commit.
+    On failure the deltas are put back so no like is lost. Returns the number of
+    comments updated.
+    """
+    flushing_key, deltas = None, {}
+    try:
+        _lock_like_counts()
+        flushing_key, deltas = _take_deltas()
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(f"Could not flush like counts: {str(e)}")
+
+    if not deltas:
+        db.session.commit()
+        _drop_flushing_key(flushing_key)
+        return 0
+
+    values = ", ".join(f"({int(k)}, {int(v)})" for k, v in deltas.items())
+    stmt = text(f"""
+        UPDATE comments c
+        SET likes = greatest(coalesce(c.likes, 0) + d.delta, 0)
+        FROM (VALUES {values}) AS d(comment_id, delta)
+        WHERE c.comment_id = d.comment_id
+    """)
+    try:
+        result = db.session.execute(stmt)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        for comment_id, delta in deltas.items():
+            _buffer_delta(comment_id, delta)
+        raise RuntimeError(f"Could not flush like counts: {str(e)}")
+    finally:
+        _drop_flushing_key(flushing_key)
+    return result.rowcount
+
+
+def reconcile_comment_likes():
+    """Recount comments.likes from user_comment_likes, fixing any drift.
+    Likes and unlikes wait on a SHARE lock while the buffer is swapped and the recount
+    runs, so every buffered delta is already in the count and is dropped, not applied
+    twice. Deltas held in other processes' memory while Redis was down are not seen.
+    Commits and returns the number of comments corrected.
+    """
+    flushing_key, deltas = None, {}
+    try:
+        _lock_like_counts()
+        db.session.execute(text("LOCK TABLE user_comment_likes IN SHARE MODE"))
+        flushing_key, deltas = _take_deltas()
+        result = db.session.execute(RECONCILE_SQL)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        for comment_id, delta in deltas.items():
+            _buffer_delta(comment_id, delta)
+        raise RuntimeError(f"Could not reconcile like counts: {str(e)}")
+    finally:
+        _drop_flushing_key(flushing_key)
+    return result.rowcount
+
+
+def start_like_workers():
+    """Flush like deltas and reconcile counts in the background.
+    """
+    from api.helpers.scheduler_helper import start_periodic
+
+    start_periodic("flush-like-deltas", LIKE_FLUSH_INTERVAL, flush_like_deltas)
+    start_periodic("reconcile-comment-likes", LIKE_RECONCILE_INTERVAL, reconcile_comment_likes)
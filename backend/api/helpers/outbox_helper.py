@@ -0,0 +1,251 @@
+import os
+import smtplib
+from datetime import datetime, timedelta
+from api import db
+from api.models.cf_models import EmailOutbox, EmailStatus
+from sqlalchemy import insert, text, update
+
+
+# seconds between outbox polls; 0 disables the background worker
+OUTBOX_POLL_INTERVAL = int(os.getenv("OUTBOX_POLL_INTERVAL", "5"))
+
+# emails claimed and sent over one SMTP connection per drain
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+
+# attempts before an email is marked failed; retries back off exponentially
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "6"))
+OUTBOX_RETRY_BASE = int(os.getenv("OUTBOX_RETRY_BASE", "30"))
+OUTBOX_RETRY_MAX = int(os.getenv("OUTBOX_RETRY_MAX", "3600"))
+
+# a claimed email not finished within this many seconds is picked up again; a drain
+# renews the lease on its remaining emails once half of it has passed
+OUTBOX_LEASE = int(os.getenv("OUTBOX_LEASE", "300"))
+
+# rejected recipients and similar errors that a retry won't fix
+PERMANENT_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused)
+
+CLAIM_SQL = text("""
+    UPDATE email_outbox
+    SET status = 'sending', attempts = attempts + 1, next_attempt_at = :lease_until
+    WHERE email_id IN (
+        SELECT email_id FROM email_outbox
+        WHERE status IN ('pending', 'sending') AND next_attempt_at <= :now
+        ORDER BY next_attempt_at
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING email_id, recipient, subject, template_name, context, attempts
+""")
+
+
+def enqueue_email(recipient, subject, template_name, **context):
+    """Add an email to the outbox in the current session without committing.
+    It is sent only if the caller's transaction commits.
+    """
+    email = EmailOutbox(
+        recipient=recipient,
+        subject=subject,
+        template_name=template_name,
+        context=context,
+        status=EmailStatus.pending,
+        attempts=0,
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.session.add(email)
+    return email
+
+
+def enqueue_emails(emails, connection=None):
+    """Bulk-insert many emails in one statement.
+    emails is a list of dicts with recipient, subject, template_name and context.
+    Runs on connection if given, otherwise in the current session (not committed).
+    """
+    if not emails:
+        return 0
+    now = datetime.utcnow()
+    rows = [
+        {**email, "status": EmailStatus.pending, "attempts": 0, "next_attempt_at": now, "created_at": now}
+        for email in emails
+    ]
+    stmt = insert(EmailOutbox.__table__)
+    if connection is not None:
+        connection.execute(stmt, rows)
+    else:
+        db.session.execute(stmt, rows)
+    return len(rows)
+
+
+def _claim_batch(limit):
+    """Claim up to limit due emails and commit, so other workers skip them.
+    Returns (rows, lease_until).
+    """
+    now = datetime.utcnow()
+    lease_until = now + timedelta(seconds=OUTBOX_LEASE)
+    rows = db.session.execute(
+        CLAIM_SQL, {"now": now, "lease_until": lease_until, "limit": limit}
+    ).all()
+    db.session.commit()
+    return rows, lease_until
+
+
+def _renew_lease(email_ids, lease_until):
+    """Extend the lease on claimed emails this worker still holds and commit.
+    Emails whose lease already ran out and were re-claimed by another worker are left
+    alone. Returns (email ids still held, new lease_until).
+    """
+    table = EmailOutbox.__table__
+    new_lease = datetime.utcnow() + timedelta(seconds=OUTBOX_LEASE)
+    held = db.session.execute(
+        update(table)
+        .where(
+            table.c.email_id.in_(email_ids),
+            table.c.status == EmailStatus.sending,
+            table.c.next_attempt_at == lease_until,
+        )
+        .values(next_attempt_at=new_lease)
+        .returning(table.c.email_id)
+    ).scalars().all()
+    db.session.commit()
+    return set(held), new_lease
+
+
+def _backoff(attempts):
+    return min(OUTBOX_RETRY_BASE * 2 ** (attempts - 1), OUTBOX_RETRY_MAX)
+
+
+def _render_rows(rows):
+    """Render a claimed batch, one render_templates call per template.
+    Returns ({email_id: html}, [(row, error)]) for rows whose template failed.
+    """
+    from email_service.email_sender import render_templates
+
+    by_template = {}
+    for row in rows:
+        by_template.setdefault(row.template_name, []).append(row)
+
+    htmls, failed = {}, []
+    for template_name, group in by_template.items():
+        try:
+            rendered = render_templates(template_name, [row.context for row in group])
+        except Exception as e:
+            failed.extend((row, str(e)) for row in group)
+            continue
+        htmls.update(zip((row.email_id for row in group), rendered))
+    return htmls, failed
+
+
+def drain_outbox(limit=None):
+    """Send one batch of due emails over a single SMTP connection.
+    Failed sends are retried with exponential backoff until OUTBOX_MAX_ATTEMPTS. If the
+    server can't be reached or refuses the login, the batch stops and the emails not yet
+    tried go back to pending without using up an attempt.
+    Returns (sent, failed) counts for the batch.
+    """
+    from email_service.email_sender import SMTPSession, SMTPConnectFailed
+
+    rows, lease_until = _claim_batch(limit or OUTBOX_BATCH_SIZE)
+    if not rows:
+        return 0, 0
+
+    htmls, failed = _render_rows(rows)
+    held = {row.email_id for row in rows}
+    sent, retry, requeue = [], [], []
+    try:
+        with SMTPSession() as session:
+            for row in rows:
+                if row.email_id not in htmls:
+                    continue
+                # sent emails are renewed too, so no one re-sends them before the results are recorded
+                if datetime.utcnow() >= lease_until - timedelta(seconds=OUTBOX_LEASE / 2):
+                    held, lease_until = _renew_lease(held, lease_until)
+                if row.email_id not in held:
+                    continue
+                try:
+                    session.send(row.recipient, row.subject, htmls[row.email_id])
+                    sent.append(row.email_id)
+                except PERMANENT_ERRORS as e:
+                    failed.append((row, str(e)))
+                except SMTPConnectFailed:
+                    raise
+                except Exception as e:
+                    retry.append((row, str(e)))
+    except Exception as e:
+        # no connection (or no credentials); nothing else in the batch can go out
+        done = set(sent) | {row.email_id for row, _ in failed + retry}
+        requeue.extend(
+            (row, str(e)) for row in rows
+            if row.email_id in htmls and row.email_id in held and row.email_id not in done
+        )
+
+    now = datetime.utcnow()
+    table = EmailOutbox.__table__
+    try:
+        if sent:
+            db.session.execute(
+                update(table).where(table.c.email_id.in_(sent))
+                .values(status=EmailStatus.sent, sent_at=now, last_error=None)
+            )
+        for row, error in retry:
+            if row.attempts >= OUTBOX_MAX_ATTEMPTS:
+                failed.append((row, error))
+                continue
+            db.session.execute(
+                update(table).where(table.c.email_id == row.email_id).values(
+                    status=EmailStatus.pending,
+                    next_attempt_at=now + timedelta(seconds=_backoff(row.attempts)),
+                    last_error=error,
+                )
+            )
+        for row, error in requeue:
+            # the claim counted an attempt, but the email was never tried
+            db.session.execute(
+                update(table).where(table.c.email_id == row.email_id).values(
+                    status=EmailStatus.pending,
+                    attempts=row.attempts - 1,
+                    next_attempt_at=now + timedelta(seconds=OUTBOX_RETRY_BASE),
+                    last_error=error,
+                )
+            )
+        for row, error in failed:
+            db.session.execute(
+                update(table).where(table.c.email_id == row.email_id)
+                .values(status=EmailStatus.failed, last_error=error)
+            )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        # rows stay 'sending' and are re-claimed after OUTBOX_LEASE
+        raise RuntimeError(f"Could not record outbox results: {str(e)}")
+
+    if failed:
+        print(f"Outbox: {len(failed)} email(s) failed permanently")
+    return len(sent), len(failed)
+
+
+def drain_all(limit=None):
+    """Drain batches until no due email is left. Returns total (sent, failed).
+    """
+    total_sent = total_failed = 0
+    while True:
+        sent, failed = drain_outbox(limit)
+        total_sent += sent
+        total_failed += failed
+        if sent + failed == 0:
+            return total_sent, total_failed
+
+
+def outbox_counts():
+    """Return the number of outbox rows per status.
+    """
+    rows = db.session.execute(
+        text("SELECT status, count(*) FROM email_outbox GROUP BY status")
+    ).all()
+    return {status: count for status, count in rows}
+
+
+def start_outbox_worker():
+    """Drain the email outbox in the background.
+    """
+    from api.helpers.scheduler_helper import start_periodic
+
+    start_periodic("drain-email-outbox", OUTBOX_POLL_INTERVAL, drain_all)
@@ -0,0 +1,87 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import tuple_
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def get_page_size(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Parse a requested page size and clamp it to [1, maximum].
+    Falls back to the default when the value is missing or not a number.
+    """
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def parse_id_list(value, maximum=MAX_PAGE_SIZE):
+    """Parse a comma-separated list of ids such as "3,7,12" into unique ints.
+    Raises ValueError on a non-numeric id or more than `maximum` ids.
+    """
+    if not value:
+        return []
+    try:
+        ids = list(dict.fromkeys(int(part) for part in value.split(",") if part.strip()))
+    except ValueError:
+        raise ValueError("ids must be a comma-separated list of integers")
+    if len(ids) > maximum:
+        raise ValueError(f"At most {maximum} ids can be requested at once")
+    return ids
+
+
+def encode_cursor(*values):
+    """Encode the sort key of the last row on a page into an opaque cursor.
+    Datetimes and Decimals are stored as strings so the cursor is plain JSON.
+    """
+    payload = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, Decimal) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, *converters):
+    """Decode a cursor produced by encode_cursor into a tuple of values.
+    Each element is passed through the matching converter (e.g. datetime.fromisoformat, int).
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, list) or len(payload) != len(converters):
+            raise ValueError
+        return tuple(convert(v) for convert, v in zip(converters, payload))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def split_page(rows, page_size, key):
+    """Split a page fetched with LIMIT page_size + 1 into (rows, next_cursor).
+    key(row) returns the tuple of sort values to encode for the last row.
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor(*key(rows[-1]))
+
+
+def apply_keyset(query, sort_col, id_col, cursor, converter, descending=True):
+    """Order a query by (sort_col, id_col) and, given a cursor, keep only rows after it.
+    Both columns sort in the same direction so the row comparison can use one index scan.
+    Raises ValueError for a malformed cursor.
+    """
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, converter, int)
+        row = tuple_(sort_col, id_col)
+        query = query.filter(row < (last_value, last_id) if descending else row > (last_value, last_id))
+
+    if descending:
+        return query.order_by(sort_col.desc(), id_col.desc())
+    return query.order_by(sort_col.asc(), id_col.asc())
@@ -0,0 +1,134 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from api import app, bcrypt
+
+
+# threads that run bcrypt; keeps hashing from using every CPU during a login burst
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+
+# hashes allowed to wait for a worker before new ones are turned away with 503
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "16"))
+
+# seconds a request waits for its hash before giving up with 503
+PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
+
+
+class HashingBusy(RuntimeError):
+    """Raised when the hashing queue is full; routes answer 503 with Retry-After.
+    """
+
+
+class HashingTimeout(HashingBusy):
+    """Raised when a hash took longer than PASSWORD_HASH_TIMEOUT; answered like HashingBusy.
+    """
+
+
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_lock = threading.Lock()
+_stats = {"queued": 0, "in_flight": 0, "completed": 0, "rejected": 0, "timed_out": 0, "hash_seconds": 0.0}
+
+
+def _run(func, *args):
+    with _lock:
+        _stats["queued"] -= 1
+        _stats["in_flight"] += 1
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        with _lock:
+            _stats["in_flight"] -= 1
+            _stats["completed"] += 1
+            _stats["hash_seconds"] += time.perf_counter() - start
+
+
+def _submit(func, *args):
+    """Run func on the hashing executor and wait for it.
+    Raises HashingBusy if too many hashes are already waiting, and HashingTimeout if
+    the hash doesn't finish within PASSWORD_HASH_TIMEOUT.
+    """
+    with _lock:
+        if _stats["queued"] >= PASSWORD_HASH_QUEUE_LIMIT:
+            _stats["rejected"] += 1
+            raise HashingBusy("Too many sign-in requests right now, please try again shortly")
+        _stats["queued"] += 1
+    future = _executor.submit(_run, func, *args)
+    try:
+        return future.result(timeout=PASSWORD_HASH_TIMEOUT)
+    except FutureTimeoutError:
+        with _lock:
+            _stats["timed_out"] += 1
+            # a hash still waiting for a worker is dropped instead of run for nobody
+            if future.cancel():
+                _stats["queued"] -= 1
+        raise HashingTimeout("Sign-in is taking too long right now, please try again shortly")
+
+
+def log_rounds():
+    """Return the configured bcrypt cost (BCRYPT_LOG_ROUNDS).
+    """
+    return app.config["BCRYPT_LOG_ROUNDS"]
+
+
+def hash_password(password, rounds=None):
+    """Hash password with bcrypt at the configured cost, off the request thread.
+    Returns the hash as a str.
+    """
+    rounds = rounds or log_rounds()
+    return _submit(bcrypt.generate_password_hash, password, rounds).decode("utf-8")
+
+
+def check_password(password_hash, password):
+    """Check password against a bcrypt hash, off the request thread.
+    """
+    if not password_hash:
+        return False
+    return _submit(bcrypt.check_password_hash, password_hash, password)
+
+
+def hash_cost(password_hash):
+    """Return the cost a bcrypt hash was made with ("$2b$12$..." -> 12), or None.
+    """
+    try:
+        return int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def needs_rehash(password_hash):
+    """True if the hash was made with a different cost than the configured one.
+    """
+    return hash_cost(password_hash) != log_rounds()
+
+
+def rehash_if_needed(user, password):
+    """After a successful login, re-hash the password at the configured cost.
+    Commits on change; a failure is logged and never blocks the login.
+    """
+    from api import db
+
+    if not needs_rehash(user.password_hash):
+        return False
+    try:
+        user.setPasswordHash(password)
+        db.session.commit()
+        return True
+    except Exception as e:
+        db.session.rollback()
+        print(f"Could not rehash password for user {user.user_id}: {e}")
+        return False
+
+
+def hashing_stats():
+    """Return queue depth and throughput counters for the hashing executor.
+    """
+    with _lock:
+        stats = dict(_stats)
+    hash_seconds = stats.pop("hash_seconds")
+    stats["workers"] = PASSWORD_HASH_WORKERS
+    stats["queue_limit"] = PASSWORD_HASH_QUEUE_LIMIT
+    stats["log_rounds"] = log_rounds()
+    stats["avg_hash_ms"] = round(hash_seconds * 1000 / stats["completed"], 1) if stats["completed"] else None
+    return stats
@@ -1,7 +1,7 @@
 from api import db
-from api.models.cf_models import Donations, Campaigns, Payments, CampaignPaymentStatus, CampaignStatus, DonationStatus
+from api.models.cf_models import Donations, Payments, CampaignPaymentStatus, DonationStatus
+from api.helpers import leaderboard_helper, campaign_stats_helper, raised_amount_helper
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
 
 
 def create_payment(donation_id, amount, payment_method, payment_status):
@@ -18,11 +18,6 @@ def create_payment(donation_id, amount, payment_method, payment_status):
     if not donation:
         raise ValueError(f"Donation not found with id {donation_id}")
 
-    # CRITICAL: Check if payment already exists for this donation
-    existing_payment = Payments.query.filter_by(donation_id=donation_id).first()
-    if existing_payment:
-        raise ValueError(f"A payment already exists for donation {donation_id}. Cannot create duplicate payment.")
-
     if float(amount) != float(donation.amount):
         raise ValueError(f"Payment amount {amount} does not match donation amount {donation.amount}")
 
@@ -39,25 +34,29 @@ def create_payment(donation_id, amount, payment_method, payment_status):
 
     payment = Payments(
         donation_id=donation_id,
-        amount=amount,
         payment_method=payment_method,
         payment_status=payment_status,
     )
     db.session.add(payment)
 
-    if payment_status == CampaignPaymentStatus.COMPLETED:
-        donation.status = DonationStatus.COMPLETED
-
-        campaign = Campaigns.query.get(donation.campaign_id)
-        if not campaign:
-            db.session.rollback()
-            raise ValueError(f"Campaign not found for donation id {donation_id}")
+    # uq_payments_donation_id rejects a second payment for the donation, even from a concurrent request
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        raise ValueError(f"A payment already exists for donation {donation_id}. Cannot create duplicate payment.")
 
-        campaign.raised_amount += float(amount)
+    if payment_status == CampaignPaymentStatus.successful:
+        if campaign_stats_helper.is_new_donor(donation.user_id, donation.campaign_id, donation_id):
+            campaign_stats_helper.increment_counters(donation.campaign_id, donors=1)
+        donation.status = DonationStatus.completed
 
-        if campaign.raised_amount >= campaign.goal_amount:
-            campaign.raised_amount = campaign.goal_amount
-            campaign.status = CampaignStatus.COMPLETED
+        # single UPDATE ... RETURNING; rejects closed or over-goal donations and completes the campaign at the goal
+        try:
+            raised_amount = raised_amount_helper.add_to_raised(donation.campaign_id, amount)
+        except ValueError:
+            db.session.rollback()
+            raise
 
     try:
         db.session.commit()
@@ -68,6 +67,11 @@ def create_payment(donation_id, amount, payment_method, payment_status):
         db.session.rollback()
         raise RuntimeError(f"Could not create payment: {str(e)}")
 
+    if payment_status == CampaignPaymentStatus.successful:
+        leaderboard_helper.record_completed_donation(
+            donation.campaign_id, donation.user_id, amount, raised_amount
+        )
+
     return payment.to_dict()
 
 
@@ -130,36 +134,34 @@ def update_payment_status(payment_id, new_status):
 
     old_status = payment.payment_status
 
-    # CRITICAL: Prevent duplicate COMPLETED status updates
-    if old_status == CampaignPaymentStatus.COMPLETED and new_status == CampaignPaymentStatus.COMPLETED:
+    # CRITICAL: Prevent duplicate successful status updates
+    if old_status == CampaignPaymentStatus.successful and new_status == CampaignPaymentStatus.successful:
         return payment.to_dict()
     
-    # Prevent changing from COMPLETED to another status (would break accounting)
-    if old_status == CampaignPaymentStatus.COMPLETED and new_status != CampaignPaymentStatus.COMPLETED:
+    # Prevent changing from successful to another status (would break accounting)
+    if old_status == CampaignPaymentStatus.successful and new_status != CampaignPaymentStatus.successful:
         raise ValueError("Cannot change status of a completed payment. This would cause data inconsistency.")
     
     payment.payment_status = new_status
 
-    # When payment status changes to COMPLETED, update donation and campaign
-    if new_status == CampaignPaymentStatus.COMPLETED and old_status != CampaignPaymentStatus.COMPLETED:
+    # When payment status changes to successful, update donation and campaign
+    completing = new_status == CampaignPaymentStatus.successful and old_status != CampaignPaymentStatus.successful
+    if completing:
         donation = Donations.query.get(payment.donation_id)
         if not donation:
             db.session.rollback()
             raise ValueError(f"Donation not found for payment id {payment_id}")
 
-        donation.status = DonationStatus.COMPLETED
+        if campaign_stats_helper.is_new_donor(donation.user_id, donation.campaign_id, donation.donation_id):
+            campaign_stats_helper.increment_counters(donation.campaign_id, donors=1)
+        donation.status = DonationStatus.completed
 
-        campaign = Campaigns.query.get(donation.campaign_id)
-        if not campaign:
+        # single UPDATE ... RETURNING; rejects closed or over-goal donations and completes the campaign at the goal
+        try:
+            raised_amount = raised_amount_helper.add_to_raised(donation.campaign_id, donation.amount)
+        except ValueError:
             db.session.rollback()
-            raise ValueError(f"Campaign not found for donation id {donation.donation_id}")
-        
-        campaign.raised_amount += float(payment.amount)
-        
-        # Check if campaign goal is reached
-        if campaign.raised_amount >= campaign.goal_amount:
-            campaign.raised_amount = campaign.goal_amount
-            campaign.status = CampaignStatus.COMPLETED
+            raise
     
     try:
         db.session.commit()
@@ -167,6 +169,11 @@ def update_payment_status(payment_id, new_status):
         db.session.rollback()
         raise RuntimeError(f"Could not update payment status: {str(e)}")
 
+    if completing:
+        leaderboard_helper.record_completed_donation(
+            donation.campaign_id, donation.user_id, donation.amount, raised_amount
+        )
+
     return payment.to_dict()
 
 
@@ -182,7 +189,7 @@ def update_payment_method(payment_id, new_method):
         raise ValueError("Payment method cannot be empty.")
     
     # Prevent changing payment method after completion
-    if payment.payment_status == CampaignPaymentStatus.COMPLETED:
+    if payment.payment_status == CampaignPaymentStatus.successful:
         raise ValueError("Cannot change payment method of a completed payment.")
 
     payment.payment_method = new_method
@@ -203,7 +210,7 @@ def delete_payment(payment_id):
     if not payment:
         raise ValueError(f"Payment with payment id {payment_id} not found.")
 
-    if payment.payment_status == CampaignPaymentStatus.COMPLETED:
+    if payment.payment_status == CampaignPaymentStatus.successful:
         raise ValueError("Cannot delete a completed payment. This would cause data inconsistency.")
 
     try:
@@ -224,11 +231,11 @@ def get_total_payments():
 
 
 def get_total_payment_amount():
-    """Return the sum of amounts for COMPLETED payments only.
+    """Return the sum of amounts for successful payments only.
     Returns a dict with 'total_amount'.
     """
     total = db.session.query(db.func.sum(Donations.amount)).filter(
-        Payments.payment_status == CampaignPaymentStatus.COMPLETED
+        Payments.payment_status == CampaignPaymentStatus.successful
     ).scalar()
     return {"total_amount": float(total or 0)}
 
@@ -0,0 +1,154 @@
+import os
+import time
+import threading
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+# gunicorn threads per worker (keep in sync with the Dockerfile); each may hold a connection
+GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# connections the periodic tasks started in api/__init__.py can hold at once: one each for
+# refresh-stats, fold-raised-shards, purge-idempotency-keys, flush-like-deltas,
+# reconcile-comment-likes and drain-email-outbox, two for resume-fanouts
+PERIODIC_TASK_CONNECTIONS = 8
+
+# each fan-out worker holds two connections while it runs (see fanout_helper)
+FANOUT_CONNECTIONS = 2 * int(os.getenv("FANOUT_WORKERS", "1"))
+
+# background threads that may hold a connection at the same time (scheduler tasks, fan-out)
+DB_BACKGROUND_CONNECTIONS = int(
+    os.getenv("DB_BACKGROUND_CONNECTIONS", str(PERIODIC_TASK_CONNECTIONS + FANOUT_CONNECTIONS))
+)
+
+# pool size defaults to one connection per request thread plus the background ones
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(GUNICORN_THREADS + DB_BACKGROUND_CONNECTIONS)))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+
+# checkouts slower than this (ms) are counted as slow
+DB_SLOW_CHECKOUT_MS = int(os.getenv("DB_SLOW_CHECKOUT_MS", "100"))
+
+
+class PoolStats:
+    """Counters for one connection pool; updated by InstrumentedQueuePool and its events.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.peak_in_use = 0
+        self.peak_overflow = 0
+
+    def record_checkout(self, waited, in_use, overflow):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            if waited * 1000 >= DB_SLOW_CHECKOUT_MS:
+                self.slow_checkouts += 1
+            self.peak_in_use = max(self.peak_in_use, in_use)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(self.wait_seconds * 1000 / self.checkouts, 2) if self.checkouts else None,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "peak_in_use": self.peak_in_use,
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection and counts
+    checkouts that time out. Everything else is plain QueuePool behaviour.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        stats = self.stats = PoolStats()
+        event.listen(self, "connect", lambda dbapi_connection, record: stats.increment("connects"))
+        event.listen(self, "invalidate", lambda dbapi_connection, record, e: stats.increment("invalidations"))
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.increment("timeouts")
+            raise
+        self.stats.record_checkout(time.perf_counter() - start, self.checkedout(), max(self.overflow(), 0))
+        return connection
+
+
+def engine_options():
+    """Return SQLALCHEMY_ENGINE_OPTIONS built from the DB_POOL_* settings.
+    """
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+def check_pool_size():
+    """Print a warning at startup if the pool can't give every thread a connection.
+    Returns True if the configuration looks sufficient.
+    """
+    needed = GUNICORN_THREADS + DB_BACKGROUND_CONNECTIONS
+    available = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    if available < needed:
+        print(
+            f"WARNING: DB pool allows {available} connections (DB_POOL_SIZE={DB_POOL_SIZE} + "
+            f"DB_MAX_OVERFLOW={DB_MAX_OVERFLOW}) but {GUNICORN_THREADS} gunicorn threads and "
+            f"{DB_BACKGROUND_CONNECTIONS} background connections may need {needed}; "
+            f"requests will wait up to {DB_POOL_TIMEOUT}s for a connection"
+        )
+        return False
+    if DB_POOL_SIZE < GUNICORN_THREADS:
+        print(
+            f"WARNING: DB_POOL_SIZE={DB_POOL_SIZE} is below GUNICORN_THREADS={GUNICORN_THREADS}; "
+            f"busy periods will keep opening and closing overflow connections"
+        )
+    return True
+
+
+def pool_stats(engines):
+    """Return current occupancy and counters for each engine, e.g. {"primary": {...}}.
+    engines is a {name: engine} mapping such as db.engines.
+    """
+    stats = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        entry = {
+            "size": pool.size(),
+            "max_overflow": DB_MAX_OVERFLOW,
+            "timeout": DB_POOL_TIMEOUT,
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+        if isinstance(pool, InstrumentedQueuePool):
+            entry.update(pool.stats.snapshot())
+        stats[name or "primary"] = entry
+    return stats
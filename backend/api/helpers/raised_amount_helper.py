@@ -0,0 +1,216 @@
+import os
+import random
+from decimal import Decimal
+from api import db
+from api.models.cf_models import Campaigns, CampaignRaisedShards, CampaignStatus
+from sqlalchemy import update, select, case, func, literal, text
+from sqlalchemy.dialects.postgresql import insert
+
+
+# shard rows per sharded campaign; donations pick one of them at random
+RAISED_AMOUNT_SHARDS = int(os.getenv("RAISED_AMOUNT_SHARDS", "8"))
+
+# seconds between folds of shard totals into campaigns.raised_amount; 0 disables.
+# Reads go through Campaigns.raised_total, which adds the unfolded shards, so folding
+# only bounds how many shard amounts each read has to sum.
+SHARD_FOLD_INTERVAL = int(os.getenv("RAISED_SHARD_FOLD_INTERVAL", "10"))
+
+FOLD_SHARDS_SQL = text("""
+    WITH old AS (
+        SELECT campaign_id, shard, amount
+        FROM campaign_raised_shards
+        WHERE amount <> 0
+        FOR UPDATE
+    ),
+    moved AS (
+        UPDATE campaign_raised_shards s
+        SET amount = 0
+        FROM old
+        WHERE s.campaign_id = old.campaign_id AND s.shard = old.shard
+        RETURNING old.campaign_id, old.amount
+    ),
+    totals AS (
+        SELECT campaign_id, sum(amount) AS amount FROM moved GROUP BY campaign_id
+    )
+    UPDATE campaigns c
+    SET raised_amount = coalesce(c.raised_amount, 0) + t.amount,
+        status = CASE WHEN c.status = 'active' AND coalesce(c.raised_amount, 0) + t.amount >= c.goal_amount
+                      THEN 'completed' ELSE c.status END
+    FROM totals t
+    WHERE c.campaign_id = t.campaign_id
+""")
+
+UNSHARD_SQL = text("""
+    WITH moved AS (
+        DELETE FROM campaign_raised_shards WHERE campaign_id = :campaign_id RETURNING amount
+    )
+    UPDATE campaigns
+    SET raised_amount = coalesce(raised_amount, 0) + (SELECT coalesce(sum(amount), 0) FROM moved),
+        status = CASE WHEN status = 'active'
+                           AND coalesce(raised_amount, 0) + (SELECT coalesce(sum(amount), 0) FROM moved) >= goal_amount
+                      THEN 'completed' ELSE status END
+    WHERE campaign_id = :campaign_id
+""")
+
+
+def add_to_raised(campaign_id, amount):
+    """Add a completed donation's amount to a campaign and return the new raised total.
+    Runs on the caller's session without committing, as a single UPDATE ... RETURNING:
+    only active campaigns accept donations, a donation may not take the total past the
+    goal, and the switch to completed at the goal happens in the same statement, so
+    concurrent donations cannot lose updates. Sharded campaigns add to a random shard instead.
+    Raises ValueError if the campaign does not exist or rejects the donation.
+    """
+    amount = Decimal(str(amount))
+
+    raised = _add_to_shard(campaign_id, amount)
+    if raised is not None:
+        return raised
+
+    new_total = func.coalesce(Campaigns.raised_amount, 0) + amount
+    stmt = (
+        update(Campaigns)
+        .where(
+            Campaigns.campaign_id == campaign_id,
+            Campaigns.status == CampaignStatus.active,
+            new_total <= Campaigns.goal_amount,
+        )
+        .values(
+            raised_amount=new_total,
+            status=case(
+                (new_total >= Campaigns.goal_amount, literal(CampaignStatus.completed, Campaigns.status.type)),
+                else_=Campaigns.status,
+            ),
+        )
+        .returning(Campaigns.raised_amount)
+    )
+    raised = db.session.execute(stmt).scalar()
+    if raised is None:
+        _reject(campaign_id, amount)
+    return raised
+
+
+def _add_to_shard(campaign_id, amount):
+    """Add to one random shard; only that shard row is locked until commit.
+    The shard only takes the amount while the campaign is active and the aggregated
+    total stays within the goal. Donations on other shards are not serialized against
+    it, so concurrent ones can overshoot the goal by what is in flight.
+    Returns None if the campaign is not sharded, so the caller updates the campaign row.
+    """
+    shard = random.randrange(RAISED_AMOUNT_SHARDS)
+    accepting = (
+        select(Campaigns.campaign_id)
+        .where(
+            Campaigns.campaign_id == campaign_id,
+            Campaigns.status == CampaignStatus.active,
+            Campaigns.raised_total + amount <= Campaigns.goal_amount,
+        )
+        .exists()
+    )
+    # the row comes back either way, so a rejection needs no extra query to tell it
+    # apart from an unsharded campaign
+    accepted = db.session.execute(
+        update(CampaignRaisedShards)
+        .where(CampaignRaisedShards.campaign_id == campaign_id, CampaignRaisedShards.shard == shard)
+        .values(amount=CampaignRaisedShards.amount + case((accepting, amount), else_=0))
+        .returning(accepting)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    if accepted is None:
+        return None
+    if not accepted:
+        _reject(campaign_id, amount)
+
+    raised = get_raised_amount(campaign_id)
+    # only locks the campaign row on the donation that reaches the goal
+    db.session.execute(
+        update(Campaigns)
+        .where(
+            Campaigns.campaign_id == campaign_id,
+            Campaigns.status == CampaignStatus.active,
+            Campaigns.goal_amount <= raised,
+        )
+        .values(status=CampaignStatus.completed)
+        .execution_options(synchronize_session=False)
+    )
+    return raised
+
+
+def _reject(campaign_id, amount):
+    """Raise the ValueError explaining why a campaign did not take a donation.
+    """
+    row = db.session.execute(
+        select(Campaigns.status, Campaigns.raised_total, Campaigns.goal_amount)
+        .where(Campaigns.campaign_id == campaign_id)
+    ).one_or_none()
+    if row is None:
+        raise ValueError(f"Campaign not found with id {campaign_id}")
+    if row.status != CampaignStatus.active:
+        raise ValueError(f"Campaign {campaign_id} is {row.status.value} and not accepting donations")
+    remaining = row.goal_amount - row.raised_total
+    raise ValueError(f"Donation of {amount} exceeds the {remaining} campaign {campaign_id} still needs")
+
+
+def get_raised_amount(campaign_id):
+    """Return a campaign's raised total including any unfolded shard amounts.
+    Raises ValueError if the campaign does not exist.
+    """
+    raised = db.session.execute(
+        select(Campaigns.raised_total).where(Campaigns.campaign_id == campaign_id)
+    ).scalar()
+    if raised is None:
+        raise ValueError(f"Campaign not found with id {campaign_id}")
+    return raised
+
+
+def fold_raised_shards():
+    """Move every non-zero shard into campaigns.raised_amount.
+    Each campaign row is locked once per fold instead of once per donation.
+    Commits and returns the number of campaigns updated.
+    """
+    try:
+        result = db.session.execute(FOLD_SHARDS_SQL)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(f"Could not fold raised_amount shards: {str(e)}")
+    return result.rowcount
+
+
+def enable_sharding(campaign_id):
+    """Create RAISED_AMOUNT_SHARDS shard rows for a campaign so its donations stop
+    contending on one row. Safe to run again; existing shards keep their amounts.
+    """
+    if RAISED_AMOUNT_SHARDS < 1:
+        raise ValueError("RAISED_AMOUNT_SHARDS must be at least 1")
+    if not db.session.get(Campaigns, campaign_id):
+        raise ValueError(f"Campaign not found with id {campaign_id}")
+
+    stmt = insert(CampaignRaisedShards).values(
+        [{"campaign_id": campaign_id, "shard": shard, "amount": 0} for shard in range(RAISED_AMOUNT_SHARDS)]
+    ).on_conflict_do_nothing()
+    try:
+        db.session.execute(stmt)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(f"Could not shard campaign {campaign_id}: {str(e)}")
+
+
+def disable_sharding(campaign_id):
+    """Fold a campaign's shards into raised_amount and delete them in one statement.
+    """
+    try:
+        db.session.execute(UNSHARD_SQL, {"campaign_id": campaign_id})
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(f"Could not unshard campaign {campaign_id}: {str(e)}")
+
+
+def start_shard_folder():
+    """Fold shard totals every RAISED_SHARD_FOLD_INTERVAL seconds in the background.
+    """
+    from api.helpers.scheduler_helper import start_periodic
+
+    return start_periodic("fold-raised-shards", SHARD_FOLD_INTERVAL, fold_raised_shards)
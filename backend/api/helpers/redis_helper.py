@@ -0,0 +1,15 @@
+import redis
+from api.helpers.limiter import REDIS_URL
+
+
+_client = None
+
+
+def get_redis():
+    """Return a process-wide Redis client for REDIS_URL (the same server the rate limiter uses).
+    The client keeps its own connection pool, so it is safe to share between threads.
+    """
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    return _client
@@ -0,0 +1,132 @@
+import os
+import time
+import threading
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.expression import Select, TextClause
+
+
+# optional read replica; when unset every query goes to DATABASE_URL
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+# seconds a client's reads stay on the primary after it writes, so it sees its own changes
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
+REPLICA_BIND = "replica"
+STICKY_KEY = "db:sticky:{client}"
+READ_METHODS = ("GET", "HEAD")
+
+# used when Redis is unreachable; only covers writes made through this process
+_memory_sticky = {}
+_memory_lock = threading.Lock()
+
+
+def primary_db(f):
+    """Mark a get handler that writes, or must see the latest data, to always use the primary.
+    """
+    f.primary_db = True
+    return f
+
+
+def _is_read(clause):
+    """True for statements that are safe on a replica: plain SELECTs without row locks.
+    """
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+    if isinstance(clause, TextClause):
+        sql = clause.text.lstrip().lower()
+        return sql.startswith("select") and "for update" not in sql and "for share" not in sql
+    return False
+
+
+def _client_key():
+    """Identify the client for stickiness: the JWT user if present, otherwise the IP.
+    """
+    from api.helpers.security_helper import verify_jwt
+
+    auth_header = request.headers.get("Authorization", "")
+    if auth_header.startswith("Bearer "):
+        try:
+            return f"user:{verify_jwt(auth_header.split(' ')[1])['user_id']}"
+        except (ValueError, KeyError):
+            pass
+    return f"ip:{request.remote_addr}"
+
+
+def _recently_wrote(client):
+    try:
+        from api.helpers.redis_helper import get_redis
+        if get_redis().exists(STICKY_KEY.format(client=client)):
+            return True
+    except Exception:
+        pass
+    with _memory_lock:
+        return _memory_sticky.get(client, 0) > time.monotonic()
+
+
+def mark_recent_write(client):
+    """Keep client's reads on the primary for REPLICA_STICKY_SECONDS.
+    """
+    try:
+        from api.helpers.redis_helper import get_redis
+        get_redis().set(STICKY_KEY.format(client=client), 1, ex=REPLICA_STICKY_SECONDS)
+    except Exception as e:
+        print(f"Replica stickiness unavailable, remembering write in memory: {e}")
+        with _memory_lock:
+            _memory_sticky[client] = time.monotonic() + REPLICA_STICKY_SECONDS
+
+
+def _route_allows_replica():
+    if request.method not in READ_METHODS:
+        return False
+    view = current_app.view_functions.get(request.endpoint)
+    view_class = getattr(view, "view_class", None)
+    handler = getattr(view_class, request.method.lower(), None) if view_class else view
+    if handler is None or getattr(handler, "primary_db", False):
+        return False
+    return not _recently_wrote(_client_key())
+
+
+def use_replica():
+    """True if reads in the current request may go to the replica. Decided once per request.
+    """
+    if not has_request_context():
+        return False
+    if "use_replica" not in g:
+        g.use_replica = _route_allows_replica()
+    return g.use_replica
+
+
+def read_engine():
+    """Engine for a read-only query run outside the session (exports, streaming).
+    """
+    from api import db
+
+    replica = db.engines.get(REPLICA_BIND) if DATABASE_REPLICA_URL else None
+    return replica if replica is not None and use_replica() else db.engine
+
+
+class RoutingSession(Session):
+    """Sends SELECTs from read-only get handlers to the replica and everything else to
+    the primary. Once a request writes, the rest of its reads use the primary too.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            if _is_read(clause) and not self._flushing and use_replica():
+                replica = self._db.engines.get(REPLICA_BIND)
+                if replica is not None:
+                    return replica
+            elif clause is not None and not _is_read(clause):
+                g.use_replica = False
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def init_replica_routing(app):
+    """Register the hook that makes a client's next reads sticky to the primary after a write.
+    """
+    @app.after_request
+    def remember_writes(response):
+        if request.method not in READ_METHODS + ("OPTIONS",) and response.status_code < 400:
+            mark_recent_write(_client_key())
+        return response
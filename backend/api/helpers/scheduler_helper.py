@@ -0,0 +1,55 @@
+import os
+import sys
+import threading
+from api import app, db
+
+
+# false keeps one-off processes (scripts, cron jobs) from starting the periodic tasks
+BACKGROUND_WORKERS = os.getenv("BACKGROUND_WORKERS", "true").lower() == "true"
+
+_started = {}
+_lock = threading.Lock()
+
+
+def background_workers_enabled():
+    """False when BACKGROUND_WORKERS=false or under a flask CLI command other than run
+    (flask db upgrade, flask refresh-stats, ...), which exit once the command is done.
+    """
+    if not BACKGROUND_WORKERS:
+        return False
+    # "python -m flask" puts .../flask/__main__.py in argv[0]
+    program = sys.argv[0]
+    if program.endswith("__main__.py"):
+        program = os.path.dirname(program)
+    if os.path.basename(program) in ("flask", "flask.exe"):
+        return "run" in sys.argv[1:]
+    return True
+
+
+def start_periodic(name, interval, func):
+    """Run func every `interval` seconds on a daemon thread inside an app context.
+    Each name is started at most once per process; interval <= 0 disables the task.
+    Exceptions are printed and the loop keeps going. Returns the stop Event, or None.
+    """
+    if interval <= 0 or not background_workers_enabled():
+        return None
+
+    with _lock:
+        if name in _started:
+            return _started[name]
+        stop = threading.Event()
+        _started[name] = stop
+
+    def run():
+        while not stop.wait(interval):
+            with app.app_context():
+                try:
+                    func()
+                except Exception as e:
+                    print(f"Scheduled task '{name}' failed: {e}")
+                finally:
+                    db.session.remove()
+
+    thread = threading.Thread(target=run, name=f"periodic-{name}", daemon=True)
+    thread.start()
+    return stop
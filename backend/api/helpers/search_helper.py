@@ -0,0 +1,93 @@
+from api import db
+from api.models.cf_models import Users, Campaigns, CampaignCategory, CampaignStatus
+from api.helpers.pagination_helper import decode_cursor, split_page
+from sqlalchemy import Double, cast, func, tuple_
+
+
+SEARCH_CONFIG = "english"
+
+
+def build_search_query(text):
+    """Turn user input into a tsquery using web-search syntax ("quoted phrases", -exclusions, OR).
+    Never raises on malformed input, unlike to_tsquery.
+    """
+    return func.websearch_to_tsquery(SEARCH_CONFIG, text)
+
+
+def search_campaigns(text, category=None, status=None, limit=20, cursor=None):
+    """Full-text search over campaign titles and descriptions, ranked by ts_rank.
+    Titles are weighted above descriptions by the search_vector column. Results are
+    keyset-paginated over (rank, campaign_id); returns (rows, next_cursor).
+    Raises ValueError for an empty query, bad filters or a malformed cursor.
+    """
+    text = (text or "").strip()
+    if not text:
+        raise ValueError("Search query cannot be empty")
+
+    tsquery = build_search_query(text)
+    # ts_rank is float4; the cursor holds a Python float, so compare both as float8
+    rank = cast(func.ts_rank(Campaigns.search_vector, tsquery), Double).label("rank")
+
+    query = (
+        db.session.query(
+            Campaigns.campaign_id,
+            Campaigns.title,
+            Campaigns.description,
+            Campaigns.category,
+            Campaigns.goal_amount,
+            Campaigns.raised_total.label("raised_amount"),
+            Campaigns.status,
+            Campaigns.created_at,
+            Campaigns.image,
+            Users.username.label("creator_name"),
+            rank,
+        )
+        .join(Users, Campaigns.creator_id == Users.user_id)
+        .filter(Campaigns.search_vector.op("@@")(tsquery))
+    )
+
+    if category:
+        try:
+            query = query.filter(Campaigns.category == CampaignCategory(category.strip().lower()))
+        except ValueError:
+            raise ValueError(f"Invalid category '{category}'")
+
+    if status:
+        try:
+            status_enum = CampaignStatus(status.strip().lower())
+        except ValueError:
+            raise ValueError(f"Invalid status '{status}'")
+        if status_enum == CampaignStatus.pending:
+            raise ValueError("Pending campaigns are not searchable")
+        query = query.filter(Campaigns.status == status_enum)
+    else:
+        query = query.filter(Campaigns.status != CampaignStatus.pending)
+
+    if cursor:
+        last_rank, last_id = decode_cursor(cursor, float, int)
+        query = query.filter(tuple_(rank, Campaigns.campaign_id) < (last_rank, last_id))
+
+    rows = (
+        query.order_by(rank.desc(), Campaigns.campaign_id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    return split_page(rows, limit, lambda r: (r.rank, r.campaign_id))
+
+
+def search_result_to_dict(row):
+    """Serialize a row returned by search_campaigns for the API response.
+    """
+    return {
+        "campaign_id": row.campaign_id,
+        "title": row.title,
+        "description": row.description,
+        "category": row.category.value,
+        "goal_amount": float(row.goal_amount) if row.goal_amount else 0.0,
+        "raised_amount": float(row.raised_amount) if row.raised_amount else 0.0,
+        "status": row.status.value,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "image": row.image,
+        "creator_name": row.creator_name,
+        "rank": round(float(row.rank), 6),
+    }
@@ -1,7 +1,7 @@
 import jwt
 import datetime
 from functools import wraps
-from flask import current_app, request, jsonify
+from flask import current_app, request
 
 
 def generate_jwt(user_id, username, role):
@@ -49,6 +49,7 @@ def jwt_required(f):
         try:
             payload = verify_jwt(token)
             g.user_id = payload["user_id"]  # store in flask.g
+            g.jwt_claims = payload  # read through identity_helper
             return f(*args, **kwargs)
         except ValueError as e:
             return {"status": "error", "message": str(e)}, 401
@@ -61,7 +62,7 @@ def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         """Decorator to enforce admin role; checks flask_login then JWT.
-        Returns 401/403 if authorization fails.
+        Returns 401/403 as a plain dict, so it works on Flask views and flask-restx Resources.
         """
         try:
             from flask_login import current_user
@@ -76,20 +77,17 @@ def admin_required(f):
 
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
-            return (
-                jsonify({"status": "error", "message": "Authorization header missing"}),
-                401,
-            )
+            return {"status": "error", "message": "Authorization header missing"}, 401
 
         token = auth_header.split(" ")[1]
 
         try:
             payload = verify_jwt(token)
             if payload.get("role") != "admin":
-                return jsonify({"status": "error", "message": "Admins only"}), 403
+                return {"status": "error", "message": "Admins only"}, 403
             return f(*args, **kwargs)
         except ValueError as e:
-            return jsonify({"status": "error", "message": str(e)}), 401
+            return {"status": "error", "message": str(e)}, 401
 
     return decorated_function
 
@@ -98,7 +96,7 @@ def creator_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         """Decorator to enforce creator role; checks flask_login then JWT.
-        Returns 401/403 if authorization fails.
+        Returns 401/403 as a plain dict, so it works on Flask views and flask-restx Resources.
         """
         try:
             from flask_login import current_user
@@ -113,19 +111,16 @@ def creator_required(f):
 
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
-            return (
-                jsonify({"status": "error", "message": "Authorization header missing"}),
-                401,
-            )
+            return {"status": "error", "message": "Authorization header missing"}, 401
 
         token = auth_header.split(" ")[1]
 
         try:
             payload = verify_jwt(token)
             if payload.get("role") != "creator":
-                return jsonify({"status": "error", "message": "Creators only"}), 403
+                return {"status": "error", "message": "Creators only"}, 403
             return f(*args, **kwargs)
         except ValueError as e:
-            return jsonify({"status": "error", "message": str(e)}), 401
+            return {"status": "error", "message": str(e)}, 401
 
     return decorated_function
@@ -0,0 +1,128 @@
+from api.models.cf_models import Campaigns, Comments, Donations, Users
+from sqlalchemy import Date, DateTime, Enum, Numeric
+
+
+def to_iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def to_float(value):
+    return float(value) if value is not None else None
+
+
+def to_amount(value):
+    # money columns the listings always showed as 0.0 when NULL
+    return float(value) if value is not None else 0.0
+
+
+def to_value(value):
+    return value.value if value is not None else None
+
+
+def to_count(value):
+    return value or 0
+
+
+def default_converter(column):
+    """Pick the converter a to_dict() would apply for the column's SQL type.
+    Returns None when the value can be used as-is.
+    """
+    column_type = getattr(column, "type", None)
+    if isinstance(column_type, (DateTime, Date)):
+        return to_iso
+    if isinstance(column_type, Numeric):
+        return to_float
+    if isinstance(column_type, Enum):
+        return to_value
+    return None
+
+
+def compile_columns(*fields):
+    """Compile a row -> dict function for a column-tuple query.
+    Each field is (key, column) or (key, column, converter); a dotted key such as
+    "creator.user_id" nests the value. Returns (columns, serialize): select the
+    columns, then call serialize on each row. The function is generated once, so
+    per row it only does positional lookups and the converters that are needed.
+    """
+    columns = []
+    converters = {}
+    tree = {}
+
+    for index, field in enumerate(fields):
+        key, column = field[0], field[1]
+        converter = field[2] if len(field) > 2 else default_converter(column)
+
+        columns.append(column.label(key.replace(".", "_")))
+        expr = f"row[{index}]"
+        if converter is not None:
+            name = f"_c{index}"
+            converters[name] = converter
+            expr = f"{name}({expr})"
+
+        node = tree
+        *parents, leaf = key.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = expr
+
+    def literal(node):
+        items = ", ".join(
+            f"{key!r}: {literal(value) if isinstance(value, dict) else value}"
+            for key, value in node.items()
+        )
+        return "{" + items + "}"
+
+    source = f"def serialize(row):\n    return {literal(tree)}\n"
+    namespace = dict(converters)
+    exec(compile(source, "<serializer>", "exec"), namespace)
+    return columns, namespace["serialize"]
+
+
+def serialize_rows(serialize, rows):
+    """Apply a compiled serializer to every row of a result.
+    """
+    return list(map(serialize, rows))
+
+
+# Same shapes as the models' to_dict(); each query must join the tables the fields use.
+
+CAMPAIGN_COLUMNS, serialize_campaign = compile_columns(
+    ("campaign_id", Campaigns.campaign_id),
+    ("title", Campaigns.title),
+    ("description", Campaigns.description),
+    ("category", Campaigns.category),
+    ("goal_amount", Campaigns.goal_amount, to_amount),
+    ("raised_amount", Campaigns.raised_total, to_amount),
+    ("image", Campaigns.image),
+    ("status", Campaigns.status),
+    ("start_date", Campaigns.start_date),
+    ("end_date", Campaigns.end_date),
+    ("created_at", Campaigns.created_at),
+    ("creator.user_id", Users.user_id),
+    ("creator.username", Users.username),
+    ("creator.profile_image", Users.profile_image),
+)
+
+COMMENT_COLUMNS, serialize_comment = compile_columns(
+    ("comment_id", Comments.comment_id),
+    ("content", Comments.content),
+    ("likes", Comments.likes),
+    ("created_at", Comments.created_at),
+    ("user.user_id", Users.user_id),
+    ("user.username", Users.username),
+    ("user.profile_image", Users.profile_image),
+    ("campaign.campaign_id", Campaigns.campaign_id),
+    ("campaign.title", Campaigns.title),
+)
+
+DONATION_COLUMNS, serialize_donation = compile_columns(
+    ("donation_id", Donations.donation_id),
+    ("amount", Donations.amount),
+    ("created_at", Donations.created_at),
+    ("status", Donations.status),
+    ("user.user_id", Users.user_id),
+    ("user.username", Users.username),
+    ("user.profile_image", Users.profile_image),
+    ("campaign.campaign_id", Campaigns.campaign_id),
+    ("campaign.title", Campaigns.title),
+)
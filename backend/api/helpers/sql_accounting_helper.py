@@ -0,0 +1,121 @@
+import os
+import time
+from collections import Counter
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# count statements and DB time per request; false disables all of this module
+SQL_ACCOUNTING = os.getenv("SQL_ACCOUNTING", "true").lower() == "true"
+
+# add a Server-Timing header (db, app) to every response
+SQL_SERVER_TIMING = os.getenv("SQL_SERVER_TIMING", "true").lower() == "true"
+
+# the same statement shape run this many times in one request is reported as N+1
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+# requests that run more statements than this are reported even without repeats; 0 disables
+SQL_MAX_STATEMENTS = int(os.getenv("SQL_MAX_STATEMENTS", "50"))
+
+
+class RequestSqlStats:
+    """Statements run during one request: count, DB time and how often each shape repeated.
+    Statements are already parameterised by the driver, so a shape is the SQL text itself.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement, seconds):
+        self.statements += 1
+        self.seconds += seconds
+        self.shapes[statement] += 1
+
+    def repeated(self, threshold=SQL_N_PLUS_ONE_THRESHOLD):
+        """Return [(count, statement)] for shapes run at least threshold times, worst first.
+        """
+        return [(count, sql) for sql, count in self.shapes.most_common() if count >= threshold]
+
+
+def current_sql_stats():
+    """Return the RequestSqlStats for this request, or None outside a request.
+    """
+    if not has_request_context():
+        return None
+    return g.get("sql_stats")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("sql_accounting_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("sql_accounting_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = current_sql_stats()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute never fires for a failed statement; drop its start time
+    try:
+        starts = exception_context.connection.info.get("sql_accounting_start")
+    except Exception:
+        return  # no connection, or it was invalidated along with its info
+    if starts:
+        starts.pop()
+
+
+def _shorten(statement, length=200):
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= length else statement[:length] + "..."
+
+
+def _report(stats):
+    """Print N+1 offenders and statement-heavy requests with the route that ran them.
+    """
+    route = f"{request.method} {request.path} ({request.endpoint})"
+    for count, statement in stats.repeated():
+        print(f"N+1 suspected: {route} ran the same statement {count}x: {_shorten(statement)}")
+    if SQL_MAX_STATEMENTS and stats.statements > SQL_MAX_STATEMENTS:
+        print(f"Query-heavy request: {route} ran {stats.statements} statements "
+              f"in {stats.seconds * 1000:.1f} ms")
+
+
+def init_sql_accounting(app):
+    """Listen to every engine's cursor events and account statements per request.
+    """
+    if not SQL_ACCOUNTING:
+        return
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+    @app.before_request
+    def start_sql_accounting():
+        g.sql_stats = RequestSqlStats()
+
+    @app.after_request
+    def finish_sql_accounting(response):
+        stats = g.pop("sql_stats", None)
+        if stats is None:
+            return response
+        _report(stats)
+        if SQL_SERVER_TIMING:
+            total_ms = (time.perf_counter() - stats.started) * 1000
+            db_ms = stats.seconds * 1000
+            response.headers["Server-Timing"] = (
+                f'db;dur={db_ms:.1f};desc="{stats.statements} queries", '
+                f"app;dur={max(total_ms - db_ms, 0):.1f}"
+            )
+            # lets the cross-origin frontend see the timings in devtools
+            response.headers["Timing-Allow-Origin"] = "*"
+        return response
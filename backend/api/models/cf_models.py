@@ -1,7 +1,10 @@
 from datetime import datetime
 from enum import Enum
 from flask_sqlalchemy import SQLAlchemy
-from api import bcrypt
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import TSVECTOR, JSONB
+from sqlalchemy.orm import column_property
+from api.helpers.password_helper import hash_password, check_password
 from api import db, app
 
 user_comment_likes = db.Table(
@@ -46,6 +49,13 @@ class CampaignPaymentStatus(Enum):
     refunded = "refunded"
 
 
+class EmailStatus(Enum):
+    pending = "pending"
+    sending = "sending"
+    sent = "sent"
+    failed = "failed"
+
+
 class Users(db.Model):
     __tablename__ = "users"
 
@@ -69,10 +79,10 @@ class Users(db.Model):
     )
 
     def setPasswordHash(self, password):
-        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password_hash = hash_password(password)
 
     def checkHashedPassword(self, password):
-        return bcrypt.check_password_hash(self.password_hash, password)
+        return check_password(self.password_hash, password)
 
     def to_dict(self):
         return {    
@@ -92,6 +102,13 @@ class Users(db.Model):
 
 class Campaigns(db.Model):
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # keyset pagination of the public listing: ORDER BY created_at DESC, campaign_id DESC
+        db.Index("ix_campaigns_created_at_campaign_id", "created_at", "campaign_id"),
+        db.Index("ix_campaigns_search_vector", "search_vector", postgresql_using="gin"),
+        db.Index("ix_campaigns_status_created_at", "status", "created_at"),
+        db.Index("ix_campaigns_creator_id_status", "creator_id", "status"),
+    )
 
     campaign_id = db.Column(db.Integer, primary_key=True)
     creator_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
@@ -108,6 +125,15 @@ class Campaigns(db.Model):
     updated_at = db.Column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # maintained by Postgres on every insert/update; title ranks above description
+    search_vector = db.Column(
+        TSVECTOR,
+        db.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    )
 
     creator = db.relationship(
         "Users",
@@ -137,7 +163,7 @@ class Campaigns(db.Model):
             "description": self.description,
             "category": self.category.value,
             "goal_amount": float(self.goal_amount),
-            "raised_amount": float(self.raised_amount),
+            "raised_amount": float(self.raised_total),
             "image": self.image,
             "status": self.status.value,
             "start_date": self.start_date.isoformat() if self.start_date else None,
@@ -155,8 +181,66 @@ class Campaigns(db.Model):
         }
 
 
+class CampaignStats(db.Model):
+    """Denormalized per-campaign counters, kept in step by the donation, comment and
+    follow write paths (see campaign_stats_helper) and repaired by `flask reconcile-stats`.
+    """
+    __tablename__ = "campaign_stats"
+
+    campaign_id = db.Column(
+        db.Integer, db.ForeignKey("campaigns.campaign_id", ondelete="CASCADE"), primary_key=True
+    )
+    donor_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    comment_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    follower_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    campaign = db.relationship(
+        "Campaigns",
+        backref=db.backref("stats", uselist=False, lazy=True, cascade="all, delete-orphan"),
+    )
+
+    def to_dict(self):
+        return {
+            "donor_count": self.donor_count,
+            "comment_count": self.comment_count,
+            "follower_count": self.follower_count,
+        }
+
+
+class CampaignRaisedShards(db.Model):
+    """Opt-in sharded counter for a hot campaign's raised_amount. Donations add to a
+    random shard instead of locking the campaign row; shards are folded back into
+    campaigns.raised_amount periodically and added on read by Campaigns.raised_total
+    (see raised_amount_helper).
+    """
+    __tablename__ = "campaign_raised_shards"
+
+    campaign_id = db.Column(
+        db.Integer, db.ForeignKey("campaigns.campaign_id", ondelete="CASCADE"), primary_key=True
+    )
+    shard = db.Column(db.SmallInteger, primary_key=True)
+    amount = db.Column(db.Numeric(12, 2), nullable=False, default=0, server_default="0")
+
+
+# raised_amount plus any shard amounts not folded yet; reads use this so a sharded
+# campaign's total is current between folds
+Campaigns.raised_total = column_property(
+    func.coalesce(Campaigns.raised_amount, 0)
+    + select(func.coalesce(func.sum(CampaignRaisedShards.amount), 0))
+    .where(CampaignRaisedShards.campaign_id == Campaigns.campaign_id)
+    .correlate_except(CampaignRaisedShards)
+    .scalar_subquery()
+)
+
+
 class Comments(db.Model):
     __tablename__ = "comments"
+    __table_args__ = (
+        db.Index("ix_comments_campaign_id_created_at", "campaign_id", "created_at"),
+    )
     
     
     comment_id = db.Column(db.Integer, primary_key=True)
@@ -204,6 +288,12 @@ class Comments(db.Model):
 
 class Payments(db.Model):
     __tablename__ = "payments"
+    __table_args__ = (
+        # keyset pagination of the admin ledger: ORDER BY transaction_date DESC, payment_id DESC
+        db.Index("ix_payments_transaction_date_payment_id", "transaction_date", "payment_id"),
+        # one payment per donation, enforced by the insert itself rather than a prior SELECT
+        db.UniqueConstraint("donation_id", name="uq_payments_donation_id"),
+    )
 
     payment_id = db.Column(db.Integer, primary_key=True)
     donation_id = db.Column(
@@ -237,6 +327,10 @@ class Payments(db.Model):
 
 class Donations(db.Model):
     __tablename__ = "donations"
+    __table_args__ = (
+        db.Index("ix_donations_campaign_id_status", "campaign_id", "status"),
+        db.Index("ix_donations_user_id_created_at", "user_id", "created_at"),
+    )
 
     donation_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
@@ -276,6 +370,11 @@ class Donations(db.Model):
 
 class Follows(db.Model):
     __tablename__ = "follows"
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "campaign_id", name="uq_follows_user_id_campaign_id"),
+        # follower fan-out streams WHERE campaign_id = ? AND user_id > ? ORDER BY user_id
+        db.Index("ix_follows_campaign_id_user_id", "campaign_id", "user_id"),
+    )
 
     follow_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
@@ -318,6 +417,9 @@ class CampaignUpdates(db.Model):
     )
     content = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # follower fan-out progress: last follower user_id notified, and when it finished
+    notified_through = db.Column(db.Integer)
+    notified_at = db.Column(db.DateTime)
 
     def to_dict(self):
         return {
@@ -332,6 +434,14 @@ class CampaignUpdates(db.Model):
         }
 
 
+# fan-out sweeper: WHERE notified_at IS NULL ORDER BY created_at
+db.Index(
+    "ix_campaign_updates_pending_fanout",
+    CampaignUpdates.created_at,
+    postgresql_where=CampaignUpdates.notified_at.is_(None),
+)
+
+
 class AdminReviews(db.Model):
     __tablename__ = "admin_reviews"
 
@@ -368,6 +478,57 @@ class AdminReviews(db.Model):
         }
 
 
+# latest review per campaign: WHERE campaign_id = ? ORDER BY created_at DESC LIMIT 1
+db.Index(
+    "ix_admin_reviews_campaign_id_created_at",
+    AdminReviews.campaign_id,
+    AdminReviews.created_at.desc(),
+)
+
+
+class IdempotencyKeys(db.Model):
+    """Responses of POST requests sent with an Idempotency-Key header, kept until
+    expires_at so client retries get the original response (see idempotency_helper).
+    """
+    __tablename__ = "idempotency_keys"
+
+    key = db.Column(db.String(300), primary_key=True)
+    request_hash = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer)
+    response = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    # while status_code is NULL the request is in progress; after this a retry may take over
+    locked_until = db.Column(db.DateTime)
+
+
+class EmailOutbox(db.Model):
+    """Emails waiting to be sent. Rows are added in the same transaction as the change
+    that triggers them and delivered by the outbox worker (see outbox_helper).
+    """
+    __tablename__ = "email_outbox"
+
+    email_id = db.Column(db.BigInteger, primary_key=True)
+    recipient = db.Column(db.String(255), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    template_name = db.Column(db.String(100), nullable=False)
+    context = db.Column(JSONB, nullable=False, default=dict)
+    status = db.Column(db.Enum(EmailStatus), nullable=False, default=EmailStatus.pending)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = db.Column(db.DateTime)
+
+
+# worker claim: WHERE status IN ('pending', 'sending') AND next_attempt_at <= ? ORDER BY next_attempt_at
+db.Index(
+    "ix_email_outbox_status_next_attempt_at",
+    EmailOutbox.status,
+    EmailOutbox.next_attempt_at,
+)
+
+
 #class ChatHistory(db.Model):
 #    __tablename__ = "chat_history"
 #
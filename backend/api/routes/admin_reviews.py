@@ -3,7 +3,8 @@ from flask import  request
 from api import db,admin_reviews_ns
 from api.models.cf_models import Campaigns, Users,Comments,AdminReviews,CampaignStatus
 from api.fields.adminReviewsFields import admin_reviews_data
-from email_service.email_sender import send_email
+from api.helpers.outbox_helper import enqueue_email
+from api.helpers import leaderboard_helper
 from ..helpers.limiter import limiter
 
 
@@ -47,32 +48,31 @@ class CampaignStatusHandler(Resource):
             db.session.add(review)
 
             campaign.status = status_enum
+
+            # queued in the same transaction; the outbox worker sends it after commit
+            creator = campaign.creator
+            if decision == 'rejected':
+                enqueue_email(
+                    creator.email,
+                    "Campaign Rejected",
+                    "campaign_rejected.html",
+                    comments=comments,
+                    username=creator.username,
+                    campaign_name=campaign.title
+                )
+            else:
+                enqueue_email(
+                    creator.email,
+                    "Campaign Approved",
+                    "campaign_approved.html",
+                    username=creator.username,
+                    campaign_name=campaign.title,
+                    platform_name="CrowdFunding"
+                )
             db.session.commit()
-            
-            try:
-                creator_email = campaign.creator.email
-                if (decision == 'rejected'):
-                    send_email(
-                        receiver_email=creator_email,
-                        subject="Campaign Rejected",
-                        template_name="campaign_rejected.html",
-                        comments= comments,
-                        username= campaign.creator.username,
-                        campaign_name=campaign.title
-                    )
-                else:
-                    send_email(
-                        receiver_email=creator_email,
-                        subject="Campaign Approved",
-                        template_name="campaign_approved.html",
-                        username= campaign.creator.username,
-                        campaign_name=campaign.title,
-                        platform_name= "CrowdFunding"
-                    )
-            except Exception:
-                pass
-                
-            
+
+            leaderboard_helper.sync_campaign_status(campaign.campaign_id, status_enum)
+
             return {
                 "status": "success",
                 "message": "Campaign status updated and review saved",
@@ -9,59 +9,89 @@ from api.models.cf_models import (
     Payments,
     UserRole,
     Donations,
-    CampaignUpdates,AdminReviews
+    CampaignUpdates,AdminReviews,
+    # aliased: the /stats Resource below is also named CampaignStats
+    CampaignStats as CampaignStatsModel
 )
 from flask import jsonify, request
 from api import db, campaigns_ns
 from api.models.cf_models import Campaigns, Users
 from sqlalchemy.orm import joinedload
-from sqlalchemy import func, text
+from sqlalchemy import func, text, tuple_, select, true
 from datetime import datetime
-from ..helpers import campaign_helper
+from decimal import Decimal, InvalidOperation
+from ..helpers import (
+    campaign_helper,
+    search_helper,
+    admin_report_helper,
+    admin_stats_helper,
+    leaderboard_helper,
+    like_helper,
+    fanout_helper,
+)
+from api.helpers.pagination_helper import get_page_size, decode_cursor, split_page, apply_keyset
+from api.helpers.serializer_helper import compile_columns, serialize_rows, to_amount, to_count
 from flask import g
 from api.helpers.security_helper import jwt_required
+from api.helpers.identity_helper import current_role, current_user_id
+
+LISTING_COLUMNS, serialize_listing_row = compile_columns(
+    ("campaign_id", Campaigns.campaign_id),
+    ("title", Campaigns.title),
+    ("description", Campaigns.description),
+    ("category", Campaigns.category),
+    ("goal_amount", Campaigns.goal_amount, to_amount),
+    ("raised_amount", Campaigns.raised_total, to_amount),
+    ("status", Campaigns.status),
+    ("created_at", Campaigns.created_at),
+    ("updated_at", Campaigns.updated_at),
+    ("creator_name", Users.username),
+    ("image", Campaigns.image),
+    ("donor_count", CampaignStatsModel.donor_count, to_count),
+    ("comment_count", CampaignStatsModel.comment_count, to_count),
+    ("follower_count", CampaignStatsModel.follower_count, to_count),
+)
 
 @campaigns_ns.route('/') # AllCampaigns.jsx
 class AllCampaigns(Resource):
     def get(self):
-        """Get all campaigns with their creator's name"""
+        """Get campaigns with their creator's name, newest first.
+        Keyset-paginated over (created_at, campaign_id); pass ?cursor=<next_cursor> for the next page.
+        """
         try:
-            campaigns = (
-                db.session.query(
-                    Campaigns.campaign_id,
-                    Campaigns.title,
-                    Campaigns.description,
-                    Campaigns.category,
-                    Campaigns.goal_amount,
-                    Campaigns.raised_amount,
-                    Campaigns.status,
-                    Campaigns.created_at,
-                    Campaigns.updated_at,
-                    Campaigns.image,
-                    Users.username.label("creator_name")
-                )
+            limit = get_page_size(request.args.get("limit"))
+            cursor = request.args.get("cursor")
+
+            query = (
+                db.session.query(*LISTING_COLUMNS)
+                .select_from(Campaigns)
                 .join(Users, Campaigns.creator_id == Users.user_id)
+                .outerjoin(CampaignStatsModel, CampaignStatsModel.campaign_id == Campaigns.campaign_id)
                 .filter(Campaigns.status != 'pending')
+            )
+
+            if cursor:
+                try:
+                    last_created_at, last_id = decode_cursor(cursor, datetime.fromisoformat, int)
+                except ValueError as ve:
+                    return {"success": False, "error": str(ve)}, 400
+                query = query.filter(
+                    tuple_(Campaigns.created_at, Campaigns.campaign_id) < (last_created_at, last_id)
+                )
+
+            rows = (
+                query.order_by(Campaigns.created_at.desc(), Campaigns.campaign_id.desc())
+                .limit(limit + 1)
                 .all()
             )
-            
-            campaigns_list = [{
-                "campaign_id": c.campaign_id,
-                "title": c.title,
-                "description": c.description,
-                "category": c.category.value if hasattr(c.category, "value") else c.category,
-                "goal_amount": float(c.goal_amount) if c.goal_amount else 0.0,
-                "raised_amount": float(c.raised_amount) if c.raised_amount else 0.0,
-                "status": c.status.value if hasattr(c.status, "value") else c.status,
-                "created_at": c.created_at.isoformat() if c.created_at else None,
-                "updated_at": c.updated_at.isoformat() if c.updated_at else None,
-                "creator_name": c.creator_name,
-                "image": c.image
-            } for c in campaigns]
+            campaigns, next_cursor = split_page(rows, limit, lambda c: (c.created_at, c.campaign_id))
+
+            campaigns_list = serialize_rows(serialize_listing_row, campaigns)
 
             response = {
                 "success": True,
-                "campaigns": campaigns_list
+                "campaigns": campaigns_list,
+                "next_cursor": next_cursor
             }
 
             return response, 200
@@ -71,6 +101,32 @@ class AllCampaigns(Resource):
             return {"success": False, "error": str(e)}, 500
 
 
+@campaigns_ns.route('/search')
+class SearchCampaigns(Resource):
+    def get(self):
+        """Full-text search over campaign titles and descriptions.
+        Query params: q (required), category, status, limit, cursor.
+        """
+        try:
+            campaigns, next_cursor = search_helper.search_campaigns(
+                request.args.get("q"),
+                category=request.args.get("category"),
+                status=request.args.get("status"),
+                limit=get_page_size(request.args.get("limit")),
+                cursor=request.args.get("cursor"),
+            )
+            return {
+                "success": True,
+                "campaigns": [search_helper.search_result_to_dict(c) for c in campaigns],
+                "next_cursor": next_cursor
+            }, 200
+        except ValueError as ve:
+            return {"success": False, "error": str(ve)}, 400
+        except Exception as e:
+            db.session.rollback()
+            return {"success": False, "error": str(e)}, 500
+
+
 @campaigns_ns.route('/create')
 class CreateCampaign(Resource):
     def options(self):
@@ -246,22 +302,19 @@ class GetCampaignComments(Resource):
 #API: POST http://{BACKEND_URL}/campaigns/comments/{comment_id}/like
 @campaigns_ns.route('/comments/<int:comment_id>/like')
 class CommentLike(Resource):
+    @jwt_required
     def post(self, comment_id):
-        """Post a like on a comment"""
+        """Like a comment as the logged-in user; liking again has no effect"""
         try:
-            comment = Comments.query.filter_by(comment_id=comment_id).first()
-
-            if not comment:
+            if not db.session.get(Comments, comment_id):
                 raise ValueError(f"No comment found with id {comment_id}")
 
-            comment.likes = (comment.likes or 0) + 1
-
-            db.session.commit()
+            like_helper.like_comment(g.user_id, comment_id)
 
             return {
                 "success": True,
                 "comment_id": comment_id,
-                "likes": comment.likes
+                "likes": like_helper.get_like_count(comment_id)
             }, 200
 
         except ValueError as ve:
@@ -285,7 +338,7 @@ class FullyFundedCampaigns(Resource): #Home.jsx
                     Campaigns.description,
                     Campaigns.category,
                     Campaigns.goal_amount,
-                    Campaigns.raised_amount,
+                    Campaigns.raised_total.label("raised_amount"),
                     Campaigns.status,
                     Campaigns.created_at,
                     Campaigns.updated_at,
@@ -325,34 +378,21 @@ class FullyFundedCampaigns(Resource): #Home.jsx
 @campaigns_ns.route('/stats') #for Home page
 class CampaignStats(Resource):
     def get(self):
+        """Home page statistics from the periodically refreshed stats snapshot"""
         try:
-            # total raised
-            total_raised = db.session.query(func.sum(Donations.amount))\
-                .filter(Payments.payment_status == 'successful').scalar() or 0
-            total_raised = float(total_raised)
-
-            # total donors
-            total_donors = db.session.query(func.count(Users.user_id))\
-                .filter(Users.role == 'donor').scalar() or 0
-
-            # success rate
-            total_campaigns = db.session.query(func.count(Campaigns.campaign_id)).scalar() or 1
-            completed_campaigns = db.session.query(func.count(Campaigns.campaign_id))\
-                .filter(Campaigns.status == "completed").scalar() or 0
+            snapshot = admin_stats_helper.get_stats_snapshot()
 
-            success_rate = (completed_campaigns / total_campaigns) * 100
-
-            # active campaigns
-            active_campaigns = db.session.query(func.count(Campaigns.campaign_id))\
-                .filter(Campaigns.status == 'active').scalar() or 0
+            total_campaigns = snapshot.total_campaigns or 1
+            success_rate = (snapshot.completed_campaigns / total_campaigns) * 100
 
             return {
                 "success": True,
+                "as_of": admin_stats_helper.format_as_of(snapshot),
                 "stats": {
-                    "total_raised": round(total_raised, 2),
-                    "total_donors": total_donors,
+                    "total_raised": round(float(snapshot.total_raised_successful), 2),
+                    "total_donors": snapshot.total_donors,
                     "success_rate": round(success_rate, 2),
-                    "active_campaigns": active_campaigns
+                    "active_campaigns": snapshot.active_campaigns
                 }
             }, 200
 
@@ -392,15 +432,11 @@ class PostUpdates(Resource):
             if not campaign_id or not content:
                 return {"success": False, "message": "Campaign ID and content are required."}, 400
 
-            creator = Users.query.get(g.user_id)
-            if not creator:
-                return {"success": False, "message": "User not found."}, 400
-
-            if creator.role.value.lower() != "creator":
+            if current_role() != "creator":
                 return {"success": False, "message": "Only creators can post updates."}, 403
 
             campaign = Campaigns.query.get(campaign_id)
-            if not campaign or campaign.creator_id != creator.user_id:
+            if not campaign or campaign.creator_id != current_user_id():
                 return {"success": False, "message": "Campaign not found or access denied."}, 404
 
             new_update = CampaignUpdates(
@@ -410,6 +446,9 @@ class PostUpdates(Resource):
             db.session.add(new_update)
             db.session.commit()
 
+            # followers are emailed in the background, after this response is sent
+            fanout_helper.submit_fanout(new_update.update_id)
+
             return {"success": True, "message": "Update posted successfully.", "update": new_update.to_dict()}, 201
 
         except Exception as e:
@@ -421,16 +460,12 @@ class DeleteCampaign(Resource):
     @jwt_required
     def delete(self, campaign_id):
         try:
-            user = Users.query.get(g.user_id)
-            if not user:
-                return {"success": False, "message": "User not found."}, 400
-
-            if user.role.value.lower() != "creator":
+            if current_role() != "creator":
                 return {"success": False, "message": "Only creators can delete campaigns."}, 403
 
             # Get the campaign
             campaign = Campaigns.query.get(campaign_id)
-            if not campaign or campaign.creator_id != user.user_id:
+            if not campaign or campaign.creator_id != current_user_id():
                 return {"success": False, "message": "Campaign not found or access denied."}, 404
 
             # Delete the campaign
@@ -448,40 +483,73 @@ class DeleteCampaign(Resource):
 @campaigns_ns.route('/status/<string:status>')
 class CampaignsByStatus(Resource):
     def get(self, status):
-        """Get campaigns by status (pending/active/completed/rejected)"""
+        """Get campaigns by status (pending/active/completed/rejected), newest first.
+        Pass ?limit= and then ?cursor=<next_cursor> to page; without either, every campaign is returned.
+        """
         try:
             try:
                 status_enum = CampaignStatus[status.lower()]
             except KeyError:
                 return {"status": "error", "message": "Invalid status value"}, 400
 
-            campaigns = (
+            # the admin screens read the whole list, so paging is opt-in
+            paginate = "cursor" in request.args or "limit" in request.args
+            limit = get_page_size(request.args.get("limit"), default=50)
+
+            query = (
                 db.session.query(Campaigns)
+                .options(joinedload(Campaigns.creator))
                 .filter(Campaigns.status == status_enum)
-                .all()
             )
 
-            result = []
+            if status_enum == CampaignStatus.rejected:
+                # latest review per campaign, looked up per row through
+                # ix_admin_reviews_campaign_id_created_at
+                latest_review = (
+                    select(AdminReviews.comments, AdminReviews.created_at)
+                    .where(AdminReviews.campaign_id == Campaigns.campaign_id)
+                    .order_by(AdminReviews.created_at.desc())
+                    .limit(1)
+                    .lateral("latest_review")
+                )
+                query = (
+                    query.add_columns(latest_review.c.comments, latest_review.c.created_at)
+                    .outerjoin(latest_review, true())
+                )
 
-            for c in campaigns:
-                campaign_dict = c.to_dict()
+            try:
+                query = apply_keyset(
+                    query, Campaigns.created_at, Campaigns.campaign_id,
+                    request.args.get("cursor"), datetime.fromisoformat
+                )
+            except ValueError as ve:
+                return {"status": "error", "message": str(ve)}, 400
+
+            if not paginate:
+                rows, next_cursor = query.all(), None
+            elif status_enum == CampaignStatus.rejected:
+                rows = query.limit(limit + 1).all()
+                rows, next_cursor = split_page(rows, limit, lambda r: (r[0].created_at, r[0].campaign_id))
+            else:
+                rows = query.limit(limit + 1).all()
+                rows, next_cursor = split_page(rows, limit, lambda c: (c.created_at, c.campaign_id))
 
-                if status_enum == CampaignStatus.rejected:
-                    review = (
-                        db.session.query(AdminReviews)
-                        .filter_by(campaign_id=c.campaign_id)
-                        .order_by(AdminReviews.created_at.desc())
-                        .first()
-                    )
+            result = []
 
-                    campaign_dict["rejection_reason"] = review.comments if review else None
+            for row in rows:
+                if status_enum == CampaignStatus.rejected:
+                    c, rejection_reason, rejected_at = row
+                    campaign_dict = c.to_dict()
+                    campaign_dict["rejection_reason"] = rejection_reason
                     campaign_dict["rejected_at"] = (
-                        review.created_at.isoformat() if review else None
+                        rejected_at.isoformat() if rejected_at else None
                     )
+                else:
+                    campaign_dict = row.to_dict()
 
                 result.append(campaign_dict)
 
-            return {"status": "success", "data": result}, 200
+            return {"status": "success", "data": result, "next_cursor": next_cursor}, 200
 
         except Exception as e:
             db.session.rollback()
@@ -491,129 +559,65 @@ class CampaignsByStatus(Resource):
 @campaigns_ns.route('/admin-key-stats')
 class AdminStats(Resource):
     def get(self):
-        """Admin dashboard statistics"""
+        """Admin dashboard statistics from the periodically refreshed stats snapshot"""
         try:
-            total_campaigns = Campaigns.query.count()
-
-            active_campaigns = Campaigns.query.filter_by(
-                status=CampaignStatus.active
-            ).count()
-
-            total_raised = db.session.query(
-                db.func.coalesce(db.func.sum(Donations.amount), 0)
-            ).scalar()
-            total_raised = float(total_raised)
-
-            total_users = Users.query.count()
-            total_creators = Users.query.filter_by(role="creator").count()
-            total_donors = Users.query.filter_by(role="donor").count()
-
-            pending_campaigns = Campaigns.query.filter_by(
-                status=CampaignStatus.pending
-            ).count()
-
-            top_campaign = (
-                db.session.query(
-                    Campaigns.title,
-                    db.func.coalesce(db.func.sum(Donations.amount), 0).label("raised")
-                )
-                .join(Donations, Campaigns.campaign_id == Donations.campaign_id, isouter=True)
-                .group_by(Campaigns.title)
-                .order_by(db.desc("raised"))
-                .first()
-            )
-
-            if top_campaign:
-                top_campaign_title = top_campaign.title
-                top_campaign_raised = float(top_campaign.raised)
-            else:
-                top_campaign_title = None
-                top_campaign_raised = 0
+            snapshot = admin_stats_helper.get_stats_snapshot()
 
             return {
                 "status": "success",
+                "as_of": admin_stats_helper.format_as_of(snapshot),
                 "data": {
                     "total_campaigns": {
-                        "count": total_campaigns,
-                        "active": active_campaigns
+                        "count": snapshot.total_campaigns,
+                        "active": snapshot.active_campaigns
                     },
-                    "total_raised": total_raised,
+                    "total_raised": float(snapshot.total_raised),
                     "total_users": {
-                        "count": total_users,
-                        "creators": total_creators,
-                        "donors": total_donors
+                        "count": snapshot.total_users,
+                        "creators": snapshot.total_creators,
+                        "donors": snapshot.total_donors
                     },
-                    "pending_campaigns": pending_campaigns,
+                    "pending_campaigns": snapshot.pending_campaigns,
                     "top_campaign": {
-                        "title": top_campaign_title,
-                        "raised": top_campaign_raised
+                        "title": snapshot.top_campaign_title,
+                        "raised": float(snapshot.top_campaign_raised)
                     }
                 }
             }, 200
 
         except Exception as e:
+            db.session.rollback()
             return {"status": "error", "message": str(e)}, 500
 
 @campaigns_ns.route('/get-creators')
 class CreatorsData(Resource):
     def get(self):
-        """Fetch all creator statistics with pagination"""
+        """Fetch creator statistics, keyset-paginated.
+        Query params: sort (total_raised|campaigns|join_date), order (asc|desc), per_page, cursor.
+        """
         try:
-            page = int(request.args.get("page", 1))
-            per_page = int(request.args.get("per_page", 10))
-
-            query = db.session.query(Users).filter(Users.role == UserRole.creator)
-
-            total_items = query.count()
-            total_pages = (total_items + per_page - 1) // per_page
-
-            creators = query.offset((page - 1) * per_page).limit(per_page).all()
-
-            result = []
-
-            for creator in creators:
-                try:
-                    campaign_count = (
-                        db.session.query(Campaigns)
-                        .filter_by(creator_id=creator.user_id)
-                        .count()
-                    )
-
-                    total_raised = (
-                        db.session.query(db.func.sum(Campaigns.raised_amount))
-                        .filter(Campaigns.creator_id == creator.user_id)
-                        .scalar()
-                    )
-                    total_raised = float(total_raised or 0)
-
-                    creator_dict = {
-                        "creator_id": creator.user_id,
-                        "name": creator.username,
-                        "email": creator.email,
-                        "profile_image": creator.profile_image,
-                        "campaigns": campaign_count,
-                        "total_raised": total_raised,
-                        "join_date": (
-                            creator.created_at.strftime("%b %d, %Y")
-                            if creator.created_at else None
-                        )
-                    }
-
-                    result.append(creator_dict)
-
-                except Exception as e:
-                    print(f"Error processing creator {creator.user_id}: {str(e)}")
-                    continue
+            per_page = get_page_size(request.args.get("per_page"), default=10)
+            sort = request.args.get("sort", "total_raised")
+            order = request.args.get("order", "desc")
+
+            creators, next_cursor = admin_report_helper.get_creator_report(
+                sort=sort,
+                order=order,
+                limit=per_page,
+                cursor=request.args.get("cursor"),
+            )
 
             return {
                 "status": "success",
-                "page": page,
                 "per_page": per_page,
-                "total_items": total_items,
-                "total_pages": total_pages,
-                "data": result
+                "sort": sort,
+                "order": order,
+                "next_cursor": next_cursor,
+                "data": [admin_report_helper.creator_report_row_to_dict(c) for c in creators]
             }, 200
 
+        except ValueError as ve:
+            return {"status": "error", "message": str(ve)}, 400
         except Exception as e:
             db.session.rollback()
             return {
@@ -624,66 +628,41 @@ class CreatorsData(Resource):
 @campaigns_ns.route('/get-donors')
 class UsersData(Resource):
     def get(self):
-        """Fetch all donor statistics with pagination"""
+        """Fetch donor statistics, keyset-paginated.
+        Query params: sort (total_donated|campaigns|donations|last_donation|join_date),
+        order (asc|desc), min_total, per_page, cursor.
+        """
         try:
-            page = int(request.args.get("page", 1))
-            per_page = int(request.args.get("per_page", 10))
-
-            query = db.session.query(Users).filter(Users.role == UserRole.donor)
+            per_page = get_page_size(request.args.get("per_page"), default=10)
+            sort = request.args.get("sort", "total_donated")
+            order = request.args.get("order", "desc")
 
-            total_items = query.count()
-            total_pages = (total_items + per_page - 1) // per_page
-
-            donors = query.offset((page - 1) * per_page).limit(per_page).all()
-
-            result = []
-
-            for donor in donors:
+            min_total = request.args.get("min_total")
+            if min_total is not None:
                 try:
-                    # Total donations made (SUM)
-                    total_donations = (
-                        db.session.query(db.func.sum(Donations.amount))
-                        .filter(Donations.user_id == donor.user_id)
-                        .scalar()
-                    )
-                    total_donations = float(total_donations or 0)
-
-                    # Unique campaigns supported
-                    campaigns_supported = (
-                        db.session.query(Donations.campaign_id)
-                        .filter(Donations.user_id == donor.user_id)
-                        .distinct()
-                        .count()
-                    )
-
-                    donor_dict = {
-                        "user_id": donor.user_id,
-                        "name": donor.username,
-                        "email": donor.email,
-                        "profile_image": donor.profile_image,
-                        "total_donations": total_donations,
-                        "campaigns_supported": campaigns_supported,
-                        "join_date": (
-                            donor.created_at.strftime("%b %d, %Y")
-                            if donor.created_at else None
-                        )
-                    }
-
-                    result.append(donor_dict)
-
-                except Exception as e:
-                    print(f"Error processing donor {donor.user_id}: {str(e)}")
-                    continue
+                    min_total = Decimal(min_total)
+                except InvalidOperation:
+                    return {"status": "error", "message": "min_total must be a number"}, 400
+
+            donors, next_cursor = admin_report_helper.get_donor_report(
+                sort=sort,
+                order=order,
+                limit=per_page,
+                cursor=request.args.get("cursor"),
+                min_total=min_total,
+            )
 
             return {
                 "status": "success",
-                "page": page,
                 "per_page": per_page,
-                "total_items": total_items,
-                "total_pages": total_pages,
-                "data": result
+                "sort": sort,
+                "order": order,
+                "next_cursor": next_cursor,
+                "data": [admin_report_helper.donor_report_row_to_dict(d) for d in donors]
             }, 200
 
+        except ValueError as ve:
+            return {"status": "error", "message": str(ve)}, 400
         except Exception as e:
             db.session.rollback()
             return {"status": "error", "message": str(e)}, 500
@@ -693,40 +672,20 @@ class UsersData(Resource):
 @campaigns_ns.route('/highest-funded')
 class HighestFunded(Resource):
     def get(self):
-        """Fetch top 5 highest funded campaigns along with donor count"""
+        """Fetch the top campaigns from the precomputed leaderboard.
+        Query params: by (raised|donors|velocity, default raised), limit (default 5).
+        """
         try:
-            top_campaigns = (
-                db.session.query(Campaigns)
-                .order_by(Campaigns.raised_amount.desc())
-                .limit(5)
-                .all()
-            )
+            board = request.args.get("by", "raised")
+            limit = get_page_size(request.args.get("limit"), default=5,
+                                  maximum=leaderboard_helper.LEADERBOARD_SIZE)
 
-            result = []
-
-            for c in top_campaigns:
-                donor_count = (
-                    db.session.query(func.count(func.distinct(Donations.user_id)))
-                    .filter(Donations.campaign_id == c.campaign_id)
-                    .scalar()
-                )
-
-                campaign_dict = {
-                    "campaign_id": c.campaign_id,
-                    "title": c.title,
-                    "raised_amount": float(c.raised_amount or 0),
-                    "donor_count": donor_count or 0,
-                    "creator": {
-                        "user_id": c.creator.user_id,
-                        "username": c.creator.username,
-                        "profile_image": c.creator.profile_image,
-                    } if c.creator else None,
-                }
-
-                result.append(campaign_dict)
+            result = leaderboard_helper.get_top_campaigns(board, limit)
 
             return {"status": "success", "data": result}, 200
 
+        except ValueError as ve:
+            return {"status": "error", "message": str(ve)}, 400
         except Exception as e:
             db.session.rollback()
             return {"status": "error", "message": str(e)}, 500
@@ -6,6 +6,8 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy import func, text
 from datetime import datetime
 from api.helpers.security_helper import jwt_required
+from api.helpers import campaign_stats_helper, like_helper
+from api.helpers.pagination_helper import parse_id_list
 
 @comments_ns.route('/post-comment/<int:user_id>/<int:campaign_id>')
 class CommentDetails(Resource):
@@ -30,6 +32,9 @@ class CommentDetails(Resource):
 
             new_comment = result.fetchone()
 
+            if new_comment:
+                campaign_stats_helper.increment_counters(campaign_id, comments=1)
+
             db.session.commit()
 
             if not new_comment:
@@ -95,32 +100,39 @@ class GetComments(Resource):
 class ToggleLike(Resource):
     def post(self, user_id, comment_id):
         try:
-            user = Users.query.get_or_404(user_id)
-            comment = Comments.query.get_or_404(comment_id)
-
-            if comment in user.liked_comments:
-                user.liked_comments.remove(comment)
-                comment.likes = max((comment.likes or 1) - 1, 0)
-                db.session.commit()
-                return {
-                    "success": True,
-                    "message": "Comment unliked successfully.",
-                    "liked": False,
-                    "likes": comment.likes
-                }, 200
-            else:
-                user.liked_comments.append(comment)
-                comment.likes = (comment.likes or 0) + 1
-                db.session.commit()
-                return {
-                    "success": True,
-                    "message": "Comment liked successfully.",
-                    "liked": True,
-                    "likes": comment.likes
-                }, 200
+            liked, likes = like_helper.toggle_like(user_id, comment_id)
+            return {
+                "success": True,
+                "message": "Comment liked successfully." if liked else "Comment unliked successfully.",
+                "liked": liked,
+                "likes": likes
+            }, 200
 
+        except ValueError as ve:
+            return {"success": False, "error": str(ve)}, 404
         except Exception as e:
             db.session.rollback()
             import traceback
             traceback.print_exc()
             return {"success": False, "error": str(e)}, 500
+
+
+@comments_ns.route('/liked-status/<int:user_id>')
+class LikedStatus(Resource):
+    @comments_ns.doc(params={"comment_ids": "Comma-separated comment ids, e.g. 3,7,12 (at most 100)"})
+    def get(self, user_id):
+        """Tell which of the given comments a user has liked, in one query"""
+        try:
+            comment_ids = parse_id_list(request.args.get("comment_ids"))
+        except ValueError as ve:
+            return {"success": False, "error": str(ve)}, 400
+
+        try:
+            liked = like_helper.get_liked_comment_ids(user_id, comment_ids)
+            return {
+                "success": True,
+                "liked": {str(cid): cid in liked for cid in comment_ids}
+            }, 200
+        except Exception as e:
+            db.session.rollback()
+            return {"success": False, "error": str(e)}, 500
@@ -2,7 +2,9 @@ from api import db, creator_ns
 from flask import request
 from flask_restx import Resource
 from api.helpers.security_helper import jwt_required
-from api.models.cf_models import Users, Campaigns, Donations, CampaignStatus
+from api.helpers import creator_dashboard_helper
+from api.helpers.identity_helper import current_role, current_user_id
+from api.models.cf_models import Users, Campaigns, Donations, CampaignStatus, CampaignStats
 from sqlalchemy import func, desc
 
 from decimal import Decimal
@@ -13,73 +15,37 @@ class DisplayCreatorDashboard(Resource):
     @creator_ns.doc('Creator Dashboard')
     def get(self):
         try:
-            from flask import g
+            if current_role() != 'creator':
+                return {"Error": "Nothing to show"}, 403
 
-            creator = Users.query.get(g.user_id)
+            summary = creator_dashboard_helper.get_creator_summary(current_user_id())
 
-            if not creator:
+            if summary.role is None:
                 return {"Error": "No such user exists"}, 400
             
-            role = creator.role.value.lower()
-            if role != 'creator':
+            if summary.role.lower() != 'creator':
                 return {"Error": "Nothing to show"}, 403
             
-            campaigns = Campaigns.query.filter(
-                Campaigns.creator_id == creator.user_id, Campaigns.status == CampaignStatus.active
-            ).all()
-
-            total_raised = 0
-            active_campaigns = len(campaigns)
-
-            for campaign in campaigns:
-                campaign_total = db.session.query(db.func.sum(Donations.amount))\
-                                .filter(Donations.campaign_id == campaign.campaign_id).scalar()
-                if campaign_total is None:
-                    campaign_total = 0
-                # convert Decimal to float
-                total_raised += float(campaign_total)
-                
-            total_donors = db.session.query(func.count(func.distinct(Donations.user_id)))\
-                            .join(Campaigns, Campaigns.campaign_id == Donations.campaign_id)\
-                            .filter(Campaigns.creator_id == creator.user_id,
-                                    Campaigns.status == CampaignStatus.active).scalar()
-            
-            if not total_donors:
-                total_donors = 0
-
-            recent_donation = db.session.query(Donations)\
-                                .join(Campaigns, Campaigns.campaign_id == Donations.campaign_id)\
-                                .join(Users, Donations.user_id == Users.user_id)\
-                                .filter(Campaigns.creator_id == creator.user_id,
-                                        Campaigns.status == CampaignStatus.active)\
-                                .order_by(desc(Donations.created_at)).first()
-            
-            if recent_donation:
+            if summary.recent_donor_id is not None:
                 recent_donation_amount = {
-                    "donor_id": recent_donation.user_id,
-                    "amount": float(recent_donation.amount)  # convert Decimal to float
+                    "donor_id": summary.recent_donor_id,
+                    "amount": float(summary.recent_amount),  # convert Decimal to float
+                    "date": summary.recent_date.isoformat() if summary.recent_date else None
                 }
             else:
                 recent_donation_amount = {
                     "donor_id": None,
-                    "amount": 0
+                    "amount": 0,
+                    "date": None
                 }
             
-            available_to_withdraw = db.session.query(db.func.sum(Campaigns.raised_amount))\
-                                    .filter(Campaigns.creator_id == creator.user_id,
-                                            Campaigns.status == CampaignStatus.completed).scalar()
-            if not available_to_withdraw:
-                available_to_withdraw = 0
-            else:
-                available_to_withdraw = float(available_to_withdraw)  # convert Decimal to float
-            
             return {
                 "Success": {
-                    "total_raised": total_raised,
-                    "active_campaigns": active_campaigns,
-                    "total_donors": total_donors,
+                    "total_raised": float(summary.total_raised),
+                    "active_campaigns": summary.active_campaigns,
+                    "total_donors": summary.total_donors,
                     "recent_donation": recent_donation_amount,
-                    "available": available_to_withdraw
+                    "available": float(summary.available)
                 }
             }, 200
         
@@ -92,31 +58,25 @@ class DisplayCreatorCampaigns(Resource):
     @creator_ns.doc("Displaying creator campaigns")
     def get(self):
         try:
-            from flask import g
-            creator = Users.query.get(g.user_id)
-
-            if not creator:
-                return {"Error" : "No such user exists"}, 400
-            
-            role = creator.role.value.lower()
-
-            if role != 'creator':
+            if current_role() != 'creator':
                 return {"Error" : "Nothing to show"}, 403
+
+            creator_id = current_user_id()
             
-            campaigns = Campaigns.query.filter(
-                Campaigns.creator_id == creator.user_id, Campaigns.status == CampaignStatus.active
-                ).all()
+            campaigns = db.session.query(Campaigns, CampaignStats.donor_count)\
+                            .outerjoin(CampaignStats, CampaignStats.campaign_id == Campaigns.campaign_id)\
+                            .filter(Campaigns.creator_id == creator_id,
+                                    Campaigns.status == CampaignStatus.active).all()
             
             campaigns_list = []
-            for campaign in campaigns:
+            for campaign, donor_count in campaigns:
                 campaign_data = campaign.to_dict()
-                campaign_data['total_donors'] = db.session.query(func.count(func.distinct(Donations.user_id)))\
-                                  .filter(Donations.campaign_id == campaign.campaign_id).scalar() or 0
+                campaign_data['total_donors'] = donor_count or 0
                 
                 campaigns_list.append(campaign_data)
             
             return {
-                "user_id" : creator.user_id,
+                "user_id" : creator_id,
                 "campaigns" : campaigns_list
             }, 200
         
@@ -128,24 +88,18 @@ class RecentDonations(Resource):
     @jwt_required
     @creator_ns.doc("View recent donations for a creator's campaign")
     def get(self):
-        from flask import g
         try:
-            creator = Users.query.get(g.user_id)
-
-            if not creator:
-                return {"Error" : "No such user exists"}, 400
-            
-            role = creator.role.value.lower()
-
-            if role != 'creator':
+            if current_role() != 'creator':
                 return {"Error" : "Nothing to show"}, 403
+
+            creator_id = current_user_id()
             
             donations_list = []
             
             recent_donations = db.session.query(Donations)\
                             .join(Campaigns, Campaigns.campaign_id == Donations.campaign_id)\
                             .join(Users, Donations.user_id == Users.user_id)\
-                            .filter(Campaigns.creator_id == creator.user_id,
+                            .filter(Campaigns.creator_id == creator_id,
                                     Campaigns.status == CampaignStatus.active)\
                             .order_by(desc(Donations.created_at)).all()
             
@@ -154,7 +108,7 @@ class RecentDonations(Resource):
                 donations_list.append(donations_data)
             
             return {
-                "user_id" : creator.user_id,
+                "user_id" : creator_id,
                 "recent_donations" : donations_list
             }, 200
         
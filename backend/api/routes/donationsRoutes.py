@@ -1,9 +1,11 @@
 from api import donations_ns, db
 from flask_restx import Resource
 from api.fields.donationsFields import donations_data
-from api.helpers.security_helper import jwt_required
-from flask import request
+from api.helpers.security_helper import jwt_required, admin_required
+from api.helpers.idempotency_helper import idempotent
+from flask import request, Response
 from api.helpers.donation_helper import create_donation,view_all_donations_by_campaign
+from api.helpers import leaderboard_helper, campaign_stats_helper, export_helper, raised_amount_helper
 from api.models.cf_models import Donations,Campaigns,CampaignStatus,CampaignPaymentStatus,Payments
 from sqlalchemy import func,distinct
 from sqlalchemy.exc import SQLAlchemyError
@@ -13,9 +15,13 @@ class Donate(Resource):
     # @jwt_required
     @donations_ns.doc("Make a donation to a campaign")
     @donations_ns.expect(donations_data)
+    @donations_ns.header("Idempotency-Key", "Optional client-generated key; retries with the same key replay the first response")
+    @idempotent
     def post(self):
         data = request.json
         try:
+            new_donor = campaign_stats_helper.is_new_donor(data["user_id"], data["campaign_id"])
+
             # Create donation
             donation = Donations(
                 user_id=data["user_id"],
@@ -33,16 +39,24 @@ class Donate(Resource):
             )
             db.session.add(payment)
 
-            campaign = Campaigns.query.get(data["campaign_id"])
-            campaign.raised_amount += data["amount"]
-
+            raised_amount = raised_amount_helper.add_to_raised(data["campaign_id"], data["amount"])
 
             donation.status = "completed"
             payment.payment_status = CampaignPaymentStatus.successful
+            if new_donor:
+                campaign_stats_helper.increment_counters(data["campaign_id"], donors=1)
             db.session.commit()  
 
+            leaderboard_helper.record_completed_donation(
+                data["campaign_id"], donation.user_id, donation.amount, raised_amount
+            )
+
             return {"message": "Donation successful"}
 
+        except ValueError as ve:
+            # unknown campaign, a campaign that is not active, or a donation past the goal
+            db.session.rollback()
+            return {"error": str(ve)}, 400
         except SQLAlchemyError as e:
             db.session.rollback()
             return {"error": str(e)}, 500
@@ -176,7 +190,7 @@ class GetActiveCampaigns(Resource):
                     Campaigns.campaign_id,
                     Campaigns.title,
                     Campaigns.goal_amount,
-                    Campaigns.raised_amount,
+                    Campaigns.raised_total.label("raised_amount"),
                     Campaigns.status
                 )
                 .join(Donations, Donations.campaign_id == Campaigns.campaign_id)
@@ -203,3 +217,30 @@ class GetActiveCampaigns(Resource):
         except Exception as e:
             db.session.rollback()
             return {"success": False, "error": str(e)}, 500
+
+
+@donations_ns.route('/export')
+class ExportDonations(Resource):
+    @admin_required
+    def get(self):
+        """Stream every donation as NDJSON (default) or CSV with ?format=csv.
+        Optional filters: start / end (ISO dates, end inclusive) and campaign_id.
+        """
+        try:
+            fmt, start, end, campaign_id = export_helper.parse_export_args(request.args)
+        except ValueError as ve:
+            return {"success": False, "error": str(ve)}, 400
+
+        stmt = export_helper.donation_export_query(start, end, campaign_id)
+        body = export_helper.stream_export(
+            stmt,
+            export_helper.serialize_donation_export,
+            export_helper.DONATION_EXPORT_COLUMNS,
+            fmt,
+        )
+        filename = export_helper.export_filename("donations", fmt)
+        return Response(
+            body,
+            mimetype=export_helper.EXPORT_FORMATS[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
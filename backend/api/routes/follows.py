@@ -8,7 +8,8 @@ from api.models.cf_models import Campaigns, Users,Donations
 from sqlalchemy.orm import joinedload
 from sqlalchemy import func, text
 from datetime import datetime
-from ..helpers import follow_helper
+from ..helpers import follow_helper, campaign_stats_helper
+from api.helpers.pagination_helper import parse_id_list
 
 from flask_restx import Resource
 from api import follows_ns, db
@@ -21,30 +22,19 @@ class ToggleFollowCampaign(Resource):
     def post(self, user_id, campaign_id):
         """Toggle follow/unfollow for a user and campaign"""
         try:
-            existing_follow = Follows.query.filter_by(user_id=user_id, campaign_id=campaign_id).first()
-
-            if existing_follow:
-                print('Already follow exists')
-                db.session.delete(existing_follow)
-                db.session.commit()
-                return {
-                    "success": True,
-                    "action": "unfollowed",
-                    "user_id": user_id,
-                    "campaign_id": campaign_id
-                }, 200
-            else:
-                print('Creating a follow entry')
-                follow = Follows(user_id=user_id, campaign_id=campaign_id)
-                db.session.add(follow)
-                db.session.commit()
-                return {
-                    "success": True,
-                    "action": "followed",
-                    "user_id": user_id,
-                    "campaign_id": campaign_id
-                }, 201
+            action = follow_helper.toggle_follow(user_id, campaign_id)
+            return {
+                "success": True,
+                "action": action,
+                "user_id": user_id,
+                "campaign_id": campaign_id
+            }, 201 if action == "followed" else 200
 
+        except ValueError as ve:
+            return {
+                "success": False,
+                "message": str(ve)
+            }, 404
         except IntegrityError:
             db.session.rollback()
             return {
@@ -102,3 +92,27 @@ class FollowingList(Resource):
                 "success": False,
                 "message": f"Unexpected error: {str(e)}"
             }, 500
+
+
+@follows_ns.route('/following-status/<int:user_id>')
+class FollowingStatus(Resource):
+    @follows_ns.doc(params={"campaign_ids": "Comma-separated campaign ids, e.g. 3,7,12 (at most 100)"})
+    def get(self, user_id):
+        """Tell which of the given campaigns a user follows, in one query"""
+        try:
+            campaign_ids = parse_id_list(request.args.get("campaign_ids"))
+        except ValueError as ve:
+            return {"success": False, "message": str(ve)}, 400
+
+        try:
+            followed = follow_helper.get_followed_campaign_ids(user_id, campaign_ids)
+            return {
+                "success": True,
+                "following": {str(cid): cid in followed for cid in campaign_ids}
+            }, 200
+        except Exception as e:
+            db.session.rollback()
+            return {
+                "success": False,
+                "message": f"Unexpected error: {str(e)}"
+            }, 500
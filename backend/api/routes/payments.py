@@ -1,47 +1,69 @@
 from api import payments_ns, db
 from flask_restx import Resource
 from api.fields.paymentsField import payments_data
-from api.helpers.security_helper import jwt_required
+from api.helpers.security_helper import jwt_required, admin_required
 from api.models.cf_models import Donations,Campaigns,Payments,Users
 from sqlalchemy import func,distinct
 from api import db
-from flask import request
+from flask import request, Response
+from datetime import datetime
+from api.helpers.pagination_helper import get_page_size, apply_keyset, split_page
+from api.helpers import export_helper
 @payments_ns.route('/transaction-history')
 class TransactionHistory(Resource):
     def get(self):
-        """Fetch paginated transaction history from Payments table"""
+        """Fetch transaction history from Payments table, newest first.
+        Keyset-paginated over (transaction_date, payment_id): pass ?cursor=<next_cursor> for the next page.
+        """
         try:
-            page = request.args.get("page", 1, type=int)
-            limit = request.args.get("limit", 5, type=int)
-            offset = (page - 1) * limit
+            limit = get_page_size(request.args.get("limit"), default=5)
 
-            base_query = (
-                db.session.query(Payments)
-                .order_by(Payments.transaction_date.desc())
+            query = (
+                db.session.query(
+                    Payments.payment_id,
+                    Payments.transaction_date,
+                    Payments.payment_status,
+                    Donations.amount,
+                    Users.user_id,
+                    Users.username,
+                    Users.email,
+                    Users.profile_image,
+                    Campaigns.campaign_id,
+                    Campaigns.title
+                )
+                .join(Donations, Donations.donation_id == Payments.donation_id)
+                .outerjoin(Users, Users.user_id == Donations.user_id)
+                .outerjoin(Campaigns, Campaigns.campaign_id == Donations.campaign_id)
             )
 
-            total_records = base_query.count()
+            try:
+                query = apply_keyset(
+                    query, Payments.transaction_date, Payments.payment_id,
+                    request.args.get("cursor"), datetime.fromisoformat
+                )
+            except ValueError as ve:
+                return {"status": "error", "message": str(ve)}, 400
 
-            payments = base_query.offset(offset).limit(limit).all()
+            payments, next_cursor = split_page(
+                query.limit(limit + 1).all(), limit,
+                lambda p: (p.transaction_date, p.payment_id)
+            )
 
             result = []
             for p in payments:
-                if not p.donation:
-                    continue
-
                 transaction = {
                     "type": "donation",
                     "user": {
-                        "user_id": p.donation.user.user_id,
-                        "name": p.donation.user.username,
-                        "email": p.donation.user.email,
-                        "profile_image": p.donation.user.profile_image
-                    } if p.donation.user else None,
+                        "user_id": p.user_id,
+                        "name": p.username,
+                        "email": p.email,
+                        "profile_image": p.profile_image
+                    } if p.user_id else None,
                     "campaign": {
-                        "campaign_id": p.donation.campaign.campaign_id,
-                        "title": p.donation.campaign.title
-                    } if p.donation.campaign else None,
-                    "amount": float(p.donation.amount),
+                        "campaign_id": p.campaign_id,
+                        "title": p.title
+                    } if p.campaign_id else None,
+                    "amount": float(p.amount),
                     "date_time": p.transaction_date.strftime("%Y-%m-%d %H:%M"),
                     "status": p.payment_status.value
                 }
@@ -49,13 +71,38 @@ class TransactionHistory(Resource):
 
             return {
                 "status": "success",
-                "page": page,
                 "limit": limit,
-                "total_records": total_records,
-                "total_pages": (total_records + limit - 1) // limit,
+                "next_cursor": next_cursor,
                 "data": result
             }, 200
 
         except Exception as e:
             db.session.rollback()
             return {"status": "error", "message": str(e)}, 500
+
+
+@payments_ns.route('/export')
+class ExportPayments(Resource):
+    @admin_required
+    def get(self):
+        """Stream the full payments ledger as NDJSON (default) or CSV with ?format=csv.
+        Optional filters: start / end (ISO dates, end inclusive) and campaign_id.
+        """
+        try:
+            fmt, start, end, campaign_id = export_helper.parse_export_args(request.args)
+        except ValueError as ve:
+            return {"status": "error", "message": str(ve)}, 400
+
+        stmt = export_helper.payment_export_query(start, end, campaign_id)
+        body = export_helper.stream_export(
+            stmt,
+            export_helper.serialize_payment_export,
+            export_helper.PAYMENT_EXPORT_COLUMNS,
+            fmt,
+        )
+        filename = export_helper.export_filename("payments", fmt)
+        return Response(
+            body,
+            mimetype=export_helper.EXPORT_FORMATS[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
@@ -5,6 +5,8 @@ from api.fields.usersFields import users_data, users_update_data
 from api.models.cf_models import Users
 from api.helpers.security_helper import generate_jwt, jwt_required
 from api.helpers.user_helper import search_users
+from api.helpers.identity_helper import get_user_identity, invalidate_user
+from api.helpers.password_helper import HashingBusy, rehash_if_needed
 from email_service.email_sender import send_email
 from email_service.email_background import send_email_background
 from ..helpers.limiter import limiter
@@ -27,6 +29,8 @@ class LoginUser(Resource):
             
             if not attempted_user or not attempted_user.checkHashedPassword(data['password']):
                 return {"Error" : "Incorrect email or password"}, 401
+
+            rehash_if_needed(attempted_user, data['password'])
             
             access_token = generate_jwt(attempted_user.user_id, attempted_user.username, attempted_user.role.value,)
 
@@ -36,6 +40,8 @@ class LoginUser(Resource):
                 "user" :  attempted_user.to_dict()
             }, 200
          
+        except HashingBusy as e:
+            return {"Error" : str(e)}, 503, {"Retry-After": "5"}
         except Exception as e:
             return {"Error": f"Unexpected Error {str(e)}"}, 500
 
@@ -96,6 +102,8 @@ class RegisterUser(Resource):
                 "Success" : "User registered succesfully!",
                 "user_id" : new_user.to_dict()
             }, 200
+        except HashingBusy as e:
+            return {"Error" : str(e)}, 503, {"Retry-After": "5"}
         except Exception as e:
             return {"Error": f"Unexpected Error {str(e)}"}, 500
         
@@ -112,7 +120,7 @@ class GetUserProfile(Resource):
             if not user_id:
                 return {"Error" : "user_id missing"}, 400
             
-            attempted_user = Users.query.filter_by(user_id = user_id).first()
+            attempted_user = get_user_identity(int(user_id)) if user_id.isdigit() else None
 
             if not attempted_user:
                 return {"Error" : "User does not exist!"}, 404
@@ -168,13 +176,19 @@ class UpdateUserProfile(Resource):
             user_to_update.updated_at = db.func.current_timestamp()
             
             db.session.commit()
+            invalidate_user(user_to_update.user_id)
+
+            # role/username claims come from the token, so hand back one that matches
+            access_token = generate_jwt(user_to_update.user_id, user_to_update.username, user_to_update.role.value)
 
             return {
                 "Success" : f"User profile with id {user_to_update.user_id} updated succesfully",
-                "user" : user_to_update.to_dict()
-                
+                "user" : user_to_update.to_dict(),
+                "access_token" : access_token
             }, 200
         
+        except HashingBusy as e:
+            return {"Error" : str(e)}, 503, {"Retry-After": "5"}
         except Exception as e:
             return {"Error": f"Unexpected Error {str(e)}"}, 500
        
@@ -1,7 +1,12 @@
-import threading
-from email_service.email_sender import send_email
+def send_email_background(receiver_email, subject, template_name, **kwargs):
+    """Queue an email in the outbox in its own transaction; the outbox worker sends it.
+    Prefer outbox_helper.enqueue_email inside the caller's transaction.
+    """
+    from api import db
+    from api.helpers.outbox_helper import enqueue_emails
 
-def send_email_background(*args, **kwargs):
-    thread = threading.Thread(target=send_email, args=args, kwargs=kwargs)
-    thread.daemon = True
-    thread.start()
+    with db.engine.begin() as conn:
+        enqueue_emails(
+            [{"recipient": receiver_email, "subject": subject, "template_name": template_name, "context": kwargs}],
+            connection=conn,
+        )
@@ -4,6 +4,11 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from dotenv import load_dotenv
 
+try:
+    from email_service.template_engine import engine
+except ImportError:  # run from inside email_service (test_all_templates.py)
+    from template_engine import engine
+
 # Load .env for local development (no-op in Docker)
 load_dotenv()
 
@@ -11,39 +16,115 @@ load_dotenv()
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# set to false for a local SMTP sink (e.g. python -m aiosmtpd -n -l localhost:1025)
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
 
-def send_email(receiver_email, subject, template_name, **kwargs):
-    """Send an email using SMTP. Credentials are checked at runtime."""
-    SENDER_EMAIL = os.getenv("SENDER_EMAIL")
-    SENDER_PASSKEY = os.getenv("SENDER_PASSKEY")
-    
-    if not SENDER_EMAIL or not SENDER_PASSKEY:
-        raise ValueError("SENDER_EMAIL and SENDER_PASSKEY environment variables must be set")
-    
-    template_path = os.path.join(BASE_DIR, "email_templates", template_name)
+# reconnect after this many messages; some providers drop long-lived sessions
+SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100"))
+
+SMTP_TIMEOUT = int(os.getenv("SMTP_TIMEOUT", "30"))
+
+
+def render_template(template_name, **kwargs):
+    """Fill {{key}} placeholders in a precompiled email template and return the HTML."""
+    return engine.render(template_name, **kwargs)
 
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(f"Email template not found: {template_path}")
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        html_template = f.read()
+def render_templates(template_name, contexts):
+    """Render one template for many recipients; returns the HTML for each context in order."""
+    return engine.render_batch(template_name, contexts)
 
-    for key, value in kwargs.items():
-        html_template = html_template.replace(f"{{{{{key}}}}}", str(value))
 
+def build_message(sender_email, receiver_email, subject, html):
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
-    msg["From"] = SENDER_EMAIL
+    msg["From"] = sender_email
     msg["To"] = receiver_email
-    msg.attach(MIMEText(html_template, "html"))
+    msg.attach(MIMEText(html, "html"))
+    return msg
+
+
+class SMTPConnectFailed(RuntimeError):
+    """Raised when the server can't be reached, TLS fails or the login is refused.
+    No message can go out on the session, so a batch should stop instead of trying the next one.
+    """
+
+
+class SMTPSession:
+    """One SMTP connection reused for many messages.
+    Connects lazily, reconnects if the server drops the session, and rotates the
+    connection every SMTP_MAX_MESSAGES_PER_CONNECTION messages. Use as a context manager.
+    """
+
+    def __init__(self):
+        self.sender_email = os.getenv("SENDER_EMAIL")
+        self.sender_passkey = os.getenv("SENDER_PASSKEY")
+        if not self.sender_email or (SMTP_USE_TLS and not self.sender_passkey):
+            raise ValueError("SENDER_EMAIL and SENDER_PASSKEY environment variables must be set")
+        self._server = None
+        self._sent_on_connection = 0
+
+    def _connect(self):
+        server = None
+        try:
+            server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=SMTP_TIMEOUT)
+            if SMTP_USE_TLS:
+                server.starttls()
+            if self.sender_passkey:
+                server.login(self.sender_email, self.sender_passkey)
+        except OSError as e:
+            # smtplib errors (SMTPConnectError, SMTPAuthenticationError, ...) are OSErrors too
+            if server is not None:
+                server.close()
+            raise SMTPConnectFailed(f"Could not connect to {SMTP_SERVER}:{SMTP_PORT}: {e}") from e
+        self._server = server
+        self._sent_on_connection = 0
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                self._server.close()
+            self._server = None
+
+    def send(self, receiver_email, subject, html):
+        """Send one message, reconnecting once if the session was dropped.
+        Raises SMTPConnectFailed if no connection can be made, and smtplib exceptions
+        for this message otherwise, so the caller can decide whether to retry.
+        """
+        if self._server is not None and self._sent_on_connection >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+            self.close()
+        msg = build_message(self.sender_email, receiver_email, subject, html).as_string()
+
+        for attempt in (1, 2):
+            if self._server is None:
+                self._connect()
+            try:
+                self._server.sendmail(self.sender_email, receiver_email, msg)
+                self._sent_on_connection += 1
+                return
+            except smtplib.SMTPServerDisconnected:
+                self._server = None
+                if attempt == 2:
+                    raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def send_email(receiver_email, subject, template_name, **kwargs):
+    """Send an email using SMTP. Credentials are checked at runtime."""
+    html = render_template(template_name, **kwargs)
 
     try:
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SENDER_EMAIL, SENDER_PASSKEY)
-        server.sendmail(SENDER_EMAIL, receiver_email, msg.as_string())
-        server.quit()
+        with SMTPSession() as session:
+            session.send(receiver_email, subject, html)
         return {"message": f"Email sent to {receiver_email}"}
+    except ValueError:
+        raise
     except Exception as e:
-        raise RuntimeError(f"Could not send email. Error: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Could not send email. Error: {e}")
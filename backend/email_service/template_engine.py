@@ -0,0 +1,120 @@
+import os
+import re
+import time
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "email_templates")
+
+# re-check template files for changes on every render; on by default when FLASK_DEBUG is set
+EMAIL_TEMPLATE_RELOAD = os.getenv(
+    "EMAIL_TEMPLATE_RELOAD", os.getenv("FLASK_DEBUG", "false")
+).lower() in ("1", "true")
+
+PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    """A template split once into literal chunks and placeholder names.
+    Rendering is a single join over the parts, no matter how many variables there are.
+    Placeholders without a value are left as-is, like the old str.replace loop did.
+    """
+
+    def __init__(self, name, source, mtime=None):
+        self.name = name
+        self.mtime = mtime
+        pieces = PLACEHOLDER.split(source)
+        # split() alternates literal, name, literal, name, ..., literal
+        self.literals = pieces[0::2]
+        self.keys = pieces[1::2]
+        self.variables = frozenset(self.keys)
+
+    def render(self, context):
+        parts = [self.literals[0]]
+        for key, literal in zip(self.keys, self.literals[1:]):
+            parts.append(str(context[key]) if key in context else "{{" + key + "}}")
+            parts.append(literal)
+        return "".join(parts)
+
+
+class TemplateEngine:
+    """Loads and compiles every template in TEMPLATE_DIR once.
+    With reload on, a template is recompiled when its file changes. Keeps per-template
+    render counts and timings for render_stats().
+    """
+
+    def __init__(self, template_dir=TEMPLATE_DIR, reload=EMAIL_TEMPLATE_RELOAD):
+        self.template_dir = template_dir
+        self.reload = reload
+        self._templates = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.load_all()
+
+    def _compile(self, name):
+        path = os.path.join(self.template_dir, name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Email template not found: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            template = CompiledTemplate(name, f.read(), os.path.getmtime(path))
+        with self._lock:
+            self._templates[name] = template
+        return template
+
+    def load_all(self):
+        """Compile every .html file in the template directory. Returns the names loaded.
+        """
+        names = sorted(n for n in os.listdir(self.template_dir) if n.endswith(".html"))
+        for name in names:
+            self._compile(name)
+        return names
+
+    def get(self, name):
+        template = self._templates.get(name)
+        if template is None:
+            return self._compile(name)
+        if self.reload:
+            path = os.path.join(self.template_dir, name)
+            if os.path.exists(path) and os.path.getmtime(path) != template.mtime:
+                return self._compile(name)
+        return template
+
+    def _record(self, name, count, seconds):
+        with self._lock:
+            stats = self._stats.setdefault(name, {"renders": 0, "seconds": 0.0})
+            stats["renders"] += count
+            stats["seconds"] += seconds
+
+    def render(self, name, **context):
+        """Render one template with context and return the HTML.
+        """
+        template = self.get(name)
+        start = time.perf_counter()
+        html = template.render(context)
+        self._record(name, 1, time.perf_counter() - start)
+        return html
+
+    def render_batch(self, name, contexts):
+        """Render one compiled template for many recipients; returns HTML in the same order.
+        """
+        template = self.get(name)
+        start = time.perf_counter()
+        htmls = [template.render(context) for context in contexts]
+        self._record(name, len(htmls), time.perf_counter() - start)
+        return htmls
+
+    def render_stats(self):
+        """Return {template: {"renders", "total_ms", "avg_us"}} since startup.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "renders": s["renders"],
+                    "total_ms": round(s["seconds"] * 1000, 2),
+                    "avg_us": round(s["seconds"] * 1e6 / s["renders"], 2) if s["renders"] else None,
+                }
+                for name, s in self._stats.items()
+            }
+
+
+engine = TemplateEngine()
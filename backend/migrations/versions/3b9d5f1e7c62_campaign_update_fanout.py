@@ -0,0 +1,43 @@
+"""campaign_updates fan-out progress columns and follows(campaign_id, user_id) index
+
+Revision ID: 3b9d5f1e7c62
+Revises: e41b7a3c9d28
+Create Date: 2026-10-18 16:21:05.904113
+
+Existing updates are marked as already notified so the fan-out sweeper does not
+email followers about old posts.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9d5f1e7c62'
+down_revision = 'e41b7a3c9d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('campaign_updates', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('notified_through', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('notified_at', sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE campaign_updates SET notified_at = coalesce(created_at, now())")
+
+    # sweeper lookup: WHERE notified_at IS NULL
+    op.create_index(
+        'ix_campaign_updates_pending_fanout', 'campaign_updates', ['created_at'],
+        unique=False, postgresql_where=sa.text('notified_at IS NULL')
+    )
+    op.create_index('ix_follows_campaign_id_user_id', 'follows', ['campaign_id', 'user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_follows_campaign_id_user_id', table_name='follows')
+    op.drop_index('ix_campaign_updates_pending_fanout', table_name='campaign_updates')
+
+    with op.batch_alter_table('campaign_updates', schema=None) as batch_op:
+        batch_op.drop_column('notified_at')
+        batch_op.drop_column('notified_through')
@@ -0,0 +1,55 @@
+"""indexes for the hot query predicates and a unique follow per user/campaign
+
+Revision ID: 5d2b8e9c4f07
+Revises: a1c4e7f20b31
+Create Date: 2026-10-18 11:40:52.604913
+
+Indexes are built CONCURRENTLY so the tables stay writable while this runs.
+Duplicate follows are removed first; run `flask reconcile-stats` afterwards
+to bring follower counters back in line. Use testing/explain_hot_queries.py
+before and after to compare plans.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2b8e9c4f07'
+down_revision = 'a1c4e7f20b31'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_donations_campaign_id_status', 'donations', ['campaign_id', 'status']),
+    ('ix_donations_user_id_created_at', 'donations', ['user_id', 'created_at']),
+    ('ix_comments_campaign_id_created_at', 'comments', ['campaign_id', 'created_at']),
+    ('ix_campaigns_status_created_at', 'campaigns', ['status', 'created_at']),
+    ('ix_campaigns_creator_id_status', 'campaigns', ['creator_id', 'status']),
+]
+
+
+def upgrade():
+    # keep the oldest row of any duplicate follow so the unique constraint can be added
+    op.execute("""
+        DELETE FROM follows f
+        USING follows older
+        WHERE f.user_id = older.user_id
+          AND f.campaign_id = older.campaign_id
+          AND f.follow_id > older.follow_id
+    """)
+    op.create_unique_constraint('uq_follows_user_id_campaign_id', 'follows', ['user_id', 'campaign_id'])
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False,
+                            postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    op.drop_constraint('uq_follows_user_id_campaign_id', 'follows', type_='unique')
@@ -0,0 +1,76 @@
+"""platform_stats_mv materialized view for the admin/home stats snapshot
+
+Revision ID: 6e0a4f8b2d19
+Revises: 3b9d5f1e7c62
+Create Date: 2026-10-18 21:04:37.512306
+
+The view is populated on creation, so the first snapshot is available before the
+refresh task runs. Keep the SELECT in sync with admin_stats_helper.STATS_SELECT.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6e0a4f8b2d19'
+down_revision = '3b9d5f1e7c62'
+branch_labels = None
+depends_on = None
+
+
+STATS_SELECT = """
+    WITH campaign_counts AS (
+        SELECT
+            count(*) AS total_campaigns,
+            count(*) FILTER (WHERE status = 'active') AS active_campaigns,
+            count(*) FILTER (WHERE status = 'pending') AS pending_campaigns,
+            count(*) FILTER (WHERE status = 'completed') AS completed_campaigns
+        FROM campaigns
+    ),
+    user_counts AS (
+        SELECT
+            count(*) AS total_users,
+            count(*) FILTER (WHERE role = 'creator') AS total_creators,
+            count(*) FILTER (WHERE role = 'donor') AS total_donors
+        FROM users
+    ),
+    donation_totals AS (
+        SELECT
+            coalesce(sum(d.amount), 0) AS total_raised,
+            coalesce(sum(d.amount) FILTER (WHERE EXISTS (
+                SELECT 1 FROM payments p
+                WHERE p.donation_id = d.donation_id AND p.payment_status = 'successful'
+            )), 0) AS total_raised_successful
+        FROM donations d
+    ),
+    top_campaign AS (
+        SELECT c.title, coalesce(sum(d.amount), 0) AS raised
+        FROM campaigns c
+        LEFT JOIN donations d ON d.campaign_id = c.campaign_id
+        GROUP BY c.campaign_id, c.title
+        ORDER BY raised DESC
+        LIMIT 1
+    )
+    SELECT
+        1 AS id,
+        cc.*,
+        uc.*,
+        dt.*,
+        tc.title AS top_campaign_title,
+        coalesce(tc.raised, 0) AS top_campaign_raised,
+        (now() AT TIME ZONE 'utc') AS refreshed_at
+    FROM campaign_counts cc
+    CROSS JOIN user_counts uc
+    CROSS JOIN donation_totals dt
+    LEFT JOIN top_campaign tc ON true
+"""
+
+
+def upgrade():
+    op.execute(f"CREATE MATERIALIZED VIEW IF NOT EXISTS platform_stats_mv AS {STATS_SELECT}")
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY needs a unique index
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS platform_stats_mv_id ON platform_stats_mv (id)")
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS platform_stats_mv")
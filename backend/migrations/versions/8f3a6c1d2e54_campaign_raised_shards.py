@@ -0,0 +1,30 @@
+"""campaign_raised_shards for sharded raised_amount counters
+
+Revision ID: 8f3a6c1d2e54
+Revises: 5d2b8e9c4f07
+Create Date: 2026-10-18 13:05:27.381904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3a6c1d2e54'
+down_revision = '5d2b8e9c4f07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('campaign_raised_shards',
+    sa.Column('campaign_id', sa.Integer(), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.campaign_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('campaign_id', 'shard')
+    )
+
+
+def downgrade():
+    op.drop_table('campaign_raised_shards')
@@ -0,0 +1,34 @@
+"""idempotency_keys.locked_until lease for in-progress requests
+
+Revision ID: 9c5e2a7d4b81
+Revises: 6e0a4f8b2d19
+Create Date: 2026-10-18 21:32:15.640918
+
+Keys already in progress get a lease from their created_at, so ones left behind
+by a crashed worker can be taken over by a retry.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c5e2a7d4b81'
+down_revision = '6e0a4f8b2d19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('locked_until', sa.DateTime(), nullable=True))
+
+    op.execute(
+        "UPDATE idempotency_keys SET locked_until = created_at + interval '60 seconds' "
+        "WHERE status_code IS NULL"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.drop_column('locked_until')
@@ -0,0 +1,95 @@
+"""keyset indexes, campaign full-text search and campaign_stats
+
+Revision ID: a1c4e7f20b31
+Revises: 
+Create Date: 2026-10-18 10:12:04.118220
+
+Assumes the base tables (users, campaigns, donations, payments, comments,
+follows, campaign_updates, admin_reviews) already exist.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'a1c4e7f20b31'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('campaigns', schema=None) as batch_op:
+        batch_op.add_column(sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ))
+        batch_op.create_index('ix_campaigns_created_at_campaign_id', ['created_at', 'campaign_id'], unique=False)
+        batch_op.create_index('ix_campaigns_search_vector', ['search_vector'], unique=False, postgresql_using='gin')
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index('ix_payments_transaction_date_payment_id', ['transaction_date', 'payment_id'], unique=False)
+
+    op.create_index(
+        'ix_admin_reviews_campaign_id_created_at',
+        'admin_reviews',
+        ['campaign_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+    op.create_table('campaign_stats',
+    sa.Column('campaign_id', sa.Integer(), nullable=False),
+    sa.Column('donor_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('follower_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.campaign_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('campaign_id')
+    )
+
+    # backfill counters for existing campaigns; later writes keep them up to date
+    op.execute("""
+        INSERT INTO campaign_stats (campaign_id, donor_count, comment_count, follower_count, updated_at)
+        SELECT c.campaign_id,
+               coalesce(d.donor_count, 0),
+               coalesce(cm.comment_count, 0),
+               coalesce(f.follower_count, 0),
+               now() at time zone 'utc'
+        FROM campaigns c
+        LEFT JOIN (
+            SELECT campaign_id, count(DISTINCT user_id) AS donor_count
+            FROM donations
+            WHERE status = 'completed'
+            GROUP BY campaign_id
+        ) d ON d.campaign_id = c.campaign_id
+        LEFT JOIN (
+            SELECT campaign_id, count(*) AS comment_count
+            FROM comments
+            GROUP BY campaign_id
+        ) cm ON cm.campaign_id = c.campaign_id
+        LEFT JOIN (
+            SELECT campaign_id, count(*) AS follower_count
+            FROM follows
+            GROUP BY campaign_id
+        ) f ON f.campaign_id = c.campaign_id
+    """)
+
+
+def downgrade():
+    op.drop_table('campaign_stats')
+    op.drop_index('ix_admin_reviews_campaign_id_created_at', table_name='admin_reviews')
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index('ix_payments_transaction_date_payment_id')
+
+    with op.batch_alter_table('campaigns', schema=None) as batch_op:
+        batch_op.drop_index('ix_campaigns_search_vector', postgresql_using='gin')
+        batch_op.drop_index('ix_campaigns_created_at_campaign_id')
+        batch_op.drop_column('search_vector')
@@ -0,0 +1,46 @@
+"""idempotency_keys table and one payment per donation
+
+Revision ID: c7e2d94b1a06
+Revises: 8f3a6c1d2e54
+Create Date: 2026-10-18 13:48:10.227615
+
+uq_payments_donation_id fails to build if a donation already has more than one
+payment; resolve those by hand before upgrading:
+
+    SELECT donation_id, count(*) FROM payments GROUP BY donation_id HAVING count(*) > 1;
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2d94b1a06'
+down_revision = '8f3a6c1d2e54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('idempotency_keys',
+    sa.Column('key', sa.String(length=300), nullable=False),
+    sa.Column('request_hash', sa.String(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_idempotency_keys_expires_at'), ['expires_at'], unique=False)
+
+    op.create_unique_constraint('uq_payments_donation_id', 'payments', ['donation_id'])
+
+
+def downgrade():
+    op.drop_constraint('uq_payments_donation_id', 'payments', type_='unique')
+
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_idempotency_keys_expires_at'))
+
+    op.drop_table('idempotency_keys')
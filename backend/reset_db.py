@@ -1,10 +1,24 @@
 #only run this file if u wanna reset the database
+# Builds a fresh schema from the current models and stamps it at the latest migration,
+# so `flask db upgrade` only applies migrations added after this point.
+# Run from the backend directory: python reset_db.py
+import os
+os.environ["BACKGROUND_WORKERS"] = "false"
+
 from api import app, db
+from api.helpers.admin_stats_helper import STATS_VIEW, create_stats_view
+from flask_migrate import stamp
+from sqlalchemy import text
 
 with app.app_context():
+    # the view depends on campaigns, users, donations and payments, so drop_all can't remove them first
+    db.session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {STATS_VIEW}"))
+    db.session.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    db.session.commit()
     db.drop_all()
     db.create_all()
+    # objects that only migrations create
+    create_stats_view()
+    stamp(revision="head")
 
 print("✅ Database reset successfully!")
-
-
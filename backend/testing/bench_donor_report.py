@@ -0,0 +1,68 @@
+"""
+Benchmark the admin donor report (/campaigns/get-donors)
+Counts SQL statements and wall time per request for growing page sizes,
+to confirm the report issues a constant number of queries.
+Run this from the backend/testing directory: python bench_donor_report.py
+"""
+
+import sys
+import os
+import time
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from sqlalchemy import event
+from api import app, db
+
+PAGE_SIZES = [5, 10, 25, 50, 100]
+RUNS = 5
+
+
+def main():
+    statements = []
+
+    with app.app_context():
+        engine = db.engine
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+        client = app.test_client()
+
+        print("=" * 60)
+        print("DONOR REPORT BENCHMARK")
+        print("=" * 60)
+        print(f"{'per_page':>10} {'rows':>6} {'queries':>8} {'avg ms':>10}")
+        print("-" * 60)
+
+        try:
+            for per_page in PAGE_SIZES:
+                timings = []
+                for _ in range(RUNS):
+                    statements.clear()
+                    start = time.perf_counter()
+                    response = client.get(f"/campaigns/get-donors?per_page={per_page}")
+                    timings.append((time.perf_counter() - start) * 1000)
+
+                data = response.get_json()
+                if response.status_code != 200:
+                    print(f"✗ Request failed: {data}")
+                    return
+
+                avg_ms = sum(timings) / len(timings)
+                print(f"{per_page:>10} {len(data['data']):>6} {len(statements):>8} {avg_ms:>10.2f}")
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        print("-" * 60)
+        print("The query count should be the same for every page size.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark email template rendering for a follower fan-out
+Compares the old per-message path (read the file, str.replace once per variable)
+with one render_batch call on the precompiled template, for RECIPIENTS recipients.
+Also checks both paths produce identical HTML. No database or SMTP needed.
+Run this from the backend/testing directory: python bench_email_templates.py
+"""
+
+import sys
+import os
+import time
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from email_service.template_engine import engine, TEMPLATE_DIR
+
+RECIPIENTS = 10_000
+TEMPLATE = "campaign_approved.html"
+
+
+def render_old(template_name, **kwargs):
+    """The previous send_email rendering, kept here for comparison."""
+    with open(os.path.join(TEMPLATE_DIR, template_name), "r", encoding="utf-8") as f:
+        html_template = f.read()
+    for key, value in kwargs.items():
+        html_template = html_template.replace(f"{{{{{key}}}}}", str(value))
+    return html_template
+
+
+def main():
+    contexts = [
+        {
+            "username": f"Follower {i}",
+            "campaign_name": "Help Build Schools in Rural Areas",
+            "campaign_link": "https://crowdfundpk.com/campaign/123",
+            "platform_name": "CrowdFundPK",
+        }
+        for i in range(RECIPIENTS)
+    ]
+
+    print("=" * 70)
+    print(f"EMAIL TEMPLATE RENDERING ({RECIPIENTS:,} recipients, {TEMPLATE})")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    old = [render_old(TEMPLATE, **context) for context in contexts]
+    old_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    new = engine.render_batch(TEMPLATE, contexts)
+    new_ms = (time.perf_counter() - start) * 1000
+
+    print(f"  file read + str.replace   {old_ms:9.1f} ms   ({old_ms * 1000 / RECIPIENTS:6.1f} us/email)")
+    print(f"  precompiled render_batch  {new_ms:9.1f} ms   ({new_ms * 1000 / RECIPIENTS:6.1f} us/email)")
+    print(f"  speedup                   {old_ms / new_ms:9.1f}x")
+    print("✓ Output identical" if old == new else "✗ Output differs")
+    print(f"Render stats: {engine.render_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark password checks on the login path
+Simulates a burst of logins from REQUEST_THREADS request threads (gunicorn runs 4
+per worker) and compares checking bcrypt inline on the request thread with the
+bounded password_helper executor, at a few bcrypt costs. Also shows how many
+logins were turned away with 503 and what the queue looked like.
+Uses in-memory hashes, no database needed.
+Run this from the backend/testing directory: python bench_login.py
+"""
+
+import sys
+import os
+import time
+import threading
+import statistics
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from api import app, bcrypt
+from api.helpers import password_helper
+
+REQUEST_THREADS = 16
+LOGINS_PER_THREAD = 8
+COSTS = (10, 12)
+PASSWORD = "correct horse battery staple"
+
+
+def burst(check):
+    """Run REQUEST_THREADS x LOGINS_PER_THREAD logins through check().
+    Returns (elapsed seconds, latencies in ms, rejected count).
+    """
+    latencies, rejected = [], []
+    barrier = threading.Barrier(REQUEST_THREADS)
+
+    def worker():
+        barrier.wait()
+        for _ in range(LOGINS_PER_THREAD):
+            start = time.perf_counter()
+            try:
+                assert check()
+                latencies.append((time.perf_counter() - start) * 1000)
+            except password_helper.HashingBusy:
+                rejected.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(REQUEST_THREADS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, latencies, len(rejected)
+
+
+def report(label, elapsed, latencies, rejected):
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    print(f"  {label:<10} {len(latencies) / elapsed:8.1f} logins/s   "
+          f"p50 {statistics.median(latencies):7.1f} ms   p95 {p95:7.1f} ms   rejected {rejected}")
+
+
+def main():
+    print("=" * 80)
+    print(f"LOGIN BENCHMARK ({REQUEST_THREADS} request threads x {LOGINS_PER_THREAD} logins, "
+          f"{password_helper.PASSWORD_HASH_WORKERS} hash workers, "
+          f"queue limit {password_helper.PASSWORD_HASH_QUEUE_LIMIT})")
+    print("=" * 80)
+
+    with app.app_context():
+        for cost in COSTS:
+            password_hash = bcrypt.generate_password_hash(PASSWORD, cost).decode("utf-8")
+            print(f"bcrypt cost {cost}:")
+            report("inline", *burst(lambda: bcrypt.check_password_hash(password_hash, PASSWORD)))
+            report("executor", *burst(lambda: password_helper.check_password(password_hash, PASSWORD)))
+
+        old_hash = bcrypt.generate_password_hash(PASSWORD, password_helper.log_rounds() - 1).decode("utf-8")
+        print(f"\nRehash on login: cost {password_helper.hash_cost(old_hash)} hash needs rehash "
+              f"at configured cost {password_helper.log_rounds()}: {password_helper.needs_rehash(old_hash)}")
+        print(f"Executor stats: {password_helper.hashing_stats()}")
+
+
+if __name__ == "__main__":
+    main()
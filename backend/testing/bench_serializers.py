@@ -0,0 +1,93 @@
+"""
+Benchmark campaign list serialization on 10k rows
+Compares the per-row model to_dict() + stdlib json path with the compiled
+column-tuple serializer + orjson path. Uses in-memory rows, no database needed.
+Run this from the backend/testing directory: python bench_serializers.py
+"""
+
+import sys
+import os
+import json
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from api import app
+from api.models.cf_models import Campaigns, Users, CampaignCategory, CampaignStatus
+from api.helpers.serializer_helper import serialize_campaign, serialize_rows
+from api.helpers.json_helper import dumps, orjson
+
+ROWS = 10_000
+RUNS = 5
+
+
+def build_rows():
+    """Return the same campaigns as ORM objects and as column tuples."""
+    objects, tuples = [], []
+    start = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    for i in range(ROWS):
+        creator = Users(user_id=i % 500, username=f"creator{i % 500}", profile_image=None)
+        values = dict(
+            campaign_id=i,
+            title=f"Campaign {i}",
+            description="A campaign description " * 4,
+            category=CampaignCategory.education,
+            goal_amount=Decimal("10000.00"),
+            raised_amount=Decimal(i % 10000) + Decimal("0.50"),
+            image=f"https://example.com/{i}.jpg",
+            status=CampaignStatus.active,
+            start_date=start,
+            end_date=start + timedelta(days=30),
+            created_at=start + timedelta(minutes=i),
+        )
+        objects.append(Campaigns(creator=creator, **values))
+        tuples.append((*values.values(), creator.user_id, creator.username, creator.profile_image))
+    return objects, tuples
+
+
+def timed(func):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), result
+
+
+def main():
+    if orjson is None:
+        print("✗ orjson is not installed: pip install -r requirements.txt")
+        return
+
+    with app.app_context():
+        objects, tuples = build_rows()
+
+        to_dict_ms, legacy = timed(lambda: [c.to_dict() for c in objects])
+        compiled_ms, fast = timed(lambda: serialize_rows(serialize_campaign, tuples))
+        if legacy != fast:
+            print("✗ Compiled serializer output differs from to_dict()")
+            return
+
+        json_ms, _ = timed(lambda: json.dumps(legacy))
+        orjson_ms, _ = timed(lambda: dumps(fast))
+
+        print("=" * 60)
+        print(f"SERIALIZATION BENCHMARK ({ROWS} campaigns, best of {RUNS})")
+        print("=" * 60)
+        print(f"{'step':<32} {'to_dict/json':>12} {'compiled/orjson':>15}")
+        print("-" * 60)
+        print(f"{'rows -> dicts (ms)':<32} {to_dict_ms:>12.2f} {compiled_ms:>15.2f}")
+        print(f"{'dicts -> JSON bytes (ms)':<32} {json_ms:>12.2f} {orjson_ms:>15.2f}")
+        print(f"{'total (ms)':<32} {to_dict_ms + json_ms:>12.2f} {compiled_ms + orjson_ms:>15.2f}")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Authorization check for the admin-only export endpoints
+Calls /donations/export and /payments/export through the Flask test client with no
+token, a malformed token and a donor token, expecting 401, 401 and 403 as JSON, and
+with an admin token, expecting 200. The admin request reads the database.
+Run this from the backend/testing directory: python check_admin_exports.py
+"""
+
+import sys
+import os
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from api import app
+from api.helpers.security_helper import generate_jwt
+
+ENDPOINTS = ["/donations/export", "/payments/export"]
+
+
+def main():
+    with app.app_context():
+        donor = generate_jwt(1, "export_check_donor", "donor")
+        admin = generate_jwt(1, "export_check_admin", "admin")
+
+    cases = [
+        ("no token", {}, 401),
+        ("bad token", {"Authorization": "Bearer not-a-jwt"}, 401),
+        ("donor token", {"Authorization": f"Bearer {donor}"}, 403),
+        ("admin token", {"Authorization": f"Bearer {admin}"}, 200),
+    ]
+
+    print("=" * 60)
+    print("ADMIN EXPORT AUTHORIZATION CHECK")
+    print("=" * 60)
+
+    client = app.test_client()
+    results = []
+    for endpoint in ENDPOINTS:
+        for label, headers, expected in cases:
+            response = client.get(endpoint, headers=headers)
+            ok = response.status_code == expected
+            if expected != 200:
+                ok = ok and (response.get_json(silent=True) or {}).get("status") == "error"
+            results.append(ok)
+            mark = "✓" if ok else "✗"
+            print(f"{mark} {endpoint:<20} {label:<12} {response.status_code} (expected {expected})")
+
+    print("=" * 60)
+    print("All checks passed" if all(results) else "Some checks FAILED")
+
+
+if __name__ == "__main__":
+    main()
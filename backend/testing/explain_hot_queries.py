@@ -0,0 +1,172 @@
+"""
+Capture EXPLAIN (ANALYZE, BUFFERS) plans for the hot endpoint queries
+Run before and after applying the index migration, then compare:
+
+    python explain_hot_queries.py before
+    flask db upgrade
+    python explain_hot_queries.py after
+    python explain_hot_queries.py compare
+
+Run this from the backend/testing directory. Plans are saved next to this
+script as explain_<label>.json.
+"""
+
+import sys
+import os
+import json
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from sqlalchemy import text
+from api import app, db
+
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (endpoint, SQL); :campaign_id / :user_id are filled from the busiest rows
+HOT_QUERIES = {
+    "campaign_listing": (
+        "GET /campaigns/",
+        """SELECT c.campaign_id, c.title, u.username
+           FROM campaigns c JOIN users u ON u.user_id = c.creator_id
+           WHERE c.status != 'pending'
+           ORDER BY c.created_at DESC, c.campaign_id DESC
+           LIMIT 21""",
+    ),
+    "campaigns_by_status": (
+        "GET /campaigns/status/<status>",
+        """SELECT * FROM campaigns
+           WHERE status = 'active'
+           ORDER BY created_at DESC, campaign_id DESC
+           LIMIT 51""",
+    ),
+    "creator_active_campaigns": (
+        "GET /creator/dashboard",
+        """SELECT campaign_id, raised_amount FROM campaigns
+           WHERE creator_id = :creator_id AND status = 'active'""",
+    ),
+    "recent_donors": (
+        "GET /donations/recent-donors/<campaign_id>",
+        """SELECT * FROM donations
+           WHERE campaign_id = :campaign_id AND status = 'completed'""",
+    ),
+    "available_amount": (
+        "campaign_helper.get_campaign_available_amount",
+        """SELECT sum(amount) FROM donations
+           WHERE campaign_id = :campaign_id AND status IN ('pending', 'completed')""",
+    ),
+    "donation_history": (
+        "GET /donations/history/<donor_id>",
+        """SELECT d.amount, d.created_at, c.title FROM donations d
+           JOIN campaigns c ON c.campaign_id = d.campaign_id
+           WHERE d.user_id = :user_id AND c.status != 'pending'
+           ORDER BY d.created_at DESC""",
+    ),
+    "campaign_comments": (
+        "GET /comments/get-comments/<campaign_id>",
+        """SELECT * FROM comments
+           WHERE campaign_id = :campaign_id
+           ORDER BY created_at DESC""",
+    ),
+    "is_following": (
+        "POST /follows/toggle-follow/<user_id>/<campaign_id>",
+        """SELECT follow_id FROM follows
+           WHERE user_id = :user_id AND campaign_id = :campaign_id
+           LIMIT 1""",
+    ),
+}
+
+
+def sample_parameters():
+    """Use the campaign, donor and creator with the most rows so plans are realistic."""
+    campaign_id = db.session.execute(text(
+        "SELECT campaign_id FROM donations GROUP BY campaign_id ORDER BY count(*) DESC LIMIT 1"
+    )).scalar() or 1
+    user_id = db.session.execute(text(
+        "SELECT user_id FROM donations GROUP BY user_id ORDER BY count(*) DESC LIMIT 1"
+    )).scalar() or 1
+    creator_id = db.session.execute(text(
+        "SELECT creator_id FROM campaigns GROUP BY creator_id ORDER BY count(*) DESC LIMIT 1"
+    )).scalar() or 1
+    return {"campaign_id": campaign_id, "user_id": user_id, "creator_id": creator_id}
+
+
+def scan_nodes(plan):
+    """List 'Node Type on relation (index)' for every scan in a JSON plan tree."""
+    nodes = []
+    if "Relation Name" in plan:
+        label = f"{plan['Node Type']} on {plan['Relation Name']}"
+        if "Index Name" in plan:
+            label += f" ({plan['Index Name']})"
+        nodes.append(label)
+    for child in plan.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def capture(label):
+    results = {}
+    with app.app_context():
+        params = sample_parameters()
+        print(f"Sample parameters: {params}")
+
+        for name, (endpoint, sql) in HOT_QUERIES.items():
+            explain = text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+            used = {k: v for k, v in params.items() if f":{k}" in sql}
+            plan = db.session.execute(explain, used).scalar()[0]
+            db.session.rollback()
+
+            results[name] = {
+                "endpoint": endpoint,
+                "execution_ms": plan["Execution Time"],
+                "shared_hit": plan["Plan"].get("Shared Hit Blocks", 0),
+                "shared_read": plan["Plan"].get("Shared Read Blocks", 0),
+                "scans": scan_nodes(plan["Plan"]),
+                "plan": plan,
+            }
+            print(f"✓ {name:<26} {plan['Execution Time']:>9.3f} ms  {', '.join(results[name]['scans'])}")
+
+    path = os.path.join(OUTPUT_DIR, f"explain_{label}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, default=str)
+    print(f"\nSaved plans to {path}")
+
+
+def compare():
+    with open(os.path.join(OUTPUT_DIR, "explain_before.json"), encoding="utf-8") as f:
+        before = json.load(f)
+    with open(os.path.join(OUTPUT_DIR, "explain_after.json"), encoding="utf-8") as f:
+        after = json.load(f)
+
+    print("=" * 80)
+    print(f"{'query':<26} {'before ms':>10} {'after ms':>10} {'buffers before':>15} {'buffers after':>14}")
+    print("-" * 80)
+    for name in HOT_QUERIES:
+        if name not in before or name not in after:
+            continue
+        b, a = before[name], after[name]
+        print(f"{name:<26} {b['execution_ms']:>10.3f} {a['execution_ms']:>10.3f} "
+              f"{b['shared_hit'] + b['shared_read']:>15} {a['shared_hit'] + a['shared_read']:>14}")
+        if b["scans"] != a["scans"]:
+            print(f"    before: {', '.join(b['scans'])}")
+            print(f"    after:  {', '.join(a['scans'])}")
+    print("=" * 80)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        return
+
+    if sys.argv[1] == "compare":
+        compare()
+    else:
+        capture(sys.argv[1])
+
+
+if __name__ == "__main__":
+    main()
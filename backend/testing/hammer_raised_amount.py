@@ -0,0 +1,147 @@
+"""
+Concurrency test for raised_amount updates
+Creates a throwaway campaign, then has many threads add donations to it at once
+through raised_amount_helper.add_to_raised, each in its own transaction.
+Checks that no update was lost, that reaching the goal completes the campaign and
+that donations past the goal or to a completed campaign are rejected, and prints
+throughput, first in the default (single row) mode and then with sharding enabled.
+Run this from the backend/testing directory: python hammer_raised_amount.py
+"""
+
+import sys
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from api import app, db
+from api.models.cf_models import Campaigns, Users, CampaignCategory, CampaignStatus
+from api.helpers import raised_amount_helper
+
+THREADS = 16
+DONATIONS_PER_THREAD = 50
+AMOUNT = Decimal("1.25")
+
+
+def create_campaign(goal):
+    creator = Users.query.first()
+    if not creator:
+        raise RuntimeError("Create at least one user first (see create_test_user.py)")
+    campaign = Campaigns(
+        creator_id=creator.user_id,
+        title="Concurrency test campaign",
+        description="Temporary campaign created by hammer_raised_amount.py",
+        category=CampaignCategory.charity,
+        goal_amount=goal,
+        raised_amount=0,
+        image="https://example.com/test.jpg",
+        status=CampaignStatus.active,
+        start_date=datetime.utcnow(),
+        end_date=datetime.utcnow() + timedelta(days=1),
+    )
+    db.session.add(campaign)
+    db.session.commit()
+    return campaign.campaign_id
+
+
+def hammer(campaign_id):
+    accepted = []
+    rejected = []
+    errors = []
+    barrier = threading.Barrier(THREADS)
+
+    def worker():
+        with app.app_context():
+            barrier.wait()
+            for _ in range(DONATIONS_PER_THREAD):
+                try:
+                    raised_amount_helper.add_to_raised(campaign_id, AMOUNT)
+                    db.session.commit()
+                    accepted.append(AMOUNT)
+                except ValueError as e:
+                    db.session.rollback()
+                    rejected.append(e)
+                except Exception as e:
+                    db.session.rollback()
+                    errors.append(e)
+            db.session.remove()
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, len(accepted), rejected, errors
+
+
+def run(label, goal, sharded):
+    total = THREADS * DONATIONS_PER_THREAD
+
+    campaign_id = create_campaign(goal)
+    try:
+        if sharded:
+            raised_amount_helper.enable_sharding(campaign_id)
+
+        elapsed, accepted, rejected, errors = hammer(campaign_id)
+        expected = AMOUNT * accepted
+
+        if sharded:
+            raised_amount_helper.fold_raised_shards()
+        db.session.expire_all()
+        campaign = db.session.get(Campaigns, campaign_id)
+
+        ok = not errors and campaign.raised_amount == expected and accepted + len(rejected) == total
+        if goal <= AMOUNT * total:
+            ok = ok and campaign.status == CampaignStatus.completed and rejected
+            # the single row is never pushed past the goal; concurrent shards may overshoot
+            # by the donations in flight when the goal was reached
+            ok = ok and (campaign.raised_amount >= goal if sharded else campaign.raised_amount == goal)
+            try:
+                raised_amount_helper.add_to_raised(campaign_id, AMOUNT)
+                ok = False
+            except ValueError:
+                pass
+            db.session.rollback()
+        else:
+            ok = ok and not rejected
+
+        mark = "✓" if ok else "✗"
+        print(f"{mark} {label:<28} raised {campaign.raised_amount} (expected {expected}), "
+              f"{len(rejected)} rejected, status {campaign.status.value}, {total / elapsed:,.0f} donations/s")
+        for e in errors[:3]:
+            print(f"    error: {e}")
+        return ok
+    finally:
+        db.session.delete(db.session.get(Campaigns, campaign_id))
+        db.session.commit()
+
+
+def main():
+    total = THREADS * DONATIONS_PER_THREAD
+    print("=" * 70)
+    print(f"RAISED_AMOUNT CONCURRENCY TEST ({THREADS} threads x {DONATIONS_PER_THREAD} donations)")
+    print("=" * 70)
+
+    with app.app_context():
+        results = [
+            run("single row, under goal", AMOUNT * total * 2, sharded=False),
+            run("single row, goal reached", AMOUNT * total / 2, sharded=False),
+            run("sharded, under goal", AMOUNT * total * 2, sharded=True),
+            run("sharded, goal reached", AMOUNT * total / 2, sharded=True),
+        ]
+
+    print("=" * 70)
+    print("All checks passed" if all(results) else "Some checks FAILED")
+
+
+if __name__ == "__main__":
+    main()
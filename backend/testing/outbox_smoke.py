@@ -0,0 +1,72 @@
+"""
+Email outbox smoke test against a local SMTP sink
+Queues EMAILS messages in the outbox, drains them through the pooled SMTP worker
+and prints throughput and the final status of each row. Start a sink first:
+    python -m aiosmtpd -n -l localhost:1025
+Run this from the backend/testing directory: python outbox_smoke.py
+"""
+
+import sys
+import os
+import time
+
+# Point the sender at the local sink unless told otherwise (read when email_sender is imported)
+os.environ.setdefault("SMTP_SERVER", "localhost")
+os.environ.setdefault("SMTP_PORT", "1025")
+os.environ.setdefault("SMTP_USE_TLS", "false")
+os.environ.setdefault("SENDER_EMAIL", "outbox-test@localhost")
+
+# Add backend directory to path (parent of testing directory)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+# Change working directory to backend so config.cfg can be found
+os.chdir(backend_dir)
+
+from api import app, db
+from api.models.cf_models import EmailOutbox, EmailStatus
+from api.helpers import outbox_helper
+
+EMAILS = 500
+
+
+def main():
+    print("=" * 70)
+    print(f"EMAIL OUTBOX SMOKE TEST ({EMAILS} emails, batch {outbox_helper.OUTBOX_BATCH_SIZE}, "
+          f"sink {os.environ['SMTP_SERVER']}:{os.environ['SMTP_PORT']})")
+    print("=" * 70)
+
+    with app.app_context():
+        emails = [
+            {
+                "recipient": f"user{i}@example.com",
+                "subject": "Outbox smoke test",
+                "template_name": "welcome.html",
+                "context": {"username": f"User {i}"},
+            }
+            for i in range(EMAILS)
+        ]
+        start = time.perf_counter()
+        outbox_helper.enqueue_emails(emails)
+        db.session.commit()
+        print(f"Queued {EMAILS} emails in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        sent, failed = outbox_helper.drain_all()
+        elapsed = time.perf_counter() - start
+        print(f"Sent {sent}, failed {failed} in {elapsed:.2f} s ({sent / elapsed:,.0f} emails/s)")
+
+        counts = outbox_helper.outbox_counts()
+        print(f"Outbox status: {counts}")
+
+        ok = sent == EMAILS and failed == 0
+        print("✓ All emails delivered" if ok else "✗ Some emails were not delivered")
+
+        db.session.query(EmailOutbox).filter(
+            EmailOutbox.subject == "Outbox smoke test", EmailOutbox.status == EmailStatus.sent
+        ).delete(synchronize_session=False)
+        db.session.commit()
+
+
+if __name__ == "__main__":
+    main()
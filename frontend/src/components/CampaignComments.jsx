@@ -36,6 +36,23 @@ function CampaignComments({ campaign_id }) {
         }
     };
 
+    // One request for the viewer's like state on every loaded comment
+    const commentIds = comments.slice(0, 100).map((c) => c.comment_id).join(",");
+    const fetchLikedStatus = async () => {
+        if (!user || !commentIds) return;
+        try {
+            const res = await fetch(`${backendUrl}/comments/liked-status/${user.user_id}?comment_ids=${commentIds}`);
+            const data = await res.json();
+            if (data.success) {
+                setLikedComments(new Set(
+                    Object.entries(data.liked).filter(([, liked]) => liked).map(([id]) => Number(id))
+                ));
+            }
+        } catch (err) {
+            console.error("Error fetching liked comments:", err);
+        }
+    };
+
     useEffect(() => {
         const storedUser = getUser();
         if (storedUser) {
@@ -53,6 +70,10 @@ function CampaignComments({ campaign_id }) {
         if (campaign_id) fetchComments();
     }, [campaign_id]);
 
+    useEffect(() => {
+        fetchLikedStatus();
+    }, [commentIds, user]);
+
     // ✅ Post new comment
     const handleSubmitComment = async () => {
         if (!newComment.trim()) return;
@@ -89,9 +110,18 @@ function CampaignComments({ campaign_id }) {
             });
 
             const data = await res.json();
-            console.log("Updated likes:", data.likes);
-
-            await fetchComments();
+            if (!data.success) return;
+
+            // the stored count is flushed in batches, so use the count from the response
+            setComments((prev) =>
+                prev.map((c) => (c.comment_id === id ? { ...c, likes: data.likes } : c))
+            );
+            setLikedComments((prev) => {
+                const next = new Set(prev);
+                if (data.liked) next.add(id);
+                else next.delete(id);
+                return next;
+            });
 
         } catch (err) {
             console.error("Error liking comment:", err);
@@ -16,21 +16,25 @@ const TransactionHistory = () => {
   const { toast } = useToast();
 
   const [transactions, setTransactions] = useState([]);
-  const [page, setPage] = useState(1);
+  // cursors[i] is the cursor that loads page i + 1; the last entry is the page on screen
+  const [cursors, setCursors] = useState([null]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [limit] = useState(5);
-  const [totalPages, setTotalPages] = useState(1);
+  const page = cursors.length;
 
   const fetchTransactions = async () => {
     try {
       const backendUrl = import.meta.env.VITE_BACKEND_URL;
+      const cursor = cursors[cursors.length - 1];
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
       const response = await fetch(
-        `${backendUrl}/payments/transaction-history?page=${page}&limit=${limit}`
+        `${backendUrl}/payments/transaction-history?limit=${limit}${cursorParam}`
       );
       const data = await response.json();
 
       if (data.status === "success") {
         setTransactions(data.data);
-        setTotalPages(data.total_pages);
+        setNextCursor(data.next_cursor);
       } else {
         toast({ title: "Error", description: data.message, variant: "destructive" });
       }
@@ -41,7 +45,7 @@ const TransactionHistory = () => {
 
   useEffect(() => {
     fetchTransactions();
-  }, [page]);
+  }, [cursors]);
 
   const formatCurrency = (amount) => {
     return new Intl.NumberFormat('en-US', {
@@ -104,20 +108,19 @@ const TransactionHistory = () => {
           <Button 
             variant="outline" 
             disabled={page === 1}
-            onClick={() => setPage(prev => Math.max(prev - 1, 1))}
+            onClick={() => setCursors(prev => prev.slice(0, -1))}
           >
             Previous
           </Button>
 
           <p className="text-sm text-gray-300">
-            Page <span className="font-semibold text-gray-100">{page}</span> of{" "}
-            <span className="font-semibold text-gray-100">{totalPages}</span>
+            Page <span className="font-semibold text-gray-100">{page}</span>
           </p>
 
           <Button 
             variant="outline" 
-            disabled={page === totalPages}
-            onClick={() => setPage(prev => Math.min(prev + 1, totalPages))}
+            disabled={!nextCursor}
+            onClick={() => setCursors(prev => [...prev, nextCursor])}
           >
             Next
           </Button>
@@ -9,11 +9,12 @@ const UsersTab = () => {
   const [creators, setCreators] = useState([]);
   const [donors, setDonors] = useState([]);
 
-  const [creatorPage, setCreatorPage] = useState(1);
-  const [creatorTotalPages, setCreatorTotalPages] = useState(1);
+  // cursors[i] is the cursor that loads page i; the last entry is the page on screen
+  const [creatorCursors, setCreatorCursors] = useState([null]);
+  const [creatorNextCursor, setCreatorNextCursor] = useState(null);
 
-  const [donorPage, setDonorPage] = useState(1);
-  const [donorTotalPages, setDonorTotalPages] = useState(1);
+  const [donorCursors, setDonorCursors] = useState([null]);
+  const [donorNextCursor, setDonorNextCursor] = useState(null);
   const backendUrl = import.meta.env.VITE_BACKEND_URL;
   const perPage = 5;
 
@@ -24,14 +25,14 @@ const UsersTab = () => {
     new Date(dateString).toLocaleDateString('en-US', { year: 'numeric', month: 'short', day: 'numeric' });
 
   // Fetch creators
-  const fetchCreators = async (page = 1) => {
+  const fetchCreators = async (cursor = null) => {
     try {
-      const res = await fetch(`${backendUrl}/campaigns/get-creators?page=${page}&per_page=${perPage}`);
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+      const res = await fetch(`${backendUrl}/campaigns/get-creators?per_page=${perPage}${cursorParam}`);
       const data = await res.json();
       if (data.status === "success") {
         setCreators(data.data);
-        setCreatorPage(data.page);
-        setCreatorTotalPages(data.total_pages);
+        setCreatorNextCursor(data.next_cursor);
       }
     } catch (err) {
       console.error(err);
@@ -39,22 +40,22 @@ const UsersTab = () => {
   };
 
   // Fetch donors
-  const fetchDonors = async (page = 1) => {
+  const fetchDonors = async (cursor = null) => {
     try {
-      const res = await fetch(`${backendUrl}/campaigns/get-donors?page=${page}&per_page=${perPage}`);
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+      const res = await fetch(`${backendUrl}/campaigns/get-donors?per_page=${perPage}${cursorParam}`);
       const data = await res.json();
       if (data.status === "success") {
         setDonors(data.data);
-        setDonorPage(data.page);
-        setDonorTotalPages(data.total_pages);
+        setDonorNextCursor(data.next_cursor);
       }
     } catch (err) {
       console.error(err);
     }
   };
 
-  useEffect(() => { fetchCreators(creatorPage); }, [creatorPage]);
-  useEffect(() => { fetchDonors(donorPage); }, [donorPage]);
+  useEffect(() => { fetchCreators(creatorCursors[creatorCursors.length - 1]); }, [creatorCursors]);
+  useEffect(() => { fetchDonors(donorCursors[donorCursors.length - 1]); }, [donorCursors]);
 
   return (
     <>
@@ -98,10 +99,10 @@ const UsersTab = () => {
           </Table>
           {/* Pagination */}
           <div className="flex justify-end gap-2 mt-2">
-            <Button size="sm" variant="outline" disabled={creatorPage === 1} onClick={() => setCreatorPage(prev => prev - 1)}>
+            <Button size="sm" variant="outline" disabled={creatorCursors.length === 1} onClick={() => setCreatorCursors(prev => prev.slice(0, -1))}>
               <ChevronLeft /> Prev
             </Button>
-            <Button size="sm" variant="outline" disabled={creatorPage === creatorTotalPages} onClick={() => setCreatorPage(prev => prev + 1)}>
+            <Button size="sm" variant="outline" disabled={!creatorNextCursor} onClick={() => setCreatorCursors(prev => [...prev, creatorNextCursor])}>
               Next <ChevronRight />
             </Button>
           </div>
@@ -148,10 +149,10 @@ const UsersTab = () => {
           </Table>
           {/* Pagination */}
           <div className="flex justify-end gap-2 mt-2">
-            <Button size="sm" variant="outline" disabled={donorPage === 1} onClick={() => setDonorPage(prev => prev - 1)}>
+            <Button size="sm" variant="outline" disabled={donorCursors.length === 1} onClick={() => setDonorCursors(prev => prev.slice(0, -1))}>
               <ChevronLeft /> Prev
             </Button>
-            <Button size="sm" variant="outline" disabled={donorPage === donorTotalPages} onClick={() => setDonorPage(prev => prev + 1)}>
+            <Button size="sm" variant="outline" disabled={!donorNextCursor} onClick={() => setDonorCursors(prev => [...prev, donorNextCursor])}>
               Next <ChevronRight />
             </Button>
           </div>
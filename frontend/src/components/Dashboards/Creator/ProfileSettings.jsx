@@ -78,6 +78,7 @@ function ProfileSettings() {
 
     if (data?.Success) {
       localStorage.setItem("user", JSON.stringify(data.user))
+      if (data.access_token) localStorage.setItem("access_token", data.access_token)
       toast({
         title: "Profile Updated",
         description: "Your account details were saved successfully!",
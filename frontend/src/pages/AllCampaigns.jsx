@@ -12,38 +12,46 @@ export default function AllCampaigns() {
   const [searchTerm, setSearchTerm] = useState("")
   const [categoryFilter, setCategoryFilter] = useState("all")
   const [sortBy, setSortBy] = useState("newest")
-
-  // API call to fetch campaigns from database
-  useEffect(() => {
-    const fetchCampaigns = async () => {
-      try {
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+
+  // API call to fetch campaigns from database, one keyset page at a time
+  const fetchCampaigns = async (cursor = null) => {
+    try {
+      if (cursor) {
+        setLoadingMore(true);
+      } else {
         setLoading(true);
-        setError(null);
-
-        const backendUrl = import.meta.env.VITE_BACKEND_URL;
-        const response = await fetch(`${backendUrl}/campaigns/`);
+      }
+      setError(null);
 
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`);
-        }
+      const backendUrl = import.meta.env.VITE_BACKEND_URL;
+      const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+      const response = await fetch(`${backendUrl}/campaigns/${query}`);
 
-        const data = await response.json();
-        console.log('Fetched data:', data);
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
 
-        if (data.success && data.campaigns) {
-          setCampaigns(data.campaigns);
-        } else {
-          throw new Error('Invalid response format');
-        }
+      const data = await response.json();
 
-      } catch (err) {
-        console.error('Error fetching campaigns:', err);
-        setError(err.message);
-      } finally {
-        setLoading(false);
+      if (data.success && data.campaigns) {
+        setCampaigns(prev => cursor ? [...prev, ...data.campaigns] : data.campaigns);
+        setNextCursor(data.next_cursor || null);
+      } else {
+        throw new Error('Invalid response format');
       }
-    };
 
+    } catch (err) {
+      console.error('Error fetching campaigns:', err);
+      setError(err.message);
+    } finally {
+      setLoading(false);
+      setLoadingMore(false);
+    }
+  };
+
+  useEffect(() => {
     fetchCampaigns();
   }, []);
 
@@ -287,6 +295,19 @@ export default function AllCampaigns() {
               </Button>
             </div>
           )}
+
+          {/* Load More */}
+          {nextCursor && (
+            <div className="flex justify-center mt-12">
+              <Button
+                onClick={() => fetchCampaigns(nextCursor)}
+                disabled={loadingMore}
+                className="bg-gradient-to-r from-purple-600 to-blue-600 hover:from-purple-700 hover:to-blue-700 text-white px-8 py-4 rounded-xl shadow-lg shadow-purple-500/25 transition-all hover:shadow-purple-500/40 hover:scale-105"
+              >
+                {loadingMore ? "Loading..." : "Load More Campaigns"}
+              </Button>
+            </div>
+          )}
         </div>
       </div>
 
@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
 import { useParams, useNavigate } from "react-router-dom"
 import { Calendar, Users, Target, Clock, ArrowLeft, Heart } from "lucide-react"
 import { Button } from "@/components/ui/button"
@@ -19,6 +19,8 @@ export default function CampaignDetails() {
   const [error, setError] = useState(null)
   const [donationAmount, setDonationAmount] = useState("")
   const [isFollowed, setIsFollowed] = useState(false);
+  // reused when a donation is retried after a network error so the server does not charge twice
+  const donationKey = useRef(null)
 
   useEffect(() => {
     const fetchCampaign = async () => {
@@ -75,16 +77,22 @@ export default function CampaignDetails() {
       amount: amount,
     };
 
+    if (!donationKey.current || donationKey.current.amount !== amount) {
+      donationKey.current = { key: crypto.randomUUID(), amount };
+    }
+
     try {
       const response = await fetch(`${backendUrl}/donations`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Idempotency-Key': donationKey.current.key,
         },
         body: JSON.stringify(donationData),
       });
 
       const data = await response.json();
+      donationKey.current = null;
 
       if (!response.ok) {
         navigate('/cancel')
@@ -106,6 +114,18 @@ export default function CampaignDetails() {
   };
 
   const user = getUser();
+
+  useEffect(() => {
+    if (!user || !id) return;
+    const backendUrl = import.meta.env.VITE_BACKEND_URL;
+    fetch(`${backendUrl}/follows/following-status/${user.user_id}?campaign_ids=${id}`)
+      .then((res) => res.json())
+      .then((data) => {
+        if (data.success) setIsFollowed(Boolean(data.following[id]));
+      })
+      .catch((err) => console.error("Error fetching follow status:", err));
+  }, [id, user?.user_id]);
+
   const handleFollowButton = async (e) => {
     if (!user) {
       toast({